@@ -0,0 +1,31 @@
+"""hitl pending priority index
+
+Revision ID: 002_hitl_pending_priority_index
+Revises: 001_initial_migration
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+revision = '002_hitl_pending_priority_index'
+down_revision = '001_initial_migration'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        DO $$
+        BEGIN
+            IF to_regclass('public.hitl_approvals') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS idx_hitl_approvals_pending_priority
+                ON hitl_approvals (project_id, impact_score DESC NULLS LAST, created_at, id)
+                WHERE status = 'PENDING';
+            END IF;
+        END
+        $$;
+    """)
+
+
+def downgrade():
+    op.execute('DROP INDEX IF EXISTS idx_hitl_approvals_pending_priority')
@@ -0,0 +1,30 @@
+"""tasks project priority index
+
+Revision ID: 003_tasks_project_priority_index
+Revises: 002_hitl_pending_priority_index
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+
+revision = '003_tasks_project_priority_index'
+down_revision = '002_hitl_pending_priority_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        DO $$
+        BEGIN
+            IF to_regclass('public.tasks') IS NOT NULL THEN
+                CREATE INDEX IF NOT EXISTS idx_tasks_project_priority
+                ON tasks (project_id, status, priority_score DESC, created_at);
+            END IF;
+        END
+        $$;
+    """)
+
+
+def downgrade():
+    op.execute('DROP INDEX IF EXISTS idx_tasks_project_priority')
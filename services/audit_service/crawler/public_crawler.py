@@ -44,8 +44,7 @@ def _same_site(root: str, candidate: str) -> bool:
     return (r.domain, r.suffix) == (c.domain, c.suffix)
 
 
-def _extract_basic(html: str) -> tuple[str | None, str | None, str | None, list[str]]:
-    soup = BeautifulSoup(html, "lxml")
+def _extract_basic(soup: BeautifulSoup) -> tuple[str | None, str | None, str | None, list[str]]:
     title = soup.title.text.strip() if soup.title and soup.title.text else None
     desc = None
     m = soup.find("meta", attrs={"name": re.compile(r"^description$", re.I)})
@@ -63,10 +62,9 @@ def _extract_basic(html: str) -> tuple[str | None, str | None, str | None, list[
     return title, desc, h1, links
 
 
-async def fetch_html_httpx(url: str, timeout_s: float, headers: dict[str, str]) -> tuple[int | None, str | None, str | None, str | None]:
-    async with httpx.AsyncClient(follow_redirects=True, headers=headers, timeout=timeout_s) as client:
-        r = await client.get(url)
-        return r.status_code, str(r.url), r.text, None
+async def fetch_html_httpx(client: httpx.AsyncClient, url: str, timeout_s: float, headers: dict[str, str]) -> tuple[int | None, str | None, str | None, str | None]:
+    r = await client.get(url, headers=headers, timeout=timeout_s, follow_redirects=True)
+    return r.status_code, str(r.url), r.text, None
 
 
 async def fetch_html_playwright(url: str, timeout_ms: int, user_agent: str) -> tuple[int | None, str | None, str | None, str | None]:
@@ -88,7 +86,14 @@ async def fetch_html_playwright(url: str, timeout_ms: int, user_agent: str) -> t
             return None, None, None, str(e)
 
 
-async def crawl_public(root_url: str, max_pages: int = 10, js_render: bool = False, timeout_s: float = 10.0, respect_robots: bool = True) -> dict:
+async def crawl_public(root_url: str, max_pages: int = 10, js_render: bool = False, timeout_s: float = 10.0, respect_robots: bool = True, client: httpx.AsyncClient | None = None) -> dict:
+    if client is not None or js_render:
+        return await _crawl(root_url, max_pages, js_render, timeout_s, client)
+    async with httpx.AsyncClient(follow_redirects=True, timeout=timeout_s) as own_client:
+        return await _crawl(root_url, max_pages, js_render, timeout_s, own_client)
+
+
+async def _crawl(root_url: str, max_pages: int, js_render: bool, timeout_s: float, client: httpx.AsyncClient | None) -> dict:
     headers = {"User-Agent": settings.user_agent}
     visited: set[str] = set()
     queue: list[str] = [root_url]
@@ -112,7 +117,7 @@ async def crawl_public(root_url: str, max_pages: int = 10, js_render: bool = Fal
             if js_render:
                 status, final_url, html, err = await fetch_html_playwright(url, timeout_ms=int(timeout_s * 1000), user_agent=settings.user_agent)
             else:
-                status, final_url, html, err = await fetch_html_httpx(url, timeout_s=timeout_s, headers=headers)
+                status, final_url, html, err = await fetch_html_httpx(client, url, timeout_s=timeout_s, headers=headers)
         except httpx.TimeoutException:
             timeout_count += 1
             pages.append(CrawledPage(url=url, status_code=None, final_url=None, html=None, title=None, description=None, h1=None, links=[], error="timeout"))
@@ -138,9 +143,9 @@ async def crawl_public(root_url: str, max_pages: int = 10, js_render: bool = Fal
         raw_links: list[str] = []
         links: list[str] = []
         if html:
-            title, desc, h1, raw_links = _extract_basic(html)
+            soup = BeautifulSoup(html, "lxml")
+            title, desc, h1, raw_links = _extract_basic(soup)
             if title is None and desc is None and h1 is None:
-                soup = BeautifulSoup(html, "lxml")
                 body_text = soup.get_text(" ", strip=True)
                 if len(body_text) < 30:
                     spa_detected = True
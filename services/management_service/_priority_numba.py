@@ -0,0 +1,69 @@
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+URGENCY_CRITICAL = 0
+URGENCY_HIGH = 1
+URGENCY_MEDIUM = 2
+URGENCY_LOW = 3
+
+FFSCORE_WEIGHT = 0.7
+EEAT_WEIGHT = 0.3
+
+
+# No fastmath: it lets LLVM assume NaN never occurs, and NaN marks a
+# missing score here
+@njit(cache=True)
+def combined_score(ffscore, eeat):
+    if math.isnan(ffscore):
+        if math.isnan(eeat):
+            return 50.0
+        return eeat
+    if math.isnan(eeat):
+        return ffscore
+    return (ffscore * FFSCORE_WEIGHT + eeat * EEAT_WEIGHT) / (FFSCORE_WEIGHT + EEAT_WEIGHT)
+
+
+@njit(cache=True)
+def kernel(ff_c, ff_e, ee_c, ee_e, effort_val, wi, wu, we):
+    current_combined = combined_score(ff_c, ee_c)
+    expected_combined = combined_score(ff_e, ee_e)
+
+    impact = min(max((expected_combined - current_combined) / 100.0, 0.0), 1.0)
+
+    if current_combined < 30:
+        urgency = 1.0
+        urgency_level = URGENCY_CRITICAL
+    elif current_combined < 50:
+        urgency = 0.8
+        urgency_level = URGENCY_HIGH
+    elif current_combined < 70:
+        urgency = 0.6
+        urgency_level = URGENCY_MEDIUM
+    elif current_combined < 85:
+        urgency = 0.4
+        urgency_level = URGENCY_LOW
+    else:
+        urgency = 0.2
+        urgency_level = URGENCY_LOW
+
+    effort_inverse = 1.0 / effort_val if effort_val > 0 else 1.0
+    effort_normalized = min(effort_inverse / 5.0, 1.0)
+
+    priority = impact * wi + urgency * wu + effort_normalized * we
+
+    return priority, impact, urgency, urgency_level, effort_val
+
+
+# Compile (or load from cache) once at import rather than on the first task
+kernel(40.0, 70.0, math.nan, math.nan, 0.2, 0.6, 0.3, 0.1)
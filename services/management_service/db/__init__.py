@@ -1,30 +1,30 @@
-from services.management_service.db.models import (
-    Base,
-    Task,
-    TaskType,
-    TaskStatus,
-    HITLApproval,
-    Changelog,
-    Project
-)
-
-from services.management_service.db.session import (
-    engine,
-    SessionLocal,
-    get_db,
-    init_db
-)
-
-__all__ = [
-    "Base",
-    "Task",
-    "TaskType",
-    "TaskStatus",
-    "HITLApproval",
-    "Changelog",
-    "Project",
-    "engine",
-    "SessionLocal",
-    "get_db",
-    "init_db"
-]
+from services.management_service.db.models import (
+    Base,
+    Task,
+    TaskType,
+    TaskStatus,
+    HITLApproval,
+    Changelog,
+    Project
+)
+
+from services.management_service.db.session import (
+    engine,
+    SessionLocal,
+    get_db,
+    init_db
+)
+
+__all__ = [
+    "Base",
+    "Task",
+    "TaskType",
+    "TaskStatus",
+    "HITLApproval",
+    "Changelog",
+    "Project",
+    "engine",
+    "SessionLocal",
+    "get_db",
+    "init_db"
+]
@@ -1,86 +1,86 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
-from typing import Generator
-
-from services.management_service.config import settings
-from config.loggingconfig import get_logger
-
-logger = get_logger(__name__)
-
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=20,
-    max_overflow=40,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=settings.ENVIRONMENT == "development",
-    connect_args={
-        "connect_timeout": 10,
-        "options": "-c timezone=utc"
-    }
-)
-
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
-)
-
-
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
-        yield db
-    except Exception as e:
-        logger.error(f"Database session error: {e}")
-        db.rollback()
-        raise
-    finally:
-        db.close()
-
-
-def init_db():
-    from services.management_service.db.models import Base
-    
-    try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
-    except Exception as e:
-        logger.error(f"Failed to create database tables: {e}")
-        raise
-
-
-def drop_db():
-    from services.management_service.db.models import Base
-    
-    try:
-        Base.metadata.drop_all(bind=engine)
-        logger.warning("Database tables dropped")
-    except Exception as e:
-        logger.error(f"Failed to drop database tables: {e}")
-        raise
-
-
-def reset_db():
-    drop_db()
-    init_db()
-    logger.info("Database reset completed")
-
-
-def get_db_health() -> dict:
-    try:
-        with engine.connect() as connection:
-            connection.execute("SELECT 1")
-        return {
-            "status": "healthy",
-            "database": "connected"
-        }
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        return {
-            "status": "unhealthy",
-            "database": "disconnected",
-            "error": str(e)
-        }
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
+from typing import Generator
+
+from services.management_service.config import settings
+from config.loggingconfig import get_logger
+
+logger = get_logger(__name__)
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    poolclass=QueuePool,
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    echo=settings.ENVIRONMENT == "development",
+    connect_args={
+        "connect_timeout": 10,
+        "options": "-c timezone=utc"
+    }
+)
+
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine
+)
+
+
+def get_db() -> Generator[Session, None, None]:
+    db = SessionLocal()
+    try:
+        yield db
+    except Exception as e:
+        logger.error(f"Database session error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def init_db():
+    from services.management_service.db.models import Base
+    
+    try:
+        Base.metadata.create_all(bind=engine)
+        logger.info("Database tables created successfully")
+    except Exception as e:
+        logger.error(f"Failed to create database tables: {e}")
+        raise
+
+
+def drop_db():
+    from services.management_service.db.models import Base
+    
+    try:
+        Base.metadata.drop_all(bind=engine)
+        logger.warning("Database tables dropped")
+    except Exception as e:
+        logger.error(f"Failed to drop database tables: {e}")
+        raise
+
+
+def reset_db():
+    drop_db()
+    init_db()
+    logger.info("Database reset completed")
+
+
+def get_db_health() -> dict:
+    try:
+        with engine.connect() as connection:
+            connection.execute("SELECT 1")
+        return {
+            "status": "healthy",
+            "database": "connected"
+        }
+    except Exception as e:
+        logger.error(f"Database health check failed: {e}")
+        return {
+            "status": "unhealthy",
+            "database": "disconnected",
+            "error": str(e)
+        }
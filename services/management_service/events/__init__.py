@@ -2,12 +2,14 @@
     TaskCreatedEvent,
     TaskCreatedPayload,
     publish_task_created_event,
+    publish_task_created_events_batch,
 )
 
 from services.management_service.events.hitl_approved import (
     HITLApprovedEvent,
     HITLApprovedPayload,
     publish_hitl_approved_event,
+    publish_hitl_approved_events_batch,
 )
 
 from services.management_service.events.crawl_completed_handler import (
@@ -22,9 +24,11 @@ __all__ = [
     "TaskCreatedEvent",
     "TaskCreatedPayload",
     "publish_task_created_event",
+    "publish_task_created_events_batch",
     "HITLApprovedEvent",
     "HITLApprovedPayload",
     "publish_hitl_approved_event",
+    "publish_hitl_approved_events_batch",
     "handle_crawl_completed_event",
     "handle_ff_score_recalculated_event",
-]
+]
@@ -0,0 +1,43 @@
+import asyncio
+from typing import List, Optional
+
+import aio_pika
+
+from services.management_service.config import settings
+
+EXCHANGE_NAME = "seo_master.events"
+
+
+def build_message(
+    event,
+    correlation_id: Optional[str] = None,
+) -> aio_pika.Message:
+    headers = {
+        "event_type": event.event_name,
+        "event_id": event.event_id,
+    }
+    if correlation_id:
+        headers["correlation_id"] = correlation_id
+
+    return aio_pika.Message(
+        body=event.to_bytes(),
+        content_type="application/json",
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        headers=headers,
+    )
+
+
+async def publish_messages(messages: List[aio_pika.Message], routing_key: str) -> None:
+    conn = await aio_pika.connect_robust(settings.rabbitmq_url)
+    async with conn:
+        ch = await conn.channel()
+        ex = await ch.declare_exchange(
+            EXCHANGE_NAME,
+            aio_pika.ExchangeType.TOPIC,
+            durable=True,
+        )
+        # The channel runs in publisher-confirm mode; publishing
+        # concurrently waits for all confirms in one round of RTTs.
+        await asyncio.gather(
+            *(ex.publish(msg, routing_key=routing_key) for msg in messages)
+        )
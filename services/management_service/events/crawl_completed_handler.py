@@ -4,6 +4,7 @@ from typing import Any, Dict, Optional
 from sqlalchemy.orm import Session
 
 from services.management_service.db.models import Task, Project
+from services.management_service.saga_signals import publish_saga_signal
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -64,6 +65,8 @@ def handle_crawl_completed_event(
     if updated_tasks or updated_project:
         db.commit()
 
+    publish_saga_signal(correlation_id, "crawl")
+
     logger.info(
         "CrawlCompleted event handled",
         extra={
@@ -83,4 +86,4 @@ def handle_crawl_completed_event(
         "audit_id": audit_id,
         "updated_tasks": updated_tasks,
         "updated_project": updated_project,
-    }
+    }
@@ -4,6 +4,7 @@ from typing import Any, Dict, Optional
 from sqlalchemy.orm import Session
 
 from services.management_service.db.models import Task, Project
+from services.management_service.saga_signals import publish_saga_signal
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -63,6 +64,8 @@ def handle_ff_score_recalculated_event(
     if updated_tasks or updated_project:
         db.commit()
 
+    publish_saga_signal(correlation_id, "scores")
+
     logger.info(
         "FFScoreRecalculated event handled",
         extra={
@@ -81,4 +84,4 @@ def handle_ff_score_recalculated_event(
         "eeat_score": eeat_score,
         "updated_tasks": updated_tasks,
         "updated_project": updated_project,
-    }
+    }
@@ -1,17 +1,16 @@
 ﻿import json
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-import aio_pika
 from pydantic import BaseModel, Field
 
 from services.management_service.config import settings
+from services.management_service.events._publishing import build_message, publish_messages
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-EXCHANGE_NAME = "seo_master.events"
 ROUTING_KEY = "management.task.created"
 
 
@@ -82,32 +81,46 @@ async def publish_task_created_event(
         correlation_id=correlation_id,
     )
 
-    headers = {
-        "event_type": event.event_name,
-        "event_id": event.event_id,
-    }
-    if correlation_id:
-        headers["correlation_id"] = correlation_id
-
     try:
-        conn = await aio_pika.connect_robust(settings.rabbitmq_url)
-        async with conn:
-            ch = await conn.channel()
-            ex = await ch.declare_exchange(
-                EXCHANGE_NAME,
-                aio_pika.ExchangeType.TOPIC,
-                durable=True,
-            )
-            msg = aio_pika.Message(
-                body=event.to_bytes(),
-                content_type="application/json",
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                headers=headers,
-            )
-            await ex.publish(msg, routing_key=ROUTING_KEY)
+        await publish_messages([build_message(event, correlation_id)], ROUTING_KEY)
     except Exception as exc:
         logger.error(
             f"Failed to publish TaskCreated event: {exc}",
             extra={"task_id": task_id, "correlation_id": correlation_id},
         )
-        raise
+        raise
+
+
+async def publish_task_created_events_batch(
+    db,
+    payloads: List[Dict[str, Any]],
+    correlation_id: Optional[str] = None,
+) -> None:
+    del db
+
+    if not settings.rabbitmq_url or not payloads:
+        return
+
+    messages = []
+    for payload in payloads:
+        task_type = payload["task_type"]
+        event_correlation_id = payload.get("correlation_id") or correlation_id
+        event = TaskCreatedEvent.build(
+            task_id=payload["task_id"],
+            project_id=payload["project_id"],
+            task_type=task_type.value if hasattr(task_type, "value") else str(task_type),
+            url=payload["url"],
+            metadata=payload.get("metadata"),
+            correlation_id=event_correlation_id,
+        )
+        messages.append(build_message(event, event_correlation_id))
+
+    try:
+        await publish_messages(messages, ROUTING_KEY)
+    except Exception as exc:
+        logger.error(
+            f"Failed to publish TaskCreated event batch: {exc}",
+            extra={"events": len(messages), "correlation_id": correlation_id},
+        )
+        raise
+
@@ -1,562 +1,791 @@
-# services/management_service/hitl_handler.py (ДОПОЛНЕННАЯ ВЕРСИЯ)
-
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-from sqlalchemy.orm import Session
-
-from services.management_service.db.models import (
-    Task,
-    TaskStatus,
-    HITLApproval,
-    HITLStatus,
-    Project
-)
-from services.management_service.schemas.hitl import (
-    HITLApprovalCreate,
-    HITLDecision,
-    HITLBatchApproveRequest,
-    HITLBatchApproveResponse
-)
-from services.management_service.client_api_adapter import deploy_task_changes
-from services.management_service.events.hitl_approved import publish_hitl_approved_event
-from config.loggingconfig import get_logger
-from prometheus_client import Counter, Histogram
-
-logger = get_logger(__name__)
-
-hitl_approvals_total = Counter(
-    'hitl_approvals_total',
-    'Total HITL approvals processed',
-    ['status']
-)
-
-hitl_processing_duration = Histogram(
-    'hitl_processing_duration_seconds',
-    'Duration of HITL approval processing'
-)
-
-hitl_errors_total = Counter(
-    'hitl_errors_total',
-    'Total HITL processing errors',
-    ['error_type']
-)
-
-
-class HITLHandler:
-    
-    def __init__(self, db: Session):
-        self.db = db
-    
-    def create_hitl_approval(
-        self,
-        task_id: str,
-        approval_data: HITLApprovalCreate,
-        correlation_id: Optional[str] = None
-    ) -> HITLApproval:
-        
-        task = self.db.query(Task).filter(Task.id == task_id).first()
-        
-        if not task:
-            raise ValueError(f"Task {task_id} not found")
-        
-        existing_approval = self.db.query(HITLApproval).filter(
-            HITLApproval.task_id == task_id
-        ).first()
-        
-        if existing_approval:
-            raise ValueError(f"HITL approval already exists for task {task_id}")
-        
-        hitl_approval = HITLApproval(
-            task_id=task_id,
-            project_id=task.project_id,
-            status=HITLStatus.PENDING,
-            diff_data=approval_data.diff_data,
-            impact_score=approval_data.impact_score,
-            recommendation=approval_data.recommendation,
-            metadata={
-                "correlation_id": correlation_id,
-                "created_by": "management_service"
-            }
-        )
-        
-        task.status = TaskStatus.PENDING
-        
-        self.db.add(hitl_approval)
-        self.db.add(task)
-        self.db.commit()
-        self.db.refresh(hitl_approval)
-        
-        logger.info(
-            f"Created HITL approval for task {task_id}",
-            extra={
-                "task_id": task_id,
-                "project_id": task.project_id,
-                "impact_score": approval_data.impact_score,
-                "correlation_id": correlation_id
-            }
-        )
-        
-        return hitl_approval
-    
-    async def approve_task(
-        self,
-        task_id: str,
-        approved_by: str,
-        decision: HITLDecision,
-        correlation_id: Optional[str] = None
-    ) -> Dict[str, Any]:
-        
-        with hitl_processing_duration.time():
-            task = self.db.query(Task).filter(Task.id == task_id).first()
-            
-            if not task:
-                hitl_errors_total.labels(error_type='task_not_found').inc()
-                raise ValueError(f"Task {task_id} not found")
-            
-            hitl_approval = self.db.query(HITLApproval).filter(
-                HITLApproval.task_id == task_id
-            ).first()
-            
-            if not hitl_approval:
-                hitl_errors_total.labels(error_type='approval_not_found').inc()
-                raise ValueError(f"HITL approval not found for task {task_id}")
-            
-            if hitl_approval.status != HITLStatus.PENDING:
-                hitl_errors_total.labels(error_type='already_processed').inc()
-                raise ValueError(f"HITL approval already processed with status {hitl_approval.status.value}")
-            
-            hitl_approval.status = HITLStatus.APPROVED
-            hitl_approval.approved_by = approved_by
-            hitl_approval.approved_at = datetime.utcnow()
-            
-            if decision.notes:
-                hitl_approval.metadata = {
-                    **(hitl_approval.metadata or {}),
-                    "approval_notes": decision.notes
-                }
-            
-            task.status = TaskStatus.APPROVED
-            task.metadata = {
-                **(task.metadata or {}),
-                "approved_by": approved_by,
-                "approved_at": datetime.utcnow().isoformat()
-            }
-            
-            self.db.add(hitl_approval)
-            self.db.add(task)
-            self.db.commit()
-            
-            hitl_approvals_total.labels(status='approved').inc()
-            
-            logger.info(
-                f"Task {task_id} approved by {approved_by}",
-                extra={
-                    "task_id": task_id,
-                    "project_id": task.project_id,
-                    "approved_by": approved_by,
-                    "correlation_id": correlation_id
-                }
-            )
-            
-            deployment_result = None
-            
-            if decision.auto_deploy:
-                try:
-                    deployment_result = await deploy_task_changes(
-                        self.db,
-                        task,
-                        correlation_id
-                    )
-                    
-                    logger.info(
-                        f"Task {task_id} automatically deployed after approval",
-                        extra={
-                            "task_id": task_id,
-                            "correlation_id": correlation_id
-                        }
-                    )
-                    
-                except Exception as e:
-                    logger.error(
-                        f"Failed to auto-deploy task {task_id}: {e}",
-                        extra={
-                            "task_id": task_id,
-                            "correlation_id": correlation_id
-                        }
-                    )
-                    hitl_errors_total.labels(error_type='deployment_failed').inc()
-            
-            try:
-                await publish_hitl_approved_event(
-                    db=self.db,
-                    task_id=str(task.id),
-                    project_id=str(task.project_id),
-                    approved_by=approved_by,
-                    auto_deployed=decision.auto_deploy,
-                    correlation_id=correlation_id
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to publish HITLApproved event: {e}",
-                    extra={"task_id": task_id, "correlation_id": correlation_id}
-                )
-            
-            return {
-                "task_id": str(task.id),
-                "status": "approved",
-                "approved_by": approved_by,
-                "approved_at": hitl_approval.approved_at.isoformat(),
-                "auto_deployed": decision.auto_deploy,
-                "deployment_result": deployment_result
-            }
-    
-    def reject_task(
-        self,
-        task_id: str,
-        rejected_by: str,
-        decision: HITLDecision,
-        correlation_id: Optional[str] = None
-    ) -> Dict[str, Any]:
-        
-        task = self.db.query(Task).filter(Task.id == task_id).first()
-        
-        if not task:
-            hitl_errors_total.labels(error_type='task_not_found').inc()
-            raise ValueError(f"Task {task_id} not found")
-        
-        hitl_approval = self.db.query(HITLApproval).filter(
-            HITLApproval.task_id == task_id
-        ).first()
-        
-        if not hitl_approval:
-            hitl_errors_total.labels(error_type='approval_not_found').inc()
-            raise ValueError(f"HITL approval not found for task {task_id}")
-        
-        if hitl_approval.status != HITLStatus.PENDING:
-            hitl_errors_total.labels(error_type='already_processed').inc()
-            raise ValueError(f"HITL approval already processed with status {hitl_approval.status.value}")
-        
-        hitl_approval.status = HITLStatus.REJECTED
-        hitl_approval.rejected_by = rejected_by
-        hitl_approval.rejected_at = datetime.utcnow()
-        hitl_approval.rejection_reason = decision.rejection_reason or "No reason provided"
-        
-        if decision.notes:
-            hitl_approval.metadata = {
-                **(hitl_approval.metadata or {}),
-                "rejection_notes": decision.notes
-            }
-        
-        task.status = TaskStatus.REJECTED
-        task.metadata = {
-            **(task.metadata or {}),
-            "rejected_by": rejected_by,
-            "rejected_at": datetime.utcnow().isoformat(),
-            "rejection_reason": decision.rejection_reason
-        }
-        
-        self.db.add(hitl_approval)
-        self.db.add(task)
-        self.db.commit()
-        
-        hitl_approvals_total.labels(status='rejected').inc()
-        
-        logger.info(
-            f"Task {task_id} rejected by {rejected_by}",
-            extra={
-                "task_id": task_id,
-                "project_id": task.project_id,
-                "rejected_by": rejected_by,
-                "reason": decision.rejection_reason,
-                "correlation_id": correlation_id
-            }
-        )
-        
-        return {
-            "task_id": str(task.id),
-            "status": "rejected",
-            "rejected_by": rejected_by,
-            "rejected_at": hitl_approval.rejected_at.isoformat(),
-            "rejection_reason": decision.rejection_reason
-        }
-    
-    async def batch_approve_tasks(
-        self,
-        task_ids: List[str],
-        approved_by: str,
-        auto_deploy: bool = True,
-        correlation_id: Optional[str] = None
-    ) -> HITLBatchApproveResponse:
-        
-        results = []
-        approved_count = 0
-        failed_count = 0
-        
-        for task_id in task_ids:
-            try:
-                decision = HITLDecision(auto_deploy=auto_deploy)
-                
-                result = await self.approve_task(
-                    task_id=task_id,
-                    approved_by=approved_by,
-                    decision=decision,
-                    correlation_id=correlation_id
-                )
-                
-                results.append({
-                    "task_id": task_id,
-                    "success": True,
-                    "result": result
-                })
-                approved_count += 1
-                
-            except Exception as e:
-                results.append({
-                    "task_id": task_id,
-                    "success": False,
-                    "error": str(e)
-                })
-                failed_count += 1
-                
-                logger.error(
-                    f"Failed to approve task {task_id} in batch: {e}",
-                    extra={
-                        "task_id": task_id,
-                        "correlation_id": correlation_id
-                    }
-                )
-        
-        logger.info(
-            f"Batch approval completed: {approved_count} approved, {failed_count} failed",
-            extra={
-                "total": len(task_ids),
-                "approved": approved_count,
-                "failed": failed_count,
-                "correlation_id": correlation_id
-            }
-        )
-        
-        return HITLBatchApproveResponse(
-            total=len(task_ids),
-            approved=approved_count,
-            failed=failed_count,
-            results=results
-        )
-    
-    def get_pending_approvals(
-        self,
-        project_id: Optional[str] = None,
-        limit: int = 50,
-        offset: int = 0
-    ) -> List[HITLApproval]:
-        
-        query = self.db.query(HITLApproval).filter(
-            HITLApproval.status == HITLStatus.PENDING
-        )
-        
-        if project_id:
-            query = query.filter(HITLApproval.project_id == project_id)
-        
-        approvals = query.order_by(
-            HITLApproval.impact_score.desc().nullslast(),
-            HITLApproval.created_at.asc()
-        ).offset(offset).limit(limit).all()
-        
-        return approvals
-    
-    def get_approval_by_task_id(self, task_id: str) -> Optional[HITLApproval]:
-        
-        return self.db.query(HITLApproval).filter(
-            HITLApproval.task_id == task_id
-        ).first()
-    
-    def get_approval_with_task(self, task_id: str) -> Optional[Dict[str, Any]]:
-        
-        hitl_approval = self.db.query(HITLApproval).filter(
-            HITLApproval.task_id == task_id
-        ).first()
-        
-        if not hitl_approval:
-            return None
-        
-        task = self.db.query(Task).filter(Task.id == task_id).first()
-        
-        return {
-            "approval": hitl_approval,
-            "task": task
-        }
-    
-    def get_approval_statistics(self, project_id: str) -> Dict[str, Any]:
-        
-        total = self.db.query(HITLApproval).filter(
-            HITLApproval.project_id == project_id
-        ).count()
-        
-        pending = self.db.query(HITLApproval).filter(
-            HITLApproval.project_id == project_id,
-            HITLApproval.status == HITLStatus.PENDING
-        ).count()
-        
-        approved = self.db.query(HITLApproval).filter(
-            HITLApproval.project_id == project_id,
-            HITLApproval.status == HITLStatus.APPROVED
-        ).count()
-        
-        rejected = self.db.query(HITLApproval).filter(
-            HITLApproval.project_id == project_id,
-            HITLApproval.status == HITLStatus.REJECTED
-        ).count()
-        
-        return {
-            "project_id": project_id,
-            "total": total,
-            "pending": pending,
-            "approved": approved,
-            "rejected": rejected,
-            "approval_rate": round(approved / total * 100, 2) if total > 0 else 0
-        }
-    
-    def get_pending_count(self, project_id: Optional[str] = None) -> int:
-        
-        query = self.db.query(HITLApproval).filter(
-            HITLApproval.status == HITLStatus.PENDING
-        )
-        
-        if project_id:
-            query = query.filter(HITLApproval.project_id == project_id)
-        
-        return query.count()
-    
-    def get_high_impact_pending(
-        self,
-        project_id: Optional[str] = None,
-        min_impact_score: float = 0.7,
-        limit: int = 20
-    ) -> List[HITLApproval]:
-        
-        query = self.db.query(HITLApproval).filter(
-            HITLApproval.status == HITLStatus.PENDING,
-            HITLApproval.impact_score >= min_impact_score
-        )
-        
-        if project_id:
-            query = query.filter(HITLApproval.project_id == project_id)
-        
-        approvals = query.order_by(
-            HITLApproval.impact_score.desc()
-        ).limit(limit).all()
-        
-        return approvals
-
-
-async def handle_hitl_approved_event(
-    db: Session,
-    event: Dict[str, Any],
-    correlation_id: Optional[str] = None
-) -> Dict[str, Any]:
-    
-    payload = event.get("payload", {})
-    task_id = payload.get("task_id")
-    approved_by = payload.get("approved_by")
-    auto_deploy = payload.get("auto_deploy", True)
-    notes = payload.get("notes")
-    
-    if not task_id:
-        raise ValueError("task_id is required in event payload")
-    
-    if not approved_by:
-        raise ValueError("approved_by is required in event payload")
-    
-    handler = HITLHandler(db)
-    
-    decision = HITLDecision(
-        auto_deploy=auto_deploy,
-        notes=notes
-    )
-    
-    result = await handler.approve_task(
-        task_id=task_id,
-        approved_by=approved_by,
-        decision=decision,
-        correlation_id=correlation_id
-    )
-    
-    logger.info(
-        f"HITLApproved event processed for task {task_id}",
-        extra={
-            "task_id": task_id,
-            "approved_by": approved_by,
-            "correlation_id": correlation_id
-        }
-    )
-    
-    return result
-
-
-def handle_hitl_rejected_event(
-    db: Session,
-    event: Dict[str, Any],
-    correlation_id: Optional[str] = None
-) -> Dict[str, Any]:
-    
-    payload = event.get("payload", {})
-    task_id = payload.get("task_id")
-    rejected_by = payload.get("rejected_by")
-    rejection_reason = payload.get("rejection_reason")
-    notes = payload.get("notes")
-    
-    if not task_id:
-        raise ValueError("task_id is required in event payload")
-    
-    if not rejected_by:
-        raise ValueError("rejected_by is required in event payload")
-    
-    handler = HITLHandler(db)
-    
-    decision = HITLDecision(
-        rejection_reason=rejection_reason,
-        notes=notes
-    )
-    
-    result = handler.reject_task(
-        task_id=task_id,
-        rejected_by=rejected_by,
-        decision=decision,
-        correlation_id=correlation_id
-    )
-    
-    logger.info(
-        f"HITLRejected event processed for task {task_id}",
-        extra={
-            "task_id": task_id,
-            "rejected_by": rejected_by,
-            "correlation_id": correlation_id
-        }
-    )
-    
-    return result
-
-
-def create_hitl_approval_for_task(
-    db: Session,
-    task: Task,
-    diff_data: Dict[str, Any],
-    impact_score: Optional[float] = None,
-    recommendation: Optional[str] = None,
-    correlation_id: Optional[str] = None
-) -> HITLApproval:
-    
-    handler = HITLHandler(db)
-    
-    approval_data = HITLApprovalCreate(
-        task_id=task.id,
-        diff_data=diff_data,
-        impact_score=impact_score or task.impact_score,
-        recommendation=recommendation
-    )
-    
-    return handler.create_hitl_approval(
-        task_id=str(task.id),
-        approval_data=approval_data,
-        correlation_id=correlation_id
-    )
+# services/management_service/hitl_handler.py (ДОПОЛНЕННАЯ ВЕРСИЯ)
+
+import asyncio
+import base64
+import threading
+import uuid
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime
+from sqlalchemy import and_, exists, or_, tuple_, update, func, literal
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.orm import Session, sessionmaker
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+import orjson
+
+from services.management_service.db.models import (
+    Task,
+    TaskStatus,
+    HITLApproval,
+    HITLStatus,
+    Project
+)
+from services.management_service.schemas.hitl import (
+    HITLApprovalCreate,
+    HITLDecision,
+    HITLBatchApproveRequest,
+    HITLBatchApproveResponse
+)
+from services.management_service.config import settings
+from services.management_service.client_api_adapter import deploy_task_changes
+from services.management_service.events.hitl_approved import (
+    publish_hitl_approved_event,
+    publish_hitl_approved_events_batch
+)
+from config.loggingconfig import get_logger
+from prometheus_client import Counter, Histogram
+
+logger = get_logger(__name__)
+
+hitl_approvals_total = Counter(
+    'hitl_approvals_total',
+    'Total HITL approvals processed',
+    ['status']
+)
+
+hitl_processing_duration = Histogram(
+    'hitl_processing_duration_seconds',
+    'Duration of HITL approval processing'
+)
+
+hitl_errors_total = Counter(
+    'hitl_errors_total',
+    'Total HITL processing errors',
+    ['error_type']
+)
+
+_approved_counter = hitl_approvals_total.labels(status='approved')
+_rejected_counter = hitl_approvals_total.labels(status='rejected')
+_err_task_not_found = hitl_errors_total.labels(error_type='task_not_found')
+_err_approval_not_found = hitl_errors_total.labels(error_type='approval_not_found')
+_err_already_processed = hitl_errors_total.labels(error_type='already_processed')
+_err_deployment_failed = hitl_errors_total.labels(error_type='deployment_failed')
+
+_cache_lock = threading.Lock()
+_pending_count_cache = TTLCache(maxsize=1024, ttl=settings.HITL_STATS_CACHE_TTL_SECONDS)
+_statistics_cache = TTLCache(maxsize=1024, ttl=settings.HITL_STATS_CACHE_TTL_SECONDS)
+
+
+def _project_cache_key(self, project_id: Optional[str] = None):
+    return hashkey(str(project_id) if project_id else None)
+
+
+def _invalidate_approval_caches(project_id: Optional[str]) -> None:
+    with _cache_lock:
+        _pending_count_cache.pop(hashkey(None), None)
+        if project_id:
+            key = hashkey(str(project_id))
+            _pending_count_cache.pop(key, None)
+            _statistics_cache.pop(key, None)
+
+
+def _encode_cursor(approval: HITLApproval) -> str:
+    raw = orjson.dumps([
+        approval.impact_score,
+        approval.created_at.isoformat(),
+        str(approval.id)
+    ])
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Optional[float], datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        score, created_at, approval_id = orjson.loads(raw)
+        return (
+            None if score is None else float(score),
+            datetime.fromisoformat(created_at),
+            uuid.UUID(approval_id)
+        )
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+
+def _jsonb_merge(column, patch: Dict[str, Any]):
+    return func.coalesce(column, literal({}, JSONB)).op("||")(literal(patch, JSONB))
+
+
+class HITLHandler:
+    
+    def __init__(self, db: Session, session_factory: Optional[sessionmaker] = None):
+        self.db = db
+        self.session_factory = session_factory
+    
+    def create_hitl_approval(
+        self,
+        task_id: str,
+        approval_data: HITLApprovalCreate,
+        correlation_id: Optional[str] = None
+    ) -> HITLApproval:
+        
+        task = self.db.query(Task).filter(Task.id == task_id).with_for_update().first()
+        
+        if not task:
+            raise ValueError(f"Task {task_id} not found")
+        
+        hitl_approval = self.db.scalars(
+            insert(HITLApproval)
+            .values(
+                task_id=task_id,
+                project_id=task.project_id,
+                status=HITLStatus.PENDING,
+                diff_data=approval_data.diff_data,
+                impact_score=approval_data.impact_score,
+                recommendation=approval_data.recommendation,
+                metadata={
+                    "correlation_id": correlation_id,
+                    "created_by": "management_service"
+                }
+            )
+            .on_conflict_do_nothing(index_elements=[HITLApproval.task_id])
+            .returning(HITLApproval)
+        ).first()
+        
+        if hitl_approval is None:
+            self.db.rollback()
+            raise ValueError(f"HITL approval already exists for task {task_id}")
+        
+        task.status = TaskStatus.PENDING
+        
+        self.db.add(task)
+        self.db.commit()
+        
+        _invalidate_approval_caches(task.project_id)
+        
+        logger.info(
+            f"Created HITL approval for task {task_id}",
+            extra={
+                "task_id": task_id,
+                "project_id": task.project_id,
+                "impact_score": approval_data.impact_score,
+                "correlation_id": correlation_id
+            }
+        )
+        
+        return hitl_approval
+    
+    def approve_task_sync(
+        self,
+        task_id: str,
+        approved_by: str,
+        decision: HITLDecision,
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        
+        with hitl_processing_duration.time():
+            return self._commit_approval(task_id, approved_by, decision, correlation_id)
+    
+    def _commit_approval(
+        self,
+        task_id: str,
+        approved_by: str,
+        decision: HITLDecision,
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        
+        now = datetime.utcnow()
+        
+        approval_values = {
+            "status": HITLStatus.APPROVED,
+            "approved_by": approved_by,
+            "approved_at": now
+        }
+        
+        if decision.notes:
+            approval_values["metadata"] = _jsonb_merge(
+                HITLApproval.metadata,
+                {"approval_notes": decision.notes}
+            )
+        
+        hitl_approval = self.db.execute(
+            update(HITLApproval)
+            .where(
+                HITLApproval.task_id == task_id,
+                HITLApproval.status == HITLStatus.PENDING
+            )
+            .values(**approval_values)
+            .returning(HITLApproval.id, HITLApproval.project_id, HITLApproval.approved_at)
+        ).first()
+        
+        if not hitl_approval:
+            self._raise_transition_error(task_id)
+        
+        task = self.db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(
+                status=TaskStatus.APPROVED,
+                metadata=_jsonb_merge(
+                    Task.metadata,
+                    {
+                        "approved_by": approved_by,
+                        "approved_at": now.isoformat()
+                    }
+                )
+            )
+            .returning(Task.id, Task.project_id)
+        ).first()
+        
+        self.db.commit()
+        
+        _invalidate_approval_caches(task.project_id)
+        
+        _approved_counter.inc()
+        
+        logger.info(
+            f"Task {task_id} approved by {approved_by}",
+            extra={
+                "task_id": task_id,
+                "project_id": task.project_id,
+                "approved_by": approved_by,
+                "correlation_id": correlation_id
+            }
+        )
+        
+        return {
+            "task_id": str(task.id),
+            "project_id": str(task.project_id),
+            "status": "approved",
+            "approved_by": approved_by,
+            "approved_at": hitl_approval.approved_at.isoformat(),
+            "auto_deployed": decision.auto_deploy,
+            "deployment_result": None
+        }
+    
+    async def approve_task(
+        self,
+        task_id: str,
+        approved_by: str,
+        decision: HITLDecision,
+        correlation_id: Optional[str] = None,
+        publish_event: bool = True
+    ) -> Dict[str, Any]:
+        
+        with hitl_processing_duration.time():
+            result = await asyncio.to_thread(
+                self._commit_approval,
+                task_id,
+                approved_by,
+                decision,
+                correlation_id
+            )
+            
+            if decision.auto_deploy:
+                try:
+                    task = await asyncio.to_thread(
+                        lambda: self.db.query(Task).filter(Task.id == task_id).first()
+                    )
+                    result["deployment_result"] = await deploy_task_changes(
+                        self.db,
+                        task,
+                        correlation_id
+                    )
+                    
+                    logger.info(
+                        f"Task {task_id} automatically deployed after approval",
+                        extra={
+                            "task_id": task_id,
+                            "correlation_id": correlation_id
+                        }
+                    )
+                    
+                except Exception as e:
+                    logger.error(
+                        f"Failed to auto-deploy task {task_id}: {e}",
+                        extra={
+                            "task_id": task_id,
+                            "correlation_id": correlation_id
+                        }
+                    )
+                    _err_deployment_failed.inc()
+            
+            if publish_event:
+                try:
+                    await publish_hitl_approved_event(
+                        db=self.db,
+                        task_id=result["task_id"],
+                        project_id=result["project_id"],
+                        approved_by=approved_by,
+                        auto_deployed=decision.auto_deploy,
+                        correlation_id=correlation_id
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to publish HITLApproved event: {e}",
+                        extra={"task_id": task_id, "correlation_id": correlation_id}
+                    )
+            
+            return result
+    
+    def reject_task(
+        self,
+        task_id: str,
+        rejected_by: str,
+        decision: HITLDecision,
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        
+        now = datetime.utcnow()
+        
+        approval_values = {
+            "status": HITLStatus.REJECTED,
+            "rejected_by": rejected_by,
+            "rejected_at": now,
+            "rejection_reason": decision.rejection_reason or "No reason provided"
+        }
+        
+        if decision.notes:
+            approval_values["metadata"] = _jsonb_merge(
+                HITLApproval.metadata,
+                {"rejection_notes": decision.notes}
+            )
+        
+        hitl_approval = self.db.execute(
+            update(HITLApproval)
+            .where(
+                HITLApproval.task_id == task_id,
+                HITLApproval.status == HITLStatus.PENDING
+            )
+            .values(**approval_values)
+            .returning(HITLApproval.id, HITLApproval.project_id, HITLApproval.rejected_at)
+        ).first()
+        
+        if not hitl_approval:
+            self._raise_transition_error(task_id)
+        
+        task_metadata = {
+            "rejected_by": rejected_by,
+            "rejected_at": now.isoformat()
+        }
+        
+        if decision.rejection_reason:
+            task_metadata["rejection_reason"] = decision.rejection_reason
+        
+        task = self.db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(
+                status=TaskStatus.REJECTED,
+                metadata=_jsonb_merge(Task.metadata, task_metadata)
+            )
+            .returning(Task.id, Task.project_id)
+        ).first()
+        
+        self.db.commit()
+        
+        _invalidate_approval_caches(task.project_id)
+        
+        _rejected_counter.inc()
+        
+        logger.info(
+            f"Task {task_id} rejected by {rejected_by}",
+            extra={
+                "task_id": task_id,
+                "project_id": task.project_id,
+                "rejected_by": rejected_by,
+                "reason": decision.rejection_reason,
+                "correlation_id": correlation_id
+            }
+        )
+        
+        return {
+            "task_id": str(task.id),
+            "status": "rejected",
+            "rejected_by": rejected_by,
+            "rejected_at": hitl_approval.rejected_at.isoformat(),
+            "rejection_reason": decision.rejection_reason
+        }
+    
+    def _raise_transition_error(self, task_id: str) -> None:
+        
+        if not self.db.query(exists().where(Task.id == task_id)).scalar():
+            _err_task_not_found.inc()
+            raise ValueError(f"Task {task_id} not found")
+        
+        approval_status = self.db.query(HITLApproval.status).filter(
+            HITLApproval.task_id == task_id
+        ).scalar()
+        
+        if not approval_status:
+            _err_approval_not_found.inc()
+            raise ValueError(f"HITL approval not found for task {task_id}")
+        
+        _err_already_processed.inc()
+        raise ValueError(f"HITL approval already processed with status {approval_status.value}")
+    
+    async def batch_approve_tasks(
+        self,
+        task_ids: List[str],
+        approved_by: str,
+        auto_deploy: bool = True,
+        correlation_id: Optional[str] = None
+    ) -> HITLBatchApproveResponse:
+        
+        decision = HITLDecision(auto_deploy=auto_deploy)
+        
+        if self.session_factory is not None:
+            semaphore = asyncio.Semaphore(settings.HITL_BATCH_CONCURRENCY)
+            
+            async def _bounded(task_id: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._approve_one(task_id, approved_by, decision, correlation_id)
+            
+            results = await asyncio.gather(*[_bounded(task_id) for task_id in task_ids])
+        else:
+            results = [
+                await self._approve_one(task_id, approved_by, decision, correlation_id)
+                for task_id in task_ids
+            ]
+        
+        event_payloads = [
+            {
+                "task_id": item["result"]["task_id"],
+                "project_id": item["result"]["project_id"],
+                "approved_by": approved_by,
+                "approved_at": item["result"]["approved_at"],
+                "auto_deployed": auto_deploy
+            }
+            for item in results
+            if item["success"]
+        ]
+        
+        try:
+            await publish_hitl_approved_events_batch(
+                self.db,
+                event_payloads,
+                correlation_id
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to publish HITLApproved event batch: {e}",
+                extra={"events": len(event_payloads), "correlation_id": correlation_id}
+            )
+        
+        approved_count = len(event_payloads)
+        failed_count = len(results) - approved_count
+        
+        logger.info(
+            f"Batch approval completed: {approved_count} approved, {failed_count} failed",
+            extra={
+                "total": len(task_ids),
+                "approved": approved_count,
+                "failed": failed_count,
+                "correlation_id": correlation_id
+            }
+        )
+        
+        return HITLBatchApproveResponse(
+            total=len(task_ids),
+            approved=approved_count,
+            failed=failed_count,
+            results=results
+        )
+    
+    async def _approve_without_event(
+        self,
+        task_id: str,
+        approved_by: str,
+        decision: HITLDecision,
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        
+        if decision.auto_deploy:
+            return await self.approve_task(
+                task_id=task_id,
+                approved_by=approved_by,
+                decision=decision,
+                correlation_id=correlation_id,
+                publish_event=False
+            )
+        
+        return await asyncio.to_thread(
+            self.approve_task_sync,
+            task_id,
+            approved_by,
+            decision,
+            correlation_id
+        )
+    
+    async def _approve_one(
+        self,
+        task_id: str,
+        approved_by: str,
+        decision: HITLDecision,
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        
+        try:
+            if self.session_factory is not None:
+                with self.session_factory() as session:
+                    result = await HITLHandler(session)._approve_without_event(
+                        task_id,
+                        approved_by,
+                        decision,
+                        correlation_id
+                    )
+            else:
+                result = await self._approve_without_event(
+                    task_id,
+                    approved_by,
+                    decision,
+                    correlation_id
+                )
+            
+            return {
+                "task_id": task_id,
+                "success": True,
+                "result": result
+            }
+            
+        except Exception as e:
+            logger.error(
+                f"Failed to approve task {task_id} in batch: {e}",
+                extra={
+                    "task_id": task_id,
+                    "correlation_id": correlation_id
+                }
+            )
+            
+            return {
+                "task_id": task_id,
+                "success": False,
+                "error": str(e)
+            }
+    
+    def get_pending_approvals(
+        self,
+        project_id: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[str] = None
+    ) -> Tuple[List[HITLApproval], Optional[str]]:
+        
+        query = self.db.query(HITLApproval).filter(
+            HITLApproval.status == HITLStatus.PENDING
+        )
+        
+        if project_id:
+            query = query.filter(HITLApproval.project_id == project_id)
+        
+        if after:
+            score, created_at, approval_id = _decode_cursor(after)
+            tail = tuple_(HITLApproval.created_at, HITLApproval.id) > tuple_(created_at, approval_id)
+            
+            if score is None:
+                query = query.filter(HITLApproval.impact_score.is_(None), tail)
+            else:
+                query = query.filter(or_(
+                    HITLApproval.impact_score < score,
+                    HITLApproval.impact_score.is_(None),
+                    and_(HITLApproval.impact_score == score, tail)
+                ))
+        
+        approvals = query.order_by(
+            HITLApproval.impact_score.desc().nullslast(),
+            HITLApproval.created_at.asc(),
+            HITLApproval.id.asc()
+        ).limit(limit).all()
+        
+        next_cursor = None
+        if len(approvals) == limit:
+            next_cursor = _encode_cursor(approvals[-1])
+        
+        return approvals, next_cursor
+    
+    def get_approval_by_task_id(self, task_id: str) -> Optional[HITLApproval]:
+        
+        return self.db.query(HITLApproval).filter(
+            HITLApproval.task_id == task_id
+        ).first()
+    
+    def get_approval_with_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        
+        hitl_approval = self.db.query(HITLApproval).filter(
+            HITLApproval.task_id == task_id
+        ).first()
+        
+        if not hitl_approval:
+            return None
+        
+        task = self.db.query(Task).filter(Task.id == task_id).first()
+        
+        return {
+            "approval": hitl_approval,
+            "task": task
+        }
+    
+    @cached(_statistics_cache, key=_project_cache_key, lock=_cache_lock)
+    def get_approval_statistics(self, project_id: str) -> Dict[str, Any]:
+        
+        total = self.db.query(HITLApproval).filter(
+            HITLApproval.project_id == project_id
+        ).count()
+        
+        pending = self.db.query(HITLApproval).filter(
+            HITLApproval.project_id == project_id,
+            HITLApproval.status == HITLStatus.PENDING
+        ).count()
+        
+        approved = self.db.query(HITLApproval).filter(
+            HITLApproval.project_id == project_id,
+            HITLApproval.status == HITLStatus.APPROVED
+        ).count()
+        
+        rejected = self.db.query(HITLApproval).filter(
+            HITLApproval.project_id == project_id,
+            HITLApproval.status == HITLStatus.REJECTED
+        ).count()
+        
+        return {
+            "project_id": project_id,
+            "total": total,
+            "pending": pending,
+            "approved": approved,
+            "rejected": rejected,
+            "approval_rate": round(approved / total * 100, 2) if total > 0 else 0
+        }
+    
+    @cached(_pending_count_cache, key=_project_cache_key, lock=_cache_lock)
+    def get_pending_count(self, project_id: Optional[str] = None) -> int:
+        
+        query = self.db.query(HITLApproval).filter(
+            HITLApproval.status == HITLStatus.PENDING
+        )
+        
+        if project_id:
+            query = query.filter(HITLApproval.project_id == project_id)
+        
+        return query.count()
+    
+    def get_high_impact_pending(
+        self,
+        project_id: Optional[str] = None,
+        min_impact_score: float = 0.7,
+        limit: int = 20
+    ) -> List[HITLApproval]:
+        
+        query = self.db.query(HITLApproval).filter(
+            HITLApproval.status == HITLStatus.PENDING,
+            HITLApproval.impact_score >= min_impact_score
+        )
+        
+        if project_id:
+            query = query.filter(HITLApproval.project_id == project_id)
+        
+        approvals = query.order_by(
+            HITLApproval.impact_score.desc()
+        ).limit(limit).all()
+        
+        return approvals
+
+
+async def handle_hitl_approved_event(
+    db: Session,
+    event: Dict[str, Any],
+    correlation_id: Optional[str] = None
+) -> Dict[str, Any]:
+    
+    payload = event.get("payload", {})
+    task_id = payload.get("task_id")
+    approved_by = payload.get("approved_by")
+    auto_deploy = payload.get("auto_deploy", True)
+    notes = payload.get("notes")
+    
+    if not task_id:
+        raise ValueError("task_id is required in event payload")
+    
+    if not approved_by:
+        raise ValueError("approved_by is required in event payload")
+    
+    handler = HITLHandler(db)
+    
+    decision = HITLDecision(
+        auto_deploy=auto_deploy,
+        notes=notes
+    )
+    
+    result = await handler.approve_task(
+        task_id=task_id,
+        approved_by=approved_by,
+        decision=decision,
+        correlation_id=correlation_id
+    )
+    
+    logger.info(
+        f"HITLApproved event processed for task {task_id}",
+        extra={
+            "task_id": task_id,
+            "approved_by": approved_by,
+            "correlation_id": correlation_id
+        }
+    )
+    
+    return result
+
+
+def handle_hitl_rejected_event(
+    db: Session,
+    event: Dict[str, Any],
+    correlation_id: Optional[str] = None
+) -> Dict[str, Any]:
+    
+    payload = event.get("payload", {})
+    task_id = payload.get("task_id")
+    rejected_by = payload.get("rejected_by")
+    rejection_reason = payload.get("rejection_reason")
+    notes = payload.get("notes")
+    
+    if not task_id:
+        raise ValueError("task_id is required in event payload")
+    
+    if not rejected_by:
+        raise ValueError("rejected_by is required in event payload")
+    
+    handler = HITLHandler(db)
+    
+    decision = HITLDecision(
+        rejection_reason=rejection_reason,
+        notes=notes
+    )
+    
+    result = handler.reject_task(
+        task_id=task_id,
+        rejected_by=rejected_by,
+        decision=decision,
+        correlation_id=correlation_id
+    )
+    
+    logger.info(
+        f"HITLRejected event processed for task {task_id}",
+        extra={
+            "task_id": task_id,
+            "rejected_by": rejected_by,
+            "correlation_id": correlation_id
+        }
+    )
+    
+    return result
+
+
+def create_hitl_approval_for_task(
+    db: Session,
+    task: Task,
+    diff_data: Dict[str, Any],
+    impact_score: Optional[float] = None,
+    recommendation: Optional[str] = None,
+    correlation_id: Optional[str] = None
+) -> HITLApproval:
+    
+    handler = HITLHandler(db)
+    
+    approval_data = HITLApprovalCreate(
+        task_id=task.id,
+        diff_data=diff_data,
+        impact_score=impact_score or task.impact_score,
+        recommendation=recommendation
+    )
+    
+    return handler.create_hitl_approval(
+        task_id=str(task.id),
+        approval_data=approval_data,
+        correlation_id=correlation_id
+    )
@@ -0,0 +1,16 @@
+import os
+import time
+import uuid
+
+_VERSION_MASK = 0xF << 76
+_VARIANT_MASK = 0x3 << 62
+
+
+def uuid7() -> uuid.UUID:
+    # RFC 9562 version 7: a 48-bit Unix millisecond timestamp followed by
+    # random bits, so new ids land at the tail of the primary-key index.
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~_VERSION_MASK) | (0x7 << 76)
+    value = (value & ~_VARIANT_MASK) | (0x2 << 62)
+    return uuid.UUID(int=value)
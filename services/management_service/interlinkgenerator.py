@@ -1,694 +1,1156 @@
-from typing import List, Dict, Any, Optional, Tuple, Set
-from sqlalchemy.orm import Session
-from datetime import datetime
-import httpx
-import re
-import json
-import hashlib
-from collections import defaultdict
-from urllib.parse import urlparse
-
-from services.management_service.config import settings
-from services.management_service.db.models import Project, Task, TaskType, TaskStatus
-from services.management_service.db.session import get_db
-from services.management_service.events.task_created import publish_task_created_event
-from config.loggingconfig import get_logger
-
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from prometheus_client import Counter, Histogram
-import redis.asyncio as redis
-
-logger = get_logger(__name__)
-
-interlink_generation_duration = Histogram(
-    'interlink_generation_duration_seconds',
-    'Duration of interlink generation',
-    ['project_id']
-)
-
-interlinks_generated_total = Counter(
-    'interlinks_generated_total',
-    'Total number of interlinks generated',
-    ['project_id']
-)
-
-interlink_errors_total = Counter(
-    'interlink_errors_total',
-    'Total errors during interlink generation',
-    ['error_type']
-)
-
-semantic_api_calls_total = Counter(
-    'semantic_api_calls_total',
-    'Total calls to Semantic Service API',
-    ['endpoint', 'cached']
-)
-
-
-class InternalLink:
-    
-    def __init__(
-        self,
-        source_url: str,
-        target_url: str,
-        anchor_text: str,
-        context: str,
-        relevance_score: float,
-        position: Optional[str] = None,
-        impact_score: Optional[float] = None
-    ):
-        self.source_url = source_url
-        self.target_url = target_url
-        self.anchor_text = anchor_text
-        self.context = context
-        self.relevance_score = relevance_score
-        self.position = position or "body"
-        self.impact_score = impact_score or 0.5
-
-
-class InterlinkGenerator:
-    
-    def __init__(self, db: Session, redis_client: Optional[redis.Redis] = None):
-        self.db = db
-        self.redis_client = redis_client
-        self.min_relevance_score = 0.6
-        self.max_links_per_page = 10
-        self.min_anchor_length = 15
-        self.max_anchor_length = 60
-        self.min_content_words = 100
-        self.cache_ttl = 604800 
-        self.link_graph: Dict[str, Set[str]] = defaultdict(set)
-        self._validate_config()
-    
-    def _validate_config(self):
-        if not settings.INTERNAL_API_KEY:
-            raise ValueError("INTERNAL_API_KEY is not configured")
-        
-        if not settings.SEMANTIC_SERVICE_URL:
-            raise ValueError("SEMANTIC_SERVICE_URL is not configured")
-        
-        if not settings.AUDIT_SERVICE_URL:
-            raise ValueError("AUDIT_SERVICE_URL is not configured")
-        
-        if len(settings.INTERNAL_API_KEY) < 32:
-            logger.warning("INTERNAL_API_KEY should be at least 32 characters")
-    
-    def _get_cache_key(self, prefix: str, data: Dict[str, Any]) -> str:
-        data_str = json.dumps(data, sort_keys=True)
-        hash_value = hashlib.sha256(data_str.encode()).hexdigest()
-        return f"interlink:{prefix}:{hash_value}"
-    
-    async def _get_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        if not self.redis_client:
-            return None
-        
-        try:
-            cached = await self.redis_client.get(cache_key)
-            if cached:
-                semantic_api_calls_total.labels(endpoint='cached', cached='hit').inc()
-                return json.loads(cached)
-        except Exception as e:
-            logger.error(f"Redis get error: {e}")
-        
-        return None
-    
-    async def _set_cached(self, cache_key: str, data: Dict[str, Any], ttl: int):
-        if not self.redis_client:
-            return
-        
-        try:
-            await self.redis_client.setex(
-                cache_key,
-                ttl,
-                json.dumps(data)
-            )
-        except Exception as e:
-            logger.error(f"Redis set error: {e}")
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException))
-    )
-    async def _call_semantic_service(
-        self,
-        endpoint: str,
-        payload: Dict[str, Any],
-        correlation_id: Optional[str] = None,
-        use_cache: bool = True
-    ) -> Dict[str, Any]:
-        if use_cache:
-            cache_key = self._get_cache_key(f"semantic:{endpoint}", payload)
-            cached_result = await self._get_cached(cache_key)
-            if cached_result:
-                return cached_result
-        
-        semantic_api_calls_total.labels(endpoint=endpoint, cached='miss').inc()
-        
-        timeout = httpx.Timeout(30.0, connect=5.0, read=25.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            headers = {
-                "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                "Content-Type": "application/json"
-            }
-            if correlation_id:
-                headers["X-Correlation-ID"] = correlation_id
-            
-            try:
-                response = await client.post(
-                    f"{settings.SEMANTIC_SERVICE_URL}{endpoint}",
-                    json=payload,
-                    headers=headers
-                )
-                response.raise_for_status()
-                result = response.json()
-                
-                if use_cache:
-                    await self._set_cached(cache_key, result, self.cache_ttl)
-                
-                return result
-                
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"Semantic Service HTTP error: {e.response.status_code}",
-                    extra={"endpoint": endpoint, "correlation_id": correlation_id}
-                )
-                interlink_errors_total.labels(error_type='semantic_api_http').inc()
-                raise
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Semantic Service timeout: {e}",
-                    extra={"endpoint": endpoint, "correlation_id": correlation_id}
-                )
-                interlink_errors_total.labels(error_type='semantic_api_timeout').inc()
-                raise
-    
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def get_project_pages(self, project_id: str) -> List[Dict[str, Any]]:
-        timeout = httpx.Timeout(30.0, connect=5.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(
-                f"{settings.AUDIT_SERVICE_URL}/internal/project/{project_id}/pages",
-                headers={"X-Internal-API-Key": settings.INTERNAL_API_KEY}
-            )
-            response.raise_for_status()
-            return response.json()["pages"]
-    
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def get_page_content(self, project_id: str, url: str) -> Dict[str, Any]:
-        timeout = httpx.Timeout(30.0, connect=5.0)
-        
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(
-                f"{settings.AUDIT_SERVICE_URL}/internal/page/content",
-                params={"project_id": project_id, "url": url},
-                headers={"X-Internal-API-Key": settings.INTERNAL_API_KEY}
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def calculate_semantic_similarity(
-        self,
-        text1: str,
-        text2: str,
-        correlation_id: Optional[str] = None
-    ) -> float:
-        result = await self._call_semantic_service(
-            "/internal/semantic/similarity",
-            {
-                "text1": text1[:1000],
-                "text2": text2[:1000]
-            },
-            correlation_id,
-            use_cache=True
-        )
-        return float(result.get("similarity_score", 0.0))
-    
-    async def extract_keywords(
-        self,
-        text: str,
-        max_keywords: int = 10,
-        correlation_id: Optional[str] = None
-    ) -> List[str]:
-        result = await self._call_semantic_service(
-            "/internal/semantic/extract-keywords",
-            {
-                "text": text[:2000],
-                "max_keywords": max_keywords
-            },
-            correlation_id,
-            use_cache=True
-        )
-        return result.get("keywords", [])
-    
-    async def generate_anchor_text_llm(
-        self,
-        source_context: str,
-        target_page_title: str,
-        target_page_description: str,
-        keywords: List[str],
-        correlation_id: Optional[str] = None
-    ) -> str:
-        result = await self._call_semantic_service(
-            "/internal/content/generate-anchor",
-            {
-                "source_context": source_context[:500],
-                "target_title": target_page_title[:200],
-                "target_description": target_page_description[:300],
-                "keywords": keywords[:5]
-            },
-            correlation_id,
-            use_cache=True
-        )
-        return result.get("anchor_text", "")
-    
-    def extract_sentences_with_keywords(
-        self,
-        content: str,
-        keywords: List[str],
-        max_sentences: int = 5
-    ) -> List[str]:
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
-        
-        scored_sentences = []
-        for sentence in sentences:
-            score = sum(1 for kw in keywords if kw.lower() in sentence.lower())
-            if score > 0:
-                scored_sentences.append((sentence, score))
-        
-        scored_sentences.sort(key=lambda x: x[1], reverse=True)
-        return [s[0] for s in scored_sentences[:max_sentences]]
-    
-    async def calculate_page_relevance(
-        self,
-        source_page: Dict[str, Any],
-        target_page: Dict[str, Any],
-        correlation_id: Optional[str] = None
-    ) -> float:
-        source_text = f"{source_page.get('title', '')} {source_page.get('description', '')} {source_page.get('h1', '')}"
-        target_text = f"{target_page.get('title', '')} {target_page.get('description', '')} {target_page.get('h1', '')}"
-        
-        if not source_text.strip() or not target_text.strip():
-            return 0.0
-        
-        try:
-            similarity = await self.calculate_semantic_similarity(
-                source_text,
-                target_text,
-                correlation_id
-            )
-            return similarity
-        except Exception as e:
-            logger.error(
-                f"Failed to calculate semantic similarity: {e}",
-                extra={"correlation_id": correlation_id}
-            )
-            interlink_errors_total.labels(error_type='similarity_calculation').inc()
-            return 0.0
-    
-    def _is_circular_link(self, source_url: str, target_url: str) -> bool:
-        if source_url in self.link_graph.get(target_url, set()):
-            return True
-        return False
-    
-    def _add_to_graph(self, source_url: str, target_url: str):
-        self.link_graph[source_url].add(target_url)
-    
-    async def find_relevant_pages(
-        self,
-        source_page: Dict[str, Any],
-        candidate_pages: List[Dict[str, Any]],
-        correlation_id: Optional[str] = None
-    ) -> List[Tuple[Dict[str, Any], float]]:
-        relevant_pages = []
-        
-        source_url = source_page["url"]
-        
-        for candidate in candidate_pages:
-            if candidate["url"] == source_url:
-                continue
-            
-            if not self._is_same_domain(source_url, candidate["url"]):
-                continue
-            
-            if self._is_circular_link(source_url, candidate["url"]):
-                logger.debug(f"Skipping circular link: {source_url} -> {candidate['url']}")
-                continue
-            
-            relevance = await self.calculate_page_relevance(
-                source_page,
-                candidate,
-                correlation_id
-            )
-            
-            if relevance >= self.min_relevance_score:
-                relevant_pages.append((candidate, relevance))
-        
-        relevant_pages.sort(key=lambda x: x[1], reverse=True)
-        
-        return relevant_pages[:self.max_links_per_page]
-    
-    def _is_same_domain(self, url1: str, url2: str) -> bool:
-        domain1 = urlparse(url1).netloc
-        domain2 = urlparse(url2).netloc
-        
-        return domain1 == domain2
-    
-    def _calculate_impact_score(
-        self,
-        relevance_score: float,
-        page_importance: float,
-        keyword_overlap: int
-    ) -> float:
-        keyword_score = min(keyword_overlap / 10.0, 1.0)
-        
-        impact = (
-            relevance_score * 0.5 +
-            page_importance * 0.3 +
-            keyword_score * 0.2
-        )
-        
-        return round(impact, 3)
-    
-    async def generate_interlinks_for_page(
-        self,
-        project_id: str,
-        source_url: str,
-        correlation_id: Optional[str] = None
-    ) -> List[InternalLink]:
-        logger.info(
-            f"Generating interlinks for page",
-            extra={"project_id": project_id, "url": source_url, "correlation_id": correlation_id}
-        )
-        
-        try:
-            source_content = await self.get_page_content(project_id, source_url)
-            
-            content_word_count = len(source_content.get("content", "").split())
-            if content_word_count < self.min_content_words:
-                logger.warning(
-                    f"Page {source_url} has insufficient content ({content_word_count} words)",
-                    extra={"correlation_id": correlation_id}
-                )
-                return []
-            
-            all_pages = await self.get_project_pages(project_id)
-            
-            relevant_pages = await self.find_relevant_pages(
-                source_content,
-                all_pages,
-                correlation_id
-            )
-            
-            if not relevant_pages:
-                logger.info(f"No relevant pages found for {source_url}")
-                return []
-            
-            source_keywords = await self.extract_keywords(
-                source_content.get("content", ""),
-                max_keywords=20,
-                correlation_id=correlation_id
-            )
-            
-            interlinks = []
-            
-            for target_page, relevance_score in relevant_pages:
-                try:
-                    target_keywords = await self.extract_keywords(
-                        target_page.get("content", ""),
-                        max_keywords=10,
-                        correlation_id=correlation_id
-                    )
-                    
-                    common_keywords = list(set(source_keywords) & set(target_keywords))
-                    
-                    if not common_keywords:
-                        common_keywords = target_keywords[:3]
-                    
-                    context_sentences = self.extract_sentences_with_keywords(
-                        source_content.get("content", ""),
-                        common_keywords,
-                        max_sentences=3
-                    )
-                    
-                    if context_sentences:
-                        context = " ".join(context_sentences)[:500]
-                    else:
-                        context = source_content.get("content", "")[:500]
-                    
-                    anchor_text = await self.generate_anchor_text_llm(
-                        source_context=context,
-                        target_page_title=target_page.get("title", ""),
-                        target_page_description=target_page.get("description", ""),
-                        keywords=common_keywords,
-                        correlation_id=correlation_id
-                    )
-                    
-                    anchor_text = self._sanitize_anchor_text(anchor_text)
-                    
-                    if len(anchor_text) < self.min_anchor_length:
-                        anchor_text = target_page.get("title", "")[:self.max_anchor_length]
-                    
-                    page_importance = source_content.get("importance", 0.5)
-                    impact_score = self._calculate_impact_score(
-                        relevance_score,
-                        page_importance,
-                        len(common_keywords)
-                    )
-                    
-                    interlink = InternalLink(
-                        source_url=source_url,
-                        target_url=target_page["url"],
-                        anchor_text=anchor_text,
-                        context=context[:200],
-                        relevance_score=relevance_score,
-                        position="body",
-                        impact_score=impact_score
-                    )
-                    
-                    interlinks.append(interlink)
-                    
-                    self._add_to_graph(source_url, target_page["url"])
-                    
-                    interlinks_generated_total.labels(project_id=project_id).inc()
-                    
-                except Exception as e:
-                    logger.error(
-                        f"Failed to generate interlink for {target_page['url']}: {e}",
-                        extra={"correlation_id": correlation_id}
-                    )
-                    interlink_errors_total.labels(error_type='link_generation').inc()
-                    continue
-            
-            logger.info(
-                f"Generated {len(interlinks)} interlinks for {source_url}",
-                extra={"correlation_id": correlation_id}
-            )
-            
-            return interlinks
-            
-        except Exception as e:
-            logger.error(
-                f"Failed to generate interlinks for page {source_url}: {e}",
-                extra={"correlation_id": correlation_id}
-            )
-            interlink_errors_total.labels(error_type='page_processing').inc()
-            raise
-    
-    def _sanitize_anchor_text(self, text: str) -> str:
-        text = text.strip()
-        
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s\-]', '', text)
-        
-        if len(text) > self.max_anchor_length:
-            text = text[:self.max_anchor_length].rsplit(' ', 1)[0]
-        
-        return text
-    
-    async def create_interlink_tasks(
-        self,
-        project_id: str,
-        interlinks: List[InternalLink],
-        correlation_id: Optional[str] = None
-    ) -> List[str]:
-        
-        task_ids = []
-        
-        links_by_source = defaultdict(list)
-        for link in interlinks:
-            links_by_source[link.source_url].append(link)
-        
-        tasks_to_add = []
-        
-        for source_url, links in links_by_source.items():
-            avg_impact = sum(link.impact_score for link in links) / len(links)
-            
-            task = Task(
-                project_id=project_id,
-                task_type=TaskType.ADD_INTERNAL_LINKS,
-                status=TaskStatus.PENDING,
-                url=source_url,
-                metadata={
-                    "interlinks": [
-                        {
-                            "target_url": link.target_url,
-                            "anchor_text": link.anchor_text,
-                            "context": link.context,
-                            "relevance_score": link.relevance_score,
-                            "position": link.position,
-                            "impact_score": link.impact_score
-                        }
-                        for link in links
-                    ],
-                    "total_links": len(links),
-                    "average_impact_score": round(avg_impact, 3),
-                    "correlation_id": correlation_id,
-                    "created_at": datetime.utcnow().isoformat()
-                }
-            )
-            
-            tasks_to_add.append(task)
-        
-        for task in tasks_to_add:
-            self.db.add(task)
-        
-        self.db.flush()
-        
-        for task in tasks_to_add:
-            task_ids.append(str(task.id))
-            
-            try:
-                await publish_task_created_event(
-                    db=self.db,
-                    task_id=str(task.id),
-                    project_id=project_id,
-                    task_type=TaskType.ADD_INTERNAL_LINKS,
-                    url=task.url,
-                    metadata=task.metadata,
-                    correlation_id=correlation_id
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to publish TaskCreated event: {e}",
-                    extra={"task_id": str(task.id), "correlation_id": correlation_id}
-                )
-        
-        self.db.commit()
-        
-        logger.info(
-            f"Created {len(task_ids)} interlink tasks for project {project_id}",
-            extra={"correlation_id": correlation_id}
-        )
-        
-        return task_ids
-    
-    @interlink_generation_duration.labels(project_id='').time()
-    async def generate_interlinks_for_project(
-        self,
-        project_id: str,
-        max_pages: Optional[int] = None,
-        correlation_id: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Generate interlinks for entire project"""
-        logger.info(
-            f"Starting interlink generation for project {project_id}",
-            extra={"correlation_id": correlation_id, "max_pages": max_pages}
-        )
-        
-        project = self.db.query(Project).filter(Project.id == project_id).first()
-        if not project:
-            raise ValueError(f"Project {project_id} not found")
-        
-        self.link_graph.clear()
-        
-        all_pages = await self.get_project_pages(project_id)
-        
-        if max_pages:
-            all_pages = all_pages[:max_pages]
-        
-        logger.info(f"Processing {len(all_pages)} pages for project {project_id}")
-        
-        all_interlinks = []
-        processed_pages = 0
-        failed_pages = 0
-        
-        for page in all_pages:
-            try:
-                interlinks = await self.generate_interlinks_for_page(
-                    project_id,
-                    page["url"],
-                    correlation_id
-                )
-                all_interlinks.extend(interlinks)
-                processed_pages += 1
-                
-            except Exception as e:
-                logger.error(
-                    f"Failed to generate interlinks for page {page['url']}: {e}",
-                    extra={"correlation_id": correlation_id}
-                )
-                failed_pages += 1
-                continue
-        
-        # Create tasks and publish events
-        task_ids = []
-        if all_interlinks:
-            task_ids = await self.create_interlink_tasks(
-                project_id,
-                all_interlinks,
-                correlation_id
-            )
-        
-        result = {
-            "project_id": project_id,
-            "total_interlinks": len(all_interlinks),
-            "pages_processed": processed_pages,
-            "pages_failed": failed_pages,
-            "tasks_created": len(task_ids),
-            "task_ids": task_ids,
-            "correlation_id": correlation_id,
-            "completed_at": datetime.utcnow().isoformat()
-        }
-        
-        logger.info(
-            f"Completed interlink generation for project {project_id}",
-            extra=result
-        )
-        
-        return result
-
-
-async def generate_interlinks(
-    db: Session,
-    project_id: str,
-    max_pages: Optional[int] = None,
-    correlation_id: Optional[str] = None,
-    redis_client: Optional[redis.Redis] = None
-) -> Dict[str, Any]:
-    
-    generator = InterlinkGenerator(db, redis_client)
-    return await generator.generate_interlinks_for_project(
-        project_id,
-        max_pages,
-        correlation_id
-    )
-
-
-async def generate_interlinks_for_page(
-    db: Session,
-    project_id: str,
-    url: str,
-    correlation_id: Optional[str] = None,
-    redis_client: Optional[redis.Redis] = None
-) -> List[InternalLink]:
-    
-    generator = InterlinkGenerator(db, redis_client)
-    return await generator.generate_interlinks_for_page(
-        project_id,
-        url,
-        correlation_id
-    )
+from typing import List, Dict, Any, Optional, Tuple, Set, Union
+from sqlalchemy.orm import Session
+from datetime import datetime
+import asyncio
+import httpx
+import re
+import orjson
+import hashlib
+from collections import defaultdict
+from functools import lru_cache
+from urllib.parse import urlparse
+
+from services.management_service.config import settings
+from services.management_service.db.models import Project, Task, TaskType, TaskStatus
+from services.management_service.db.session import get_db
+from services.management_service.events.task_created import publish_task_created_events_batch
+from services.management_service.redis_pool import get_redis_client, close_redis_pool
+from config.loggingconfig import get_logger
+
+from tenacity import (
+    RetryError,
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    retry_if_exception_type,
+    retry_if_not_exception_type
+)
+from prometheus_client import Counter, Histogram
+import redis.asyncio as redis
+
+logger = get_logger(__name__)
+
+interlink_generation_duration = Histogram(
+    'interlink_generation_duration_seconds',
+    'Duration of interlink generation',
+    ['project_id']
+)
+
+interlinks_generated_total = Counter(
+    'interlinks_generated_total',
+    'Total number of interlinks generated',
+    ['project_id']
+)
+
+interlink_errors_total = Counter(
+    'interlink_errors_total',
+    'Total errors during interlink generation',
+    ['error_type']
+)
+
+semantic_api_calls_total = Counter(
+    'semantic_api_calls_total',
+    'Total calls to Semantic Service API',
+    ['endpoint', 'cached']
+)
+
+SEMANTIC_TIMEOUT = httpx.Timeout(30.0, connect=5.0, read=25.0)
+AUDIT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+WHITESPACE_RE = re.compile(r'\s+')
+ANCHOR_STRIP_RE = re.compile(r'[^\w\s\-]')
+
+KEYWORDS_ENDPOINT = "/internal/semantic/extract-keywords"
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0
+)
+
+
+MISSING_ENDPOINT_STATUSES = frozenset({404, 405, 501})
+
+
+class ResponseTooLargeError(ValueError):
+    pass
+
+
+def _is_missing_endpoint(error: BaseException) -> bool:
+    if isinstance(error, RetryError):
+        error = error.last_attempt.exception()
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code in MISSING_ENDPOINT_STATUSES
+    )
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    return urlparse(url).netloc
+
+
+class InternalLink:
+    
+    __slots__ = (
+        "source_url",
+        "target_url",
+        "anchor_text",
+        "context",
+        "relevance_score",
+        "position",
+        "impact_score"
+    )
+    
+    def __init__(
+        self,
+        source_url: str,
+        target_url: str,
+        anchor_text: str,
+        context: str,
+        relevance_score: float,
+        position: Optional[str] = None,
+        impact_score: Optional[float] = None
+    ):
+        self.source_url = source_url
+        self.target_url = target_url
+        self.anchor_text = anchor_text
+        self.context = context
+        self.relevance_score = relevance_score
+        self.position = position or "body"
+        self.impact_score = impact_score or 0.5
+
+
+class InterlinkGenerator:
+    
+    def __init__(
+        self,
+        db: Session,
+        redis_client: Optional[redis.Redis] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
+        self.db = db
+        self.redis_client = redis_client
+        self.min_relevance_score = 0.6
+        self.max_links_per_page = 10
+        self.min_anchor_length = 15
+        self.max_anchor_length = 60
+        self.min_content_words = 100
+        self.cache_ttl = 604800 
+        self.link_graph: Dict[str, Set[str]] = {}
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._similarity_batch_supported = True
+        self._anchor_batch_supported = True
+        self._project_pages_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._page_content_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._page_keywords_cache: Dict[str, asyncio.Future] = {}
+        self._validate_config()
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=AUDIT_TIMEOUT, limits=HTTP_LIMITS)
+            self._owns_http_client = True
+        return self._http_client
+    
+    async def aclose(self):
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+        self._http_client = None
+    
+    def _validate_config(self):
+        if not settings.INTERNAL_API_KEY:
+            raise ValueError("INTERNAL_API_KEY is not configured")
+        
+        if not settings.SEMANTIC_SERVICE_URL:
+            raise ValueError("SEMANTIC_SERVICE_URL is not configured")
+        
+        if not settings.AUDIT_SERVICE_URL:
+            raise ValueError("AUDIT_SERVICE_URL is not configured")
+        
+        if len(settings.INTERNAL_API_KEY) < 32:
+            logger.warning("INTERNAL_API_KEY should be at least 32 characters")
+    
+    def _get_cache_key(self, prefix: str, data: Dict[str, Any]) -> str:
+        data_bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        hash_value = hashlib.blake2b(data_bytes, digest_size=16).hexdigest()
+        return f"interlink:{prefix}:{hash_value}"
+    
+    async def _get_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        if not self.redis_client:
+            return None
+        
+        try:
+            cached = await self.redis_client.get(cache_key)
+            if cached:
+                semantic_api_calls_total.labels(endpoint='cached', cached='hit').inc()
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.error(f"Redis get error: {e}")
+        
+        return None
+    
+    async def _get_cached_many(self, cache_keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        if not self.redis_client or not cache_keys:
+            return [None] * len(cache_keys)
+        
+        try:
+            values = await self.redis_client.mget(cache_keys)
+        except Exception as e:
+            logger.error(f"Redis mget error: {e}")
+            return [None] * len(cache_keys)
+        
+        results = []
+        for value in values:
+            if value:
+                semantic_api_calls_total.labels(endpoint='cached', cached='hit').inc()
+                results.append(orjson.loads(value))
+            else:
+                results.append(None)
+        
+        return results
+    
+    async def _set_cached(self, cache_key: str, data: Dict[str, Any], ttl: int):
+        if not self.redis_client:
+            return
+        
+        try:
+            await self.redis_client.setex(
+                cache_key,
+                ttl,
+                orjson.dumps(data)
+            )
+        except Exception as e:
+            logger.error(f"Redis set error: {e}")
+    
+    async def _call_semantic_service(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        correlation_id: Optional[str] = None,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        if not use_cache:
+            return await self._post_semantic_service(endpoint, payload, correlation_id)
+        
+        cache_key = self._get_cache_key(f"semantic:{endpoint}", payload)
+        cached_result = await self._get_cached(cache_key)
+        if cached_result:
+            return cached_result
+        
+        result = await self._post_semantic_service(endpoint, payload, correlation_id)
+        await self._set_cached(cache_key, result, self.cache_ttl)
+        return result
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException))
+    )
+    async def _post_semantic_service(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        semantic_api_calls_total.labels(endpoint=endpoint, cached='miss').inc()
+        
+        headers = {
+            "X-Internal-API-Key": settings.INTERNAL_API_KEY,
+            "Content-Type": "application/json"
+        }
+        if correlation_id:
+            headers["X-Correlation-ID"] = correlation_id
+        
+        try:
+            response = await self._get_http_client().post(
+                f"{settings.SEMANTIC_SERVICE_URL}{endpoint}",
+                content=orjson.dumps(payload),
+                headers=headers,
+                timeout=SEMANTIC_TIMEOUT
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+            
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"Semantic Service HTTP error: {e.response.status_code}",
+                extra={"endpoint": endpoint, "correlation_id": correlation_id}
+            )
+            interlink_errors_total.labels(error_type='semantic_api_http').inc()
+            raise
+        except httpx.TimeoutException as e:
+            logger.error(
+                f"Semantic Service timeout: {e}",
+                extra={"endpoint": endpoint, "correlation_id": correlation_id}
+            )
+            interlink_errors_total.labels(error_type='semantic_api_timeout').inc()
+            raise
+    
+    async def _get_json(self, url: str, **kwargs) -> Any:
+        max_bytes = settings.INTERLINK_MAX_RESPONSE_BYTES
+        
+        async with self._get_http_client().stream("GET", url, **kwargs) as response:
+            response.raise_for_status()
+            
+            content_length = response.headers.get("content-length")
+            if content_length and int(content_length) > max_bytes:
+                raise ResponseTooLargeError(f"Response from {url} exceeds {max_bytes} bytes")
+            
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if len(body) > max_bytes:
+                    raise ResponseTooLargeError(f"Response from {url} exceeds {max_bytes} bytes")
+        
+        return orjson.loads(body)
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_not_exception_type(ResponseTooLargeError)
+    )
+    async def get_project_pages(self, project_id: str) -> List[Dict[str, Any]]:
+        if project_id in self._project_pages_cache:
+            return self._project_pages_cache[project_id]
+        
+        pages = (await self._get_json(
+            f"{settings.AUDIT_SERVICE_URL}/internal/project/{project_id}/pages",
+            headers={"X-Internal-API-Key": settings.INTERNAL_API_KEY}
+        ))["pages"]
+        self._project_pages_cache[project_id] = pages
+        return pages
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_not_exception_type(ResponseTooLargeError)
+    )
+    async def get_page_content(self, project_id: str, url: str) -> Dict[str, Any]:
+        cache_key = (project_id, url)
+        if cache_key in self._page_content_cache:
+            return self._page_content_cache[cache_key]
+        
+        content = await self._get_json(
+            f"{settings.AUDIT_SERVICE_URL}/internal/page/content",
+            params={"project_id": project_id, "url": url},
+            headers={"X-Internal-API-Key": settings.INTERNAL_API_KEY}
+        )
+        self._page_content_cache[cache_key] = content
+        return content
+    
+    async def calculate_semantic_similarity(
+        self,
+        text1: str,
+        text2: str,
+        correlation_id: Optional[str] = None
+    ) -> float:
+        result = await self._call_semantic_service(
+            "/internal/semantic/similarity",
+            {
+                "text1": text1[:1000],
+                "text2": text2[:1000]
+            },
+            correlation_id,
+            use_cache=True
+        )
+        return float(result.get("similarity_score", 0.0))
+    
+    async def calculate_semantic_similarity_batch(
+        self,
+        source_text: str,
+        target_texts: List[str],
+        correlation_id: Optional[str] = None
+    ) -> List[float]:
+        result = await self._call_semantic_service(
+            "/internal/semantic/similarity-batch",
+            {
+                "source": source_text[:1000],
+                "targets": [text[:1000] for text in target_texts]
+            },
+            correlation_id,
+            use_cache=True
+        )
+        scores = result.get("similarity_scores", [])
+        if len(scores) != len(target_texts):
+            raise ValueError(
+                f"Semantic Service returned {len(scores)} scores for {len(target_texts)} targets"
+            )
+        return [float(score) for score in scores]
+    
+    async def extract_keywords(
+        self,
+        text: str,
+        max_keywords: int = 10,
+        correlation_id: Optional[str] = None
+    ) -> List[str]:
+        keywords = (await self.extract_keywords_many([text], max_keywords, correlation_id))[0]
+        if isinstance(keywords, Exception):
+            raise keywords
+        return keywords
+    
+    async def extract_keywords_many(
+        self,
+        texts: List[str],
+        max_keywords: int = 10,
+        correlation_id: Optional[str] = None
+    ) -> List[Union[List[str], Exception]]:
+        payloads = [self._keywords_payload(text, max_keywords) for text in texts]
+        cache_keys = [
+            self._get_cache_key(f"semantic:{KEYWORDS_ENDPOINT}", payload)
+            for payload in payloads
+        ]
+        
+        payload_by_key = dict(zip(cache_keys, payloads))
+        
+        loop = asyncio.get_running_loop()
+        futures: Dict[str, asyncio.Future] = {}
+        pending = []
+        for key in payload_by_key:
+            future = self._page_keywords_cache.get(key)
+            if future is None:
+                future = self._page_keywords_cache[key] = loop.create_future()
+                pending.append(key)
+            futures[key] = future
+        
+        try:
+            cached = await self._get_cached_many(pending)
+            misses = []
+            for key, result in zip(pending, cached):
+                if result:
+                    futures[key].set_result(result.get("keywords", []))
+                else:
+                    misses.append(key)
+            
+            fetched = await asyncio.gather(
+                *[
+                    self._call_semantic_service(
+                        KEYWORDS_ENDPOINT,
+                        payload_by_key[key],
+                        correlation_id,
+                        use_cache=False
+                    )
+                    for key in misses
+                ],
+                return_exceptions=True
+            )
+            
+            writes = []
+            for key, result in zip(misses, fetched):
+                if isinstance(result, Exception):
+                    futures[key].set_exception(result)
+                    self._page_keywords_cache.pop(key, None)
+                    continue
+                futures[key].set_result(result.get("keywords", []))
+                writes.append(self._set_cached(key, result, self.cache_ttl))
+            
+            await asyncio.gather(*writes)
+        finally:
+            for key in pending:
+                if not futures[key].done():
+                    futures[key].cancel()
+                    self._page_keywords_cache.pop(key, None)
+        
+        return await asyncio.gather(
+            *[futures[key] for key in cache_keys],
+            return_exceptions=True
+        )
+    
+    def _keywords_payload(self, text: str, max_keywords: int) -> Dict[str, Any]:
+        return {
+            "text": text[:2000],
+            "max_keywords": max_keywords
+        }
+    
+    async def generate_anchor_text_llm(
+        self,
+        source_context: str,
+        target_page_title: str,
+        target_page_description: str,
+        keywords: List[str],
+        correlation_id: Optional[str] = None
+    ) -> str:
+        result = await self._call_semantic_service(
+            "/internal/content/generate-anchor",
+            self._anchor_payload(
+                source_context,
+                target_page_title,
+                target_page_description,
+                keywords
+            ),
+            correlation_id,
+            use_cache=True
+        )
+        return result.get("anchor_text", "")
+    
+    async def generate_anchor_text_llm_batch(
+        self,
+        items: List[Dict[str, Any]],
+        correlation_id: Optional[str] = None
+    ) -> List[str]:
+        result = await self._call_semantic_service(
+            "/internal/content/generate-anchor-batch",
+            {
+                "items": [
+                    self._anchor_payload(
+                        item["source_context"],
+                        item["target_page_title"],
+                        item["target_page_description"],
+                        item["keywords"]
+                    )
+                    for item in items
+                ]
+            },
+            correlation_id,
+            use_cache=True
+        )
+        anchors = result.get("anchors", [])
+        if len(anchors) != len(items):
+            raise ValueError(
+                f"Semantic Service returned {len(anchors)} anchors for {len(items)} items"
+            )
+        return anchors
+    
+    def _anchor_payload(
+        self,
+        source_context: str,
+        target_page_title: str,
+        target_page_description: str,
+        keywords: List[str]
+    ) -> Dict[str, Any]:
+        return {
+            "source_context": source_context[:500],
+            "target_title": target_page_title[:200],
+            "target_description": target_page_description[:300],
+            "keywords": keywords[:5]
+        }
+    
+    async def _generate_anchors(
+        self,
+        items: List[Dict[str, Any]],
+        correlation_id: Optional[str] = None
+    ) -> List[Union[str, Exception]]:
+        if not items:
+            return []
+        
+        if self._anchor_batch_supported:
+            try:
+                return await self.generate_anchor_text_llm_batch(items, correlation_id)
+            except Exception as e:
+                logger.warning(
+                    f"Batch anchor generation failed, falling back to per-link calls: {e}",
+                    extra={"correlation_id": correlation_id}
+                )
+                interlink_errors_total.labels(error_type='anchor_batch').inc()
+                if _is_missing_endpoint(e):
+                    self._anchor_batch_supported = False
+        
+        return await asyncio.gather(
+            *[
+                self.generate_anchor_text_llm(correlation_id=correlation_id, **item)
+                for item in items
+            ],
+            return_exceptions=True
+        )
+    
+    def extract_sentences_with_keywords(
+        self,
+        content: str,
+        keywords: List[str],
+        max_sentences: int = 5
+    ) -> List[str]:
+        sentences = SENTENCE_SPLIT_RE.split(content)
+        sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
+        
+        lowered_keywords = [kw.lower() for kw in keywords]
+        
+        scored_sentences = []
+        for sentence in sentences:
+            lowered_sentence = sentence.lower()
+            score = sum(1 for kw in lowered_keywords if kw in lowered_sentence)
+            if score > 0:
+                scored_sentences.append((sentence, score))
+        
+        scored_sentences.sort(key=lambda x: x[1], reverse=True)
+        return [s[0] for s in scored_sentences[:max_sentences]]
+    
+    async def calculate_page_relevance(
+        self,
+        source_page: Dict[str, Any],
+        target_page: Dict[str, Any],
+        correlation_id: Optional[str] = None
+    ) -> float:
+        source_text = self._page_summary_text(source_page)
+        target_text = self._page_summary_text(target_page)
+        
+        if not source_text.strip() or not target_text.strip():
+            return 0.0
+        
+        try:
+            similarity = await self.calculate_semantic_similarity(
+                source_text,
+                target_text,
+                correlation_id
+            )
+            return similarity
+        except Exception as e:
+            logger.error(
+                f"Failed to calculate semantic similarity: {e}",
+                extra={"correlation_id": correlation_id}
+            )
+            interlink_errors_total.labels(error_type='similarity_calculation').inc()
+            return 0.0
+    
+    def _page_summary_text(self, page: Dict[str, Any]) -> str:
+        return f"{page.get('title', '')} {page.get('description', '')} {page.get('h1', '')}"
+    
+    async def _score_candidates(
+        self,
+        source_page: Dict[str, Any],
+        candidates: List[Dict[str, Any]],
+        correlation_id: Optional[str] = None
+    ) -> List[float]:
+        source_text = self._page_summary_text(source_page)
+        target_texts = [self._page_summary_text(candidate) for candidate in candidates]
+        
+        scores = [0.0] * len(candidates)
+        
+        if not source_text.strip():
+            return scores
+        
+        indexes = [i for i, text in enumerate(target_texts) if text.strip()]
+        if not indexes:
+            return scores
+        
+        batch_scores = None
+        
+        if self._similarity_batch_supported:
+            try:
+                batch_scores = await self.calculate_semantic_similarity_batch(
+                    source_text,
+                    [target_texts[i] for i in indexes],
+                    correlation_id
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batch similarity failed, falling back to per-page calls: {e}",
+                    extra={"correlation_id": correlation_id}
+                )
+                interlink_errors_total.labels(error_type='similarity_batch').inc()
+                # Only a missing endpoint disables the batch path; any other
+                # failure falls back for this call alone.
+                if _is_missing_endpoint(e):
+                    self._similarity_batch_supported = False
+        
+        if batch_scores is None:
+            semaphore = asyncio.Semaphore(settings.INTERLINK_SIMILARITY_CONCURRENCY)
+            
+            async def _score(candidate: Dict[str, Any]) -> float:
+                async with semaphore:
+                    return await self.calculate_page_relevance(
+                        source_page,
+                        candidate,
+                        correlation_id
+                    )
+            
+            batch_scores = await asyncio.gather(*[_score(candidates[i]) for i in indexes])
+        
+        for i, score in zip(indexes, batch_scores):
+            scores[i] = score
+        
+        return scores
+    
+    def _is_circular_link(self, source_url: str, target_url: str) -> bool:
+        targets = self.link_graph.get(target_url)
+        return targets is not None and source_url in targets
+    
+    def _add_to_graph(self, source_url: str, target_url: str):
+        self.link_graph.setdefault(source_url, set()).add(target_url)
+    
+    async def find_relevant_pages(
+        self,
+        source_page: Dict[str, Any],
+        candidate_pages: List[Dict[str, Any]],
+        correlation_id: Optional[str] = None
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        source_url = source_page["url"]
+        source_netloc = _netloc(source_url)
+        
+        candidates = [
+            candidate
+            for candidate in candidate_pages
+            if candidate["url"] != source_url
+            and _netloc(candidate["url"]) == source_netloc
+            and not self._is_circular_link(source_url, candidate["url"])
+        ]
+        
+        scores = await self._score_candidates(source_page, candidates, correlation_id)
+        
+        relevant_pages = [
+            (candidate, relevance)
+            for candidate, relevance in zip(candidates, scores)
+            if relevance >= self.min_relevance_score
+        ]
+        
+        relevant_pages.sort(key=lambda x: x[1], reverse=True)
+        
+        return relevant_pages[:self.max_links_per_page]
+    
+    def _is_same_domain(self, url1: str, url2: str) -> bool:
+        return _netloc(url1) == _netloc(url2)
+    
+    def _calculate_impact_score(
+        self,
+        relevance_score: float,
+        page_importance: float,
+        keyword_overlap: int
+    ) -> float:
+        keyword_score = min(keyword_overlap / 10.0, 1.0)
+        
+        impact = (
+            relevance_score * 0.5 +
+            page_importance * 0.3 +
+            keyword_score * 0.2
+        )
+        
+        return round(impact, 3)
+    
+    async def generate_interlinks_for_page(
+        self,
+        project_id: str,
+        source_url: str,
+        correlation_id: Optional[str] = None
+    ) -> List[InternalLink]:
+        logger.info(
+            f"Generating interlinks for page",
+            extra={"project_id": project_id, "url": source_url, "correlation_id": correlation_id}
+        )
+        
+        try:
+            source_content = await self.get_page_content(project_id, source_url)
+            
+            content_word_count = len(source_content.get("content", "").split())
+            if content_word_count < self.min_content_words:
+                logger.warning(
+                    f"Page {source_url} has insufficient content ({content_word_count} words)",
+                    extra={"correlation_id": correlation_id}
+                )
+                return []
+            
+            all_pages = await self.get_project_pages(project_id)
+            
+            relevant_pages = await self.find_relevant_pages(
+                source_content,
+                all_pages,
+                correlation_id
+            )
+            
+            if not relevant_pages:
+                logger.info(f"No relevant pages found for {source_url}")
+                return []
+            
+            source_keywords = await self.extract_keywords(
+                source_content.get("content", ""),
+                max_keywords=20,
+                correlation_id=correlation_id
+            )
+            
+            targets_keywords = await self.extract_keywords_many(
+                [target_page.get("content", "") for target_page, _ in relevant_pages],
+                max_keywords=10,
+                correlation_id=correlation_id
+            )
+            
+            prepared = []
+            
+            for (target_page, relevance_score), target_keywords in zip(relevant_pages, targets_keywords):
+                if isinstance(target_keywords, Exception):
+                    self._log_link_failure(target_page, target_keywords, correlation_id)
+                    continue
+                
+                common_keywords, context = self._select_link_context(
+                    source_content,
+                    source_keywords,
+                    target_keywords
+                )
+                prepared.append((target_page, relevance_score, common_keywords, context))
+            
+            anchors = await self._generate_anchors(
+                [
+                    {
+                        "source_context": context,
+                        "target_page_title": target_page.get("title", ""),
+                        "target_page_description": target_page.get("description", ""),
+                        "keywords": common_keywords
+                    }
+                    for target_page, _, common_keywords, context in prepared
+                ],
+                correlation_id
+            )
+            
+            interlinks = []
+            
+            for (target_page, relevance_score, common_keywords, context), anchor_text in zip(prepared, anchors):
+                if isinstance(anchor_text, Exception):
+                    self._log_link_failure(target_page, anchor_text, correlation_id)
+                    continue
+                
+                if self._is_circular_link(source_url, target_page["url"]):
+                    logger.debug(f"Skipping circular link: {source_url} -> {target_page['url']}")
+                    continue
+                
+                interlinks.append(self._make_interlink(
+                    source_url,
+                    source_content,
+                    target_page,
+                    relevance_score,
+                    common_keywords,
+                    context,
+                    anchor_text
+                ))
+                
+                self._add_to_graph(source_url, target_page["url"])
+                
+                interlinks_generated_total.labels(project_id=project_id).inc()
+            
+            logger.info(
+                f"Generated {len(interlinks)} interlinks for {source_url}",
+                extra={"correlation_id": correlation_id}
+            )
+            
+            return interlinks
+            
+        except Exception as e:
+            logger.error(
+                f"Failed to generate interlinks for page {source_url}: {e}",
+                extra={"correlation_id": correlation_id}
+            )
+            interlink_errors_total.labels(error_type='page_processing').inc()
+            raise
+    
+    def _select_link_context(
+        self,
+        source_content: Dict[str, Any],
+        source_keywords: List[str],
+        target_keywords: List[str]
+    ) -> Tuple[List[str], str]:
+        common_keywords = list(set(source_keywords) & set(target_keywords))
+        
+        if not common_keywords:
+            common_keywords = target_keywords[:3]
+        
+        context_sentences = self.extract_sentences_with_keywords(
+            source_content.get("content", ""),
+            common_keywords,
+            max_sentences=3
+        )
+        
+        if context_sentences:
+            context = " ".join(context_sentences)[:500]
+        else:
+            context = source_content.get("content", "")[:500]
+        
+        return common_keywords, context
+    
+    def _make_interlink(
+        self,
+        source_url: str,
+        source_content: Dict[str, Any],
+        target_page: Dict[str, Any],
+        relevance_score: float,
+        common_keywords: List[str],
+        context: str,
+        anchor_text: str
+    ) -> InternalLink:
+        anchor_text = self._sanitize_anchor_text(anchor_text)
+        
+        if len(anchor_text) < self.min_anchor_length:
+            anchor_text = target_page.get("title", "")[:self.max_anchor_length]
+        
+        page_importance = source_content.get("importance", 0.5)
+        impact_score = self._calculate_impact_score(
+            relevance_score,
+            page_importance,
+            len(common_keywords)
+        )
+        
+        return InternalLink(
+            source_url=source_url,
+            target_url=target_page["url"],
+            anchor_text=anchor_text,
+            context=context[:200],
+            relevance_score=relevance_score,
+            position="body",
+            impact_score=impact_score
+        )
+    
+    def _log_link_failure(
+        self,
+        target_page: Dict[str, Any],
+        error: Exception,
+        correlation_id: Optional[str] = None
+    ):
+        logger.error(
+            f"Failed to generate interlink for {target_page['url']}: {error}",
+            extra={"correlation_id": correlation_id}
+        )
+        interlink_errors_total.labels(error_type='link_generation').inc()
+    
+    def _sanitize_anchor_text(self, text: str) -> str:
+        text = text.strip()
+        
+        text = WHITESPACE_RE.sub(' ', text)
+        text = ANCHOR_STRIP_RE.sub('', text)
+        
+        if len(text) > self.max_anchor_length:
+            text = text[:self.max_anchor_length].rsplit(' ', 1)[0]
+        
+        return text
+    
+    async def create_interlink_tasks(
+        self,
+        project_id: str,
+        interlinks: List[InternalLink],
+        correlation_id: Optional[str] = None
+    ) -> List[str]:
+        
+        links_by_source = defaultdict(list)
+        for link in interlinks:
+            links_by_source[link.source_url].append(link)
+        
+        tasks_to_add = []
+        created_at = datetime.utcnow().isoformat()
+        
+        for source_url, links in links_by_source.items():
+            avg_impact = sum(link.impact_score for link in links) / len(links)
+            
+            task = Task(
+                project_id=project_id,
+                task_type=TaskType.ADD_INTERNAL_LINKS,
+                status=TaskStatus.PENDING,
+                url=source_url,
+                metadata={
+                    "interlinks": [
+                        {
+                            "target_url": link.target_url,
+                            "anchor_text": link.anchor_text,
+                            "context": link.context,
+                            "relevance_score": link.relevance_score,
+                            "position": link.position,
+                            "impact_score": link.impact_score
+                        }
+                        for link in links
+                    ],
+                    "total_links": len(links),
+                    "average_impact_score": round(avg_impact, 3),
+                    "correlation_id": correlation_id,
+                    "created_at": created_at
+                }
+            )
+            
+            tasks_to_add.append(task)
+        
+        self.db.add_all(tasks_to_add)
+        self.db.flush()
+        
+        task_ids = [str(task.id) for task in tasks_to_add]
+        
+        try:
+            await publish_task_created_events_batch(
+                db=self.db,
+                payloads=[
+                    {
+                        "task_id": str(task.id),
+                        "project_id": project_id,
+                        "task_type": TaskType.ADD_INTERNAL_LINKS,
+                        "url": task.url,
+                        "metadata": task.metadata
+                    }
+                    for task in tasks_to_add
+                ],
+                correlation_id=correlation_id
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to publish TaskCreated events: {e}",
+                extra={"task_ids": task_ids, "correlation_id": correlation_id}
+            )
+        
+        self.db.commit()
+        
+        logger.info(
+            f"Created {len(task_ids)} interlink tasks for project {project_id}",
+            extra={"correlation_id": correlation_id}
+        )
+        
+        return task_ids
+    
+    async def generate_interlinks_for_project(
+        self,
+        project_id: str,
+        max_pages: Optional[int] = None,
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Generate interlinks for entire project"""
+        with interlink_generation_duration.labels(project_id=project_id).time():
+            return await self._generate_interlinks_for_project(
+                project_id,
+                max_pages,
+                correlation_id
+            )
+    
+    async def _generate_interlinks_for_project(
+        self,
+        project_id: str,
+        max_pages: Optional[int] = None,
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        logger.info(
+            f"Starting interlink generation for project {project_id}",
+            extra={"correlation_id": correlation_id, "max_pages": max_pages}
+        )
+        
+        project = self.db.query(Project).filter(Project.id == project_id).first()
+        if not project:
+            raise ValueError(f"Project {project_id} not found")
+        
+        self.link_graph.clear()
+        self._project_pages_cache.clear()
+        self._page_content_cache.clear()
+        self._page_keywords_cache.clear()
+        
+        all_pages = await self.get_project_pages(project_id)
+        
+        if max_pages:
+            all_pages = all_pages[:max_pages]
+        
+        logger.info(f"Processing {len(all_pages)} pages for project {project_id}")
+        
+        all_interlinks = []
+        processed_pages = 0
+        failed_pages = 0
+        
+        semaphore = asyncio.Semaphore(settings.INTERLINK_PAGE_CONCURRENCY)
+        
+        async def _process_page(page: Dict[str, Any]) -> List[InternalLink]:
+            async with semaphore:
+                return await self.generate_interlinks_for_page(
+                    project_id,
+                    page["url"],
+                    correlation_id
+                )
+        
+        results = await asyncio.gather(
+            *[_process_page(page) for page in all_pages],
+            return_exceptions=True
+        )
+        
+        for page, interlinks in zip(all_pages, results):
+            if isinstance(interlinks, Exception):
+                logger.error(
+                    f"Failed to generate interlinks for page {page['url']}: {interlinks}",
+                    extra={"correlation_id": correlation_id}
+                )
+                failed_pages += 1
+                continue
+            
+            all_interlinks.extend(interlinks)
+            processed_pages += 1
+        
+        # Create tasks and publish events
+        task_ids = []
+        if all_interlinks:
+            task_ids = await self.create_interlink_tasks(
+                project_id,
+                all_interlinks,
+                correlation_id
+            )
+        
+        result = {
+            "project_id": project_id,
+            "total_interlinks": len(all_interlinks),
+            "pages_processed": processed_pages,
+            "pages_failed": failed_pages,
+            "tasks_created": len(task_ids),
+            "task_ids": task_ids,
+            "correlation_id": correlation_id,
+            "completed_at": datetime.utcnow().isoformat()
+        }
+        
+        logger.info(
+            f"Completed interlink generation for project {project_id}",
+            extra=result
+        )
+        
+        return result
+
+
+_shared_http_client: Optional[httpx.AsyncClient] = None
+_shared_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    global _shared_http_client, _shared_http_client_loop
+    
+    loop = asyncio.get_running_loop()
+    # Pooled connections belong to the loop that opened them; callers such as
+    # asyncio.run() in scripts start a new loop per call.
+    if (
+        _shared_http_client is None
+        or _shared_http_client.is_closed
+        or _shared_http_client_loop is not loop
+    ):
+        _shared_http_client = httpx.AsyncClient(timeout=AUDIT_TIMEOUT, limits=HTTP_LIMITS)
+        _shared_http_client_loop = loop
+    return _shared_http_client
+
+
+def _get_generator(db: Session, redis_client: Optional[redis.Redis] = None) -> InterlinkGenerator:
+    # Only the HTTP client and the Redis pool are shared. Session, caches and
+    # link graph are per call, so concurrent runs cannot touch each other's state.
+    return InterlinkGenerator(
+        db,
+        redis_client or get_redis_client(),
+        http_client=_get_shared_http_client()
+    )
+
+
+async def shutdown():
+    global _shared_http_client, _shared_http_client_loop
+    
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+    _shared_http_client = None
+    _shared_http_client_loop = None
+    await close_redis_pool()
+
+
+async def generate_interlinks(
+    db: Session,
+    project_id: str,
+    max_pages: Optional[int] = None,
+    correlation_id: Optional[str] = None,
+    redis_client: Optional[redis.Redis] = None
+) -> Dict[str, Any]:
+    
+    generator = _get_generator(db, redis_client)
+    return await generator.generate_interlinks_for_project(
+        project_id,
+        max_pages,
+        correlation_id
+    )
+
+
+async def generate_interlinks_for_page(
+    db: Session,
+    project_id: str,
+    url: str,
+    correlation_id: Optional[str] = None,
+    redis_client: Optional[redis.Redis] = None
+) -> List[InternalLink]:
+    
+    generator = _get_generator(db, redis_client)
+    return await generator.generate_interlinks_for_page(
+        project_id,
+        url,
+        correlation_id
+    )
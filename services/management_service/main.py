@@ -1,197 +1,253 @@
-from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import uvicorn
-import asyncio
-import uuid
-
-from app.core.config import settings
-from app.core.logging import setup_logging, logger
-from app.db.session import engine, SessionLocal
-from app.api.endpoints import projects, tasks, hitl, internal
-from app.events.consumers import start_consumers, stop_consumers
-from app.events.publishers import check_rabbitmq_connection
-from app.scheduler.beat import start_scheduler, stop_scheduler
-
-
-setup_logging()
-
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    logger.info("Starting Management Service")
-    
-    consumer_task = asyncio.create_task(start_consumers())
-    
-    scheduler_task = asyncio.create_task(start_scheduler())
-    
-    logger.info("Management Service started successfully")
-    
-    yield
-    
-    logger.info("Shutting down Management Service")
-    
-    await stop_consumers()
-    consumer_task.cancel()
-    
-    await stop_scheduler()
-    scheduler_task.cancel()
-    
-    logger.info("Management Service stopped")
-
-
-app = FastAPI(
-    title="Management Service",
-    description="Orchestration, projects, tasks, HITL workflow, saga coordination",
-    version="1.0.0",
-    lifespan=lifespan,
-    docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
-    redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
-)
-
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
-@app.middleware("http")
-async def correlation_id_middleware(request: Request, call_next):
-    correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
-    request.state.correlation_id = correlation_id
-    
-    response = await call_next(request)
-    response.headers["X-Correlation-ID"] = correlation_id
-    
-    return response
-
-
-@app.middleware("http")
-async def logging_middleware(request: Request, call_next):
-    logger.info(
-        f"Request started",
-        extra={
-            "method": request.method,
-            "path": request.url.path,
-            "correlation_id": getattr(request.state, "correlation_id", None),
-        }
-    )
-    
-    response = await call_next(request)
-    
-    logger.info(
-        f"Request completed",
-        extra={
-            "method": request.method,
-            "path": request.url.path,
-            "status_code": response.status_code,
-            "correlation_id": getattr(request.state, "correlation_id", None),
-        }
-    )
-    
-    return response
-
-
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(
-        f"Unhandled exception: {str(exc)}",
-        extra={
-            "path": request.url.path,
-            "correlation_id": getattr(request.state, "correlation_id", None),
-        },
-        exc_info=True,
-    )
-    
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "detail": "Internal server error",
-            "correlation_id": getattr(request.state, "correlation_id", None),
-        },
-    )
-
-
-@app.get("/health", status_code=status.HTTP_200_OK)
-async def health_check():
-    return {
-        "status": "healthy",
-        "service": "management-service",
-        "version": "1.0.0",
-    }
-
-
-@app.get("/health/ready", status_code=status.HTTP_200_OK)
-async def readiness_check():
-    db_healthy = False
-    rabbitmq_healthy = False
-    
-    db = SessionLocal()
-    try:
-        db.execute("SELECT 1")
-        db_healthy = True
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-    finally:
-        db.close()
-    
-    try:
-        rabbitmq_healthy = await check_rabbitmq_connection()
-    except Exception as e:
-        logger.error(f"RabbitMQ health check failed: {e}")
-    
-    if not db_healthy or not rabbitmq_healthy:
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "status": "unhealthy",
-                "database": "up" if db_healthy else "down",
-                "rabbitmq": "up" if rabbitmq_healthy else "down",
-            },
-        )
-    
-    return {
-        "status": "ready",
-        "database": "up",
-        "rabbitmq": "up",
-    }
-
-
-app.include_router(
-    projects.router,
-    prefix="/api/v1/projects",
-    tags=["projects"],
-)
-
-app.include_router(
-    tasks.router,
-    prefix="/api/v1/tasks",
-    tags=["tasks"],
-)
-
-app.include_router(
-    hitl.router,
-    prefix="/api/v1/hitl",
-    tags=["hitl"],
-)
-
-app.include_router(
-    internal.router,
-    prefix="/internal",
-    tags=["internal"],
-)
-
-
-if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host=settings.HOST,
-        port=settings.PORT,
-        reload=settings.ENVIRONMENT == "development",
-        log_level=settings.LOG_LEVEL.lower(),
-    )
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from anyio import to_thread
+from fastapi import FastAPI, Request, status
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+import uvicorn
+import asyncio
+import time
+from typing import Tuple
+
+from app.core.config import settings
+from app.core.logging import setup_logging, logger
+from app.db.session import engine
+from app.api.endpoints import projects, tasks, hitl, internal
+from app.events.consumers import start_consumers, stop_consumers
+from app.events.publishers import check_rabbitmq_connection
+from app.scheduler.beat import start_scheduler, stop_scheduler
+from config.logging_config import setup_request_logging
+from services.management_service.middleware import ObservabilityMiddleware
+from services.management_service.interlinkgenerator import shutdown as shutdown_interlinks
+from services.management_service.orchestrator import close_http_client
+
+
+setup_logging()
+setup_request_logging()
+
+
+BACKGROUND_WORKERS_LOCK_ID = 804001
+
+
+def _acquire_leader_lock():
+    connection = engine.connect()
+    try:
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(:lock_id)"),
+            {"lock_id": BACKGROUND_WORKERS_LOCK_ID},
+        ).scalar()
+        connection.commit()
+    except Exception:
+        connection.close()
+        raise
+    
+    if not acquired:
+        connection.close()
+        return None
+    return connection
+
+
+def _release_leader_lock(connection):
+    try:
+        connection.execute(
+            text("SELECT pg_advisory_unlock(:lock_id)"),
+            {"lock_id": BACKGROUND_WORKERS_LOCK_ID},
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Starting Management Service")
+    
+    # Sync endpoints run on AnyIO's limiter, asyncio.to_thread on the loop's
+    # default executor; size both the same.
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREAD_POOL_LIMIT
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.THREAD_POOL_LIMIT)
+    )
+    
+    # With several workers only the one holding the advisory lock runs the
+    # consumers and the scheduler; the rest serve HTTP only.
+    leader_connection = await asyncio.to_thread(_acquire_leader_lock)
+    
+    if leader_connection is not None:
+        consumer_task = asyncio.create_task(start_consumers())
+        
+        scheduler_task = asyncio.create_task(start_scheduler())
+    else:
+        logger.info("Consumers and scheduler are run by another worker")
+    
+    logger.info("Management Service started successfully")
+    
+    yield
+    
+    logger.info("Shutting down Management Service")
+    
+    if leader_connection is not None:
+        await stop_consumers()
+        consumer_task.cancel()
+        
+        await stop_scheduler()
+        scheduler_task.cancel()
+        
+        await asyncio.to_thread(_release_leader_lock, leader_connection)
+    
+    await shutdown_interlinks()
+    await close_http_client()
+    
+    logger.info("Management Service stopped")
+
+
+app = FastAPI(
+    title="Management Service",
+    description="Orchestration, projects, tasks, HITL workflow, saga coordination",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
+    redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
+)
+
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+app.add_middleware(ObservabilityMiddleware)
+
+
+@app.exception_handler(Exception)
+async def global_exception_handler(request: Request, exc: Exception):
+    logger.error(
+        f"Unhandled exception: {str(exc)}",
+        extra={
+            "path": request.url.path,
+            "correlation_id": getattr(request.state, "correlation_id", None),
+        },
+        exc_info=True,
+    )
+    
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "detail": "Internal server error",
+            "correlation_id": getattr(request.state, "correlation_id", None),
+        },
+    )
+
+
+@app.get("/health", status_code=status.HTTP_200_OK)
+async def health_check():
+    return {
+        "status": "healthy",
+        "service": "management-service",
+        "version": "1.0.0",
+    }
+
+
+READINESS_CACHE_TTL_SECONDS = 1.0
+
+_readiness: Tuple[float, bool, bool] = (0.0, False, False)
+
+
+def _ping_database():
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+async def _check_database() -> bool:
+    try:
+        await asyncio.to_thread(_ping_database)
+        return True
+    except Exception as e:
+        logger.error(f"Database health check failed: {e}")
+        return False
+
+
+async def _check_rabbitmq() -> bool:
+    try:
+        return await check_rabbitmq_connection()
+    except Exception as e:
+        logger.error(f"RabbitMQ health check failed: {e}")
+        return False
+
+
+async def _probe_dependencies() -> Tuple[bool, bool]:
+    global _readiness
+    
+    # Probes arriving within the TTL reuse the last result.
+    expires_at, db_healthy, rabbitmq_healthy = _readiness
+    if time.monotonic() < expires_at:
+        return db_healthy, rabbitmq_healthy
+    
+    db_healthy, rabbitmq_healthy = await asyncio.gather(_check_database(), _check_rabbitmq())
+    _readiness = (time.monotonic() + READINESS_CACHE_TTL_SECONDS, db_healthy, rabbitmq_healthy)
+    return db_healthy, rabbitmq_healthy
+
+
+@app.get("/health/ready", status_code=status.HTTP_200_OK)
+async def readiness_check():
+    db_healthy, rabbitmq_healthy = await _probe_dependencies()
+    
+    if not db_healthy or not rabbitmq_healthy:
+        return ORJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "status": "unhealthy",
+                "database": "up" if db_healthy else "down",
+                "rabbitmq": "up" if rabbitmq_healthy else "down",
+            },
+        )
+    
+    return {
+        "status": "ready",
+        "database": "up",
+        "rabbitmq": "up",
+    }
+
+
+app.include_router(
+    projects.router,
+    prefix="/api/v1/projects",
+    tags=["projects"],
+)
+
+app.include_router(
+    tasks.router,
+    prefix="/api/v1/tasks",
+    tags=["tasks"],
+)
+
+app.include_router(
+    hitl.router,
+    prefix="/api/v1/hitl",
+    tags=["hitl"],
+)
+
+app.include_router(
+    internal.router,
+    prefix="/internal",
+    tags=["internal"],
+)
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "app.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        reload=settings.ENVIRONMENT == "development",
+        log_level=settings.LOG_LEVEL.lower(),
+        loop="uvloop",
+        http="httptools",
+        ws="none",
+        workers=settings.UVICORN_WORKERS,
+    )
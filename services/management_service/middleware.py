@@ -0,0 +1,68 @@
+import random
+import time
+import uuid
+
+from services.management_service.config import settings
+from config.logging_config import get_logger, bind_request_context, clear_request_context
+
+logger = get_logger(__name__)
+
+CORRELATION_ID_HEADER = b"x-correlation-id"
+
+
+class ObservabilityMiddleware:
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        correlation_id = None
+        for name, value in scope["headers"]:
+            if name == CORRELATION_ID_HEADER:
+                correlation_id = value.decode("latin-1")
+                break
+        if not correlation_id:
+            correlation_id = str(uuid.uuid4())
+        
+        # Request.state reads from here, so handlers keep seeing
+        # request.state.correlation_id.
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+        correlation_header = (CORRELATION_ID_HEADER, correlation_id.encode("latin-1"))
+        status_code = None
+        
+        async def send_with_correlation_id(message):
+            nonlocal status_code
+            
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", ()), correlation_header]
+            await send(message)
+        
+        token = bind_request_context(
+            correlation_id=correlation_id,
+            method=scope["method"],
+            path=scope["path"],
+        )
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_correlation_id)
+            duration = time.perf_counter() - started
+            
+            # Errors and slow requests are always logged, healthy fast ones
+            # only at LOG_SAMPLE_RATE.
+            if (
+                status_code is None
+                or status_code >= 400
+                or duration > settings.LOG_SLOW_REQUEST_SECONDS
+                or random.random() < settings.LOG_SAMPLE_RATE
+            ):
+                logger.info(
+                    "Request completed",
+                    extra={"status_code": status_code, "duration_ms": round(duration * 1000, 2)}
+                )
+        finally:
+            clear_request_context(token)
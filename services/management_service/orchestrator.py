@@ -1,475 +1,587 @@
-import asyncio
-from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-import httpx
-from enum import Enum
-import uuid
-
-from app.core.config import settings
-from app.core.logging import logger
-from app.db.models import Project, Task, TaskStatus, HITLDecision, HITLStatus, SagaExecution
-from app.events.publishers import publish_event
-from tenacity import retry, stop_after_attempt, wait_exponential
-
-
-class SagaState(str, Enum):
-    INITIATED = "initiated"
-    CRAWLING = "crawling"
-    CRAWL_COMPLETED = "crawl_completed"
-    CALCULATING_SCORES = "calculating_scores"
-    SCORES_COMPLETED = "scores_completed"
-    GENERATING_CONTENT = "generating_content"
-    CONTENT_GENERATED = "content_generated"
-    AWAITING_HITL = "awaiting_hitl"
-    HITL_APPROVED = "hitl_approved"
-    HITL_REJECTED = "hitl_rejected"
-    APPLYING_CHANGES = "applying_changes"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    COMPENSATING = "compensating"
-
-
-class OptimizationSaga:
-    def __init__(self, project_id: str, url: str, task_id: Optional[str] = None):
-        self.project_id = project_id
-        self.url = url
-        self.task_id = task_id
-        self.saga_id = str(uuid.uuid4())
-        self.state = SagaState.INITIATED
-        self.context: Dict[str, Any] = {}
-        self.correlation_id = str(uuid.uuid4())
-        
-    async def execute(self) -> bool:
-        from app.db.session import SessionLocal
-        
-        db = SessionLocal()
-        
-        try:
-            await self._save_saga_state(db)
-            
-            async with httpx.AsyncClient(timeout=settings.SERVICE_REQUEST_TIMEOUT) as client:
-                self.client = client
-                
-                await self._run_crawl()
-                await self._wait_for_crawl_completion()
-                await self._save_saga_state(db)
-                
-                await self._trigger_scores_calculation()
-                await self._wait_for_scores_completion()
-                await self._save_saga_state(db)
-                
-                await self._trigger_content_generation()
-                await self._wait_for_content_generation()
-                await self._save_saga_state(db)
-                
-                hitl_decision = await self._create_hitl_decision(db)
-                approved = await self._wait_for_hitl_decision(db, hitl_decision.id)
-                
-                if not approved:
-                    self.state = SagaState.HITL_REJECTED
-                    await self._update_task_status(db, TaskStatus.CANCELLED)
-                    await self._publish_completion_event(success=False, reason="HITL rejected")
-                    return False
-                
-                await self._apply_changes()
-                await self._wait_for_changes_applied()
-                
-                self.state = SagaState.COMPLETED
-                await self._update_task_status(db, TaskStatus.COMPLETED)
-                await self._save_saga_state(db)
-                await self._publish_completion_event(success=True)
-                
-                return True
-                
-        except Exception as e:
-            logger.error(
-                f"Saga failed for project {self.project_id}, url {self.url}: {e}",
-                extra={"correlation_id": self.correlation_id, "saga_id": self.saga_id},
-                exc_info=True
-            )
-            self.state = SagaState.FAILED
-            await self._compensate()
-            await self._update_task_status(db, TaskStatus.FAILED)
-            await self._save_saga_state(db)
-            await self._publish_completion_event(success=False, reason=str(e))
-            return False
-        finally:
-            db.close()
-    
-    @retry(stop=stop_after_attempt(settings.SAGA_RETRY_MAX_ATTEMPTS), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def _run_crawl(self):
-        self.state = SagaState.CRAWLING
-        
-        response = await self.client.post(
-            f"{settings.AUDIT_SERVICE_URL}/internal/crawl",
-            json={
-                "project_id": self.project_id,
-                "urls": [self.url],
-                "options": {
-                    "js_render": True,
-                    "priority": "high"
-                }
-            },
-            headers={
-                "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                "X-Correlation-ID": self.correlation_id
-            }
-        )
-        response.raise_for_status()
-        
-        result = response.json()
-        self.context["crawl_id"] = result["crawl_id"]
-        logger.info(
-            f"Crawl initiated: {self.context['crawl_id']}",
-            extra={"correlation_id": self.correlation_id, "saga_id": self.saga_id}
-        )
-    
-    async def _wait_for_crawl_completion(self):
-        timeout = datetime.utcnow() + timedelta(minutes=settings.SAGA_TIMEOUT_MINUTES)
-        
-        while datetime.utcnow() < timeout:
-            response = await self.client.get(
-                f"{settings.AUDIT_SERVICE_URL}/internal/crawl/{self.context['crawl_id']}",
-                headers={
-                    "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                    "X-Correlation-ID": self.correlation_id
-                }
-            )
-            response.raise_for_status()
-            
-            status = response.json()["status"]
-            
-            if status == "completed":
-                self.state = SagaState.CRAWL_COMPLETED
-                self.context["crawl_result"] = response.json()
-                return
-            elif status == "failed":
-                raise Exception(f"Crawl failed: {self.context['crawl_id']}")
-            
-            await asyncio.sleep(5)
-        
-        raise TimeoutError("Crawl timeout")
-    
-    @retry(stop=stop_after_attempt(settings.SAGA_RETRY_MAX_ATTEMPTS), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def _trigger_scores_calculation(self):
-        self.state = SagaState.CALCULATING_SCORES
-        
-        ffscore_response = await self.client.post(
-            f"{settings.SEMANTIC_SERVICE_URL}/internal/ff-score/calculate",
-            json={
-                "project_id": self.project_id,
-                "url": self.url,
-                "crawl_id": self.context["crawl_id"]
-            },
-            headers={
-                "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                "X-Correlation-ID": self.correlation_id
-            }
-        )
-        ffscore_response.raise_for_status()
-        self.context["ffscore_task_id"] = ffscore_response.json()["task_id"]
-        
-        eeat_response = await self.client.post(
-            f"{settings.SEMANTIC_SERVICE_URL}/internal/eeat-score/calculate",
-            json={
-                "project_id": self.project_id,
-                "url": self.url,
-                "crawl_id": self.context["crawl_id"]
-            },
-            headers={
-                "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                "X-Correlation-ID": self.correlation_id
-            }
-        )
-        eeat_response.raise_for_status()
-        self.context["eeat_task_id"] = eeat_response.json()["task_id"]
-    
-    async def _wait_for_scores_completion(self):
-        timeout = datetime.utcnow() + timedelta(minutes=settings.SAGA_TIMEOUT_MINUTES)
-        
-        ffscore_completed = False
-        eeat_completed = False
-        
-        while datetime.utcnow() < timeout:
-            if not ffscore_completed:
-                ff_response = await self.client.get(
-                    f"{settings.SEMANTIC_SERVICE_URL}/internal/ff-score/task/{self.context['ffscore_task_id']}",
-                    headers={
-                        "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                        "X-Correlation-ID": self.correlation_id
-                    }
-                )
-                ff_response.raise_for_status()
-                ff_data = ff_response.json()
-                
-                if ff_data["status"] == "completed":
-                    self.context["ffscore"] = ff_data["score"]
-                    ffscore_completed = True
-                elif ff_data["status"] == "failed":
-                    raise Exception("FF-Score calculation failed")
-            
-            if not eeat_completed:
-                eeat_response = await self.client.get(
-                    f"{settings.SEMANTIC_SERVICE_URL}/internal/eeat-score/task/{self.context['eeat_task_id']}",
-                    headers={
-                        "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                        "X-Correlation-ID": self.correlation_id
-                    }
-                )
-                eeat_response.raise_for_status()
-                eeat_data = eeat_response.json()
-                
-                if eeat_data["status"] == "completed":
-                    self.context["eeat_score"] = eeat_data["score"]
-                    eeat_completed = True
-                elif eeat_data["status"] == "failed":
-                    raise Exception("E-E-A-T calculation failed")
-            
-            if ffscore_completed and eeat_completed:
-                self.state = SagaState.SCORES_COMPLETED
-                return
-            
-            await asyncio.sleep(3)
-        
-        raise TimeoutError("Scores calculation timeout")
-    
-    @retry(stop=stop_after_attempt(settings.SAGA_RETRY_MAX_ATTEMPTS), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def _trigger_content_generation(self):
-        self.state = SagaState.GENERATING_CONTENT
-        
-        response = await self.client.post(
-            f"{settings.SEMANTIC_SERVICE_URL}/internal/content/generate",
-            json={
-                "project_id": self.project_id,
-                "url": self.url,
-                "crawl_id": self.context["crawl_id"],
-                "ffscore": self.context["ffscore"],
-                "eeat_score": self.context["eeat_score"]
-            },
-            headers={
-                "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                "X-Correlation-ID": self.correlation_id
-            }
-        )
-        response.raise_for_status()
-        
-        result = response.json()
-        self.context["content_generation_id"] = result["generation_id"]
-    
-    async def _wait_for_content_generation(self):
-        timeout = datetime.utcnow() + timedelta(minutes=settings.SAGA_TIMEOUT_MINUTES)
-        
-        while datetime.utcnow() < timeout:
-            response = await self.client.get(
-                f"{settings.SEMANTIC_SERVICE_URL}/internal/content/generation/{self.context['content_generation_id']}",
-                headers={
-                    "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                    "X-Correlation-ID": self.correlation_id
-                }
-            )
-            response.raise_for_status()
-            
-            status_data = response.json()
-            
-            if status_data["status"] == "completed":
-                self.state = SagaState.CONTENT_GENERATED
-                self.context["generated_content"] = status_data["content"]
-                return
-            elif status_data["status"] == "failed":
-                raise Exception("Content generation failed")
-            
-            await asyncio.sleep(3)
-        
-        raise TimeoutError("Content generation timeout")
-    
-    async def _create_hitl_decision(self, db: Session) -> HITLDecision:
-        self.state = SagaState.AWAITING_HITL
-        
-        crawl_data = self.context["crawl_result"]
-        old_content = {
-            "title": crawl_data.get("title"),
-            "description": crawl_data.get("description"),
-            "h1": crawl_data.get("h1"),
-            "schema_org": crawl_data.get("schema_org")
-        }
-        
-        new_content = self.context["generated_content"]
-        
-        decision = HITLDecision(
-            project_id=self.project_id,
-            task_id=self.task_id,
-            url=self.url,
-            change_type="content_update",
-            old_content=old_content,
-            new_content=new_content,
-            status=HITLStatus.PENDING,
-            expires_at=datetime.utcnow() + timedelta(hours=settings.HITL_TIMEOUT_HOURS),
-            metadata={
-                "saga_id": self.saga_id,
-                "correlation_id": self.correlation_id,
-                "ffscore": self.context.get("ffscore"),
-                "eeat_score": self.context.get("eeat_score")
-            }
-        )
-        
-        db.add(decision)
-        db.commit()
-        db.refresh(decision)
-        
-        await publish_event(
-            exchange="seo.management",
-            routing_key="management.hitl.approval_required",
-            event_type="HITLApprovalRequired",
-            payload={
-                "decision_id": str(decision.id),
-                "project_id": self.project_id,
-                "url": self.url,
-                "expires_at": decision.expires_at.isoformat(),
-                "correlation_id": self.correlation_id
-            }
-        )
-        
-        return decision
-    
-    async def _wait_for_hitl_decision(self, db: Session, decision_id: str) -> bool:
-        timeout = datetime.utcnow() + timedelta(hours=settings.HITL_TIMEOUT_HOURS)
-        
-        while datetime.utcnow() < timeout:
-            decision = db.query(HITLDecision).filter(HITLDecision.id == decision_id).first()
-            
-            if decision.status == HITLStatus.APPROVED:
-                self.state = SagaState.HITL_APPROVED
-                return True
-            elif decision.status == HITLStatus.REJECTED:
-                self.state = SagaState.HITL_REJECTED
-                return False
-            
-            await asyncio.sleep(5)
-            db.refresh(decision)
-        
-        raise TimeoutError("HITL decision timeout")
-    
-    @retry(stop=stop_after_attempt(settings.SAGA_RETRY_MAX_ATTEMPTS), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def _apply_changes(self):
-        self.state = SagaState.APPLYING_CHANGES
-        
-        response = await self.client.post(
-            f"{settings.CLIENT_GATEWAY_URL}/internal/changes/queue",
-            json={
-                "project_id": self.project_id,
-                "url": self.url,
-                "changes": self.context["generated_content"]
-            },
-            headers={
-                "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                "X-Correlation-ID": self.correlation_id
-            }
-        )
-        response.raise_for_status()
-        
-        result = response.json()
-        self.context["change_id"] = result["change_id"]
-    
-    async def _wait_for_changes_applied(self):
-        timeout = datetime.utcnow() + timedelta(minutes=settings.SAGA_TIMEOUT_MINUTES)
-        
-        while datetime.utcnow() < timeout:
-            response = await self.client.get(
-                f"{settings.CLIENT_GATEWAY_URL}/internal/changes/{self.context['change_id']}/status",
-                headers={
-                    "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                    "X-Correlation-ID": self.correlation_id
-                }
-            )
-            response.raise_for_status()
-            
-            status_data = response.json()
-            
-            if status_data["status"] == "applied":
-                return
-            elif status_data["status"] == "failed":
-                raise Exception("Changes application failed")
-            
-            await asyncio.sleep(5)
-        
-        raise TimeoutError("Changes application timeout")
-    
-    async def _compensate(self):
-        self.state = SagaState.COMPENSATING
-        logger.info(
-            f"Starting compensation for saga",
-            extra={
-                "correlation_id": self.correlation_id,
-                "saga_id": self.saga_id,
-                "project_id": self.project_id,
-                "url": self.url
-            }
-        )
-        
-        if "change_id" in self.context:
-            try:
-                async with httpx.AsyncClient(timeout=settings.SERVICE_REQUEST_TIMEOUT) as client:
-                    await client.post(
-                        f"{settings.CLIENT_GATEWAY_URL}/internal/changes/{self.context['change_id']}/rollback",
-                        headers={
-                            "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                            "X-Correlation-ID": self.correlation_id
-                        }
-                    )
-            except Exception as e:
-                logger.error(f"Compensation rollback failed: {e}", extra={"correlation_id": self.correlation_id})
-    
-    async def _update_task_status(self, db: Session, status: TaskStatus):
-        if self.task_id:
-            task = db.query(Task).filter(Task.id == self.task_id).first()
-            if task:
-                task.status = status
-                task.updated_at = datetime.utcnow()
-                db.commit()
-    
-    async def _save_saga_state(self, db: Session):
-        saga_execution = db.query(SagaExecution).filter(SagaExecution.saga_id == self.saga_id).first()
-        
-        if not saga_execution:
-            saga_execution = SagaExecution(
-                saga_id=self.saga_id,
-                project_id=self.project_id,
-                url=self.url,
-                task_id=self.task_id,
-                state=self.state,
-                context=self.context,
-                correlation_id=self.correlation_id
-            )
-            db.add(saga_execution)
-        else:
-            saga_execution.state = self.state
-            saga_execution.context = self.context
-            saga_execution.updated_at = datetime.utcnow()
-        
-        db.commit()
-    
-    async def _publish_completion_event(self, success: bool, reason: Optional[str] = None):
-        event_type = "OptimizationCompleted" if success else "OptimizationFailed"
-        
-        await publish_event(
-            exchange="seo.management",
-            routing_key=f"management.optimization.{'completed' if success else 'failed'}",
-            event_type=event_type,
-            payload={
-                "saga_id": self.saga_id,
-                "project_id": self.project_id,
-                "url": self.url,
-                "task_id": self.task_id,
-                "success": success,
-                "reason": reason,
-                "ffscore": self.context.get("ffscore"),
-                "eeat_score": self.context.get("eeat_score"),
-                "correlation_id": self.correlation_id
-            }
-        )
-
-
-async def run_optimization_cycle(project_id: str, url: str, task_id: Optional[str] = None) -> bool:
-    saga = OptimizationSaga(project_id, url, task_id)
-    return await saga.execute()
+import asyncio
+from sqlalchemy import update, func, literal
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Tuple
+import httpx
+import orjson
+import re
+from enum import Enum
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.models import Project, Task, TaskStatus, HITLDecision, HITLStatus, SagaExecution
+from app.events.publishers import publish_event
+from services.management_service.ids import uuid7
+from services.management_service.saga_signals import SagaSignals
+
+
+class SagaState(str, Enum):
+    INITIATED = "initiated"
+    CRAWLING = "crawling"
+    CRAWL_COMPLETED = "crawl_completed"
+    CALCULATING_SCORES = "calculating_scores"
+    SCORES_COMPLETED = "scores_completed"
+    GENERATING_CONTENT = "generating_content"
+    CONTENT_GENERATED = "content_generated"
+    AWAITING_HITL = "awaiting_hitl"
+    HITL_APPROVED = "hitl_approved"
+    HITL_REJECTED = "hitl_rejected"
+    APPLYING_CHANGES = "applying_changes"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    COMPENSATING = "compensating"
+
+
+HITL_POLL_INTERVAL = 5
+CRAWL_RESULT_FIELDS = ("title", "description", "h1", "schema_org")
+TERMINAL_STATUSES = frozenset({"completed", "failed", "applied"})
+STATUS_PEEK_BYTES = 4096
+RETRY_MIN_WAIT = 4
+RETRY_MAX_WAIT = 10
+STATUS_RE = re.compile(rb'"status"\s*:\s*"([^"]*)"')
+HTTP_LIMITS = httpx.Limits(max_connections=500, max_keepalive_connections=200)
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client, _http_client_loop
+    
+    loop = asyncio.get_running_loop()
+    # Celery workers keep one loop per process, but callers such as
+    # asyncio.run() start a new one, and pooled connections cannot outlive
+    # the loop that opened them.
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=settings.SERVICE_REQUEST_TIMEOUT,
+            limits=HTTP_LIMITS
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client():
+    global _http_client, _http_client_loop
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
+def _peek_status(head: bytes) -> Optional[str]:
+    match = STATUS_RE.search(head)
+    if match is None:
+        return None
+    
+    # Only a top-level "status" key counts, not one nested in the payload.
+    prefix = head[:match.start()]
+    depth = prefix.count(b"{") + prefix.count(b"[") - prefix.count(b"}") - prefix.count(b"]")
+    if depth != 1:
+        return None
+    return match.group(1).decode("utf-8", "replace")
+
+
+def _add_and_refresh(db: Session, instance):
+    db.add(instance)
+    db.commit()
+    db.refresh(instance)
+
+
+class OptimizationSaga:
+    def __init__(self, project_id: str, url: str, task_id: Optional[str] = None):
+        self.project_id = project_id
+        self.url = url
+        self.task_id = task_id
+        self.saga_id = str(uuid7())
+        self.state = SagaState.INITIATED
+        self.context: Dict[str, Any] = {}
+        self.correlation_id = str(uuid7())
+        self._last_persisted_context: Optional[Dict[str, Any]] = None
+        self._signals: Optional[SagaSignals] = None
+        self._headers = {
+            "X-Internal-API-Key": settings.INTERNAL_API_KEY,
+            "X-Correlation-ID": self.correlation_id
+        }
+        
+    async def execute(self) -> bool:
+        from app.db.session import SessionLocal
+        
+        db = SessionLocal()
+        self.client = get_http_client()
+        
+        try:
+            await self._save_saga_state(db)
+            
+            await self._retry(self._run_crawl)
+            await self._wait_for_crawl_completion()
+            await self._save_saga_state(db)
+            
+            await self._retry(self._trigger_scores_calculation)
+            await self._wait_for_scores_completion()
+            # Only the crawl and scores steps are signalled; release the
+            # subscription before the long waits that follow.
+            await self._close_signals()
+            await self._save_saga_state(db)
+            
+            await self._retry(self._trigger_content_generation)
+            await self._wait_for_content_generation()
+            await self._save_saga_state(db)
+            
+            hitl_decision = await self._create_hitl_decision(db)
+            approved = await self._wait_for_hitl_decision(db, hitl_decision.id)
+            
+            if not approved:
+                self.state = SagaState.HITL_REJECTED
+                await self._update_task_status(db, TaskStatus.CANCELLED)
+                await self._publish_completion_event(success=False, reason="HITL rejected")
+                return False
+            
+            await self._retry(self._apply_changes)
+            await self._wait_for_changes_applied()
+            
+            self.state = SagaState.COMPLETED
+            await self._update_task_status(db, TaskStatus.COMPLETED)
+            await self._save_saga_state(db)
+            await self._publish_completion_event(success=True)
+            
+            return True
+            
+        except Exception as e:
+            logger.error(
+                f"Saga failed for project {self.project_id}, url {self.url}: {e}",
+                extra={"correlation_id": self.correlation_id, "saga_id": self.saga_id},
+                exc_info=True
+            )
+            self.state = SagaState.FAILED
+            await self._compensate()
+            await self._update_task_status(db, TaskStatus.FAILED)
+            await self._save_saga_state(db)
+            await self._publish_completion_event(success=False, reason=str(e))
+            return False
+        finally:
+            await self._close_signals()
+            db.close()
+    
+    async def _retry(self, operation):
+        for attempt in range(settings.SAGA_RETRY_MAX_ATTEMPTS):
+            try:
+                return await operation()
+            except httpx.HTTPError:
+                if attempt + 1 >= settings.SAGA_RETRY_MAX_ATTEMPTS:
+                    raise
+                await asyncio.sleep(min(RETRY_MAX_WAIT, max(RETRY_MIN_WAIT, 2 ** attempt)))
+    
+    async def _wait_for_signal(self, step: str, interval: float):
+        # Completion events for this saga wake the poll loop early; the
+        # interval is only the fallback when no event arrives.
+        if self._signals is None:
+            self._signals = SagaSignals(self.correlation_id)
+        await self._signals.wait(step, interval)
+    
+    async def _close_signals(self):
+        if self._signals is not None:
+            await self._signals.aclose()
+            self._signals = None
+    
+    async def _get_status(
+        self,
+        request: httpx.Request,
+        etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        if etag:
+            request.headers["If-None-Match"] = etag
+        
+        response = await self.client.send(request, stream=True)
+        try:
+            # 304 means the status body is unchanged since the last poll.
+            if response.status_code == 304:
+                return None, etag
+            
+            response.raise_for_status()
+            new_etag = response.headers.get("ETag")
+            
+            chunks = response.aiter_bytes()
+            head = b""
+            async for chunk in chunks:
+                head += chunk
+                if len(head) >= STATUS_PEEK_BYTES:
+                    break
+            
+            # While a step is still running only its status is needed, so the
+            # rest of a possibly large body is neither downloaded nor parsed.
+            status = _peek_status(head)
+            if status is not None and status not in TERMINAL_STATUSES:
+                return {"status": status}, new_etag
+            
+            body = head + b"".join([chunk async for chunk in chunks])
+            return orjson.loads(body), new_etag
+        finally:
+            await response.aclose()
+    
+    async def _run_crawl(self):
+        self.state = SagaState.CRAWLING
+        
+        response = await self.client.post(
+            f"{settings.AUDIT_SERVICE_URL}/internal/crawl",
+            json={
+                "project_id": self.project_id,
+                "urls": [self.url],
+                "options": {
+                    "js_render": True,
+                    "priority": "high"
+                }
+            },
+            headers=self._headers
+        )
+        response.raise_for_status()
+        
+        result = orjson.loads(response.content)
+        self.context["crawl_id"] = result["crawl_id"]
+        logger.info(
+            f"Crawl initiated: {self.context['crawl_id']}",
+            extra={"correlation_id": self.correlation_id, "saga_id": self.saga_id}
+        )
+    
+    async def _wait_for_crawl_completion(self):
+        timeout = datetime.utcnow() + timedelta(minutes=settings.SAGA_TIMEOUT_MINUTES)
+        
+        request = self.client.build_request(
+            "GET",
+            f"{settings.AUDIT_SERVICE_URL}/internal/crawl/{self.context['crawl_id']}",
+            headers=self._headers
+        )
+        etag = None
+        
+        while datetime.utcnow() < timeout:
+            crawl_data, etag = await self._get_status(request, etag)
+            status = crawl_data["status"] if crawl_data is not None else None
+            
+            if status == "completed":
+                self.state = SagaState.CRAWL_COMPLETED
+                self.context["crawl_result"] = {
+                    field: crawl_data.get(field) for field in CRAWL_RESULT_FIELDS
+                }
+                return
+            elif status == "failed":
+                raise Exception(f"Crawl failed: {self.context['crawl_id']}")
+            
+            await self._wait_for_signal("crawl", 5)
+        
+        raise TimeoutError("Crawl timeout")
+    
+    async def _trigger_scores_calculation(self):
+        self.state = SagaState.CALCULATING_SCORES
+        
+        payload = {
+            "project_id": self.project_id,
+            "url": self.url,
+            "crawl_id": self.context["crawl_id"]
+        }
+        
+        ffscore_response, eeat_response = await asyncio.gather(
+            self.client.post(
+                f"{settings.SEMANTIC_SERVICE_URL}/internal/ff-score/calculate",
+                json=payload,
+                headers=self._headers
+            ),
+            self.client.post(
+                f"{settings.SEMANTIC_SERVICE_URL}/internal/eeat-score/calculate",
+                json=payload,
+                headers=self._headers
+            )
+        )
+        ffscore_response.raise_for_status()
+        eeat_response.raise_for_status()
+        self.context["ffscore_task_id"] = orjson.loads(ffscore_response.content)["task_id"]
+        self.context["eeat_task_id"] = orjson.loads(eeat_response.content)["task_id"]
+    
+    async def _wait_for_scores_completion(self):
+        timeout = datetime.utcnow() + timedelta(minutes=settings.SAGA_TIMEOUT_MINUTES)
+        
+        pending = {
+            key: (
+                self.client.build_request(
+                    "GET",
+                    f"{settings.SEMANTIC_SERVICE_URL}/internal/{endpoint}/task/{self.context[task_key]}",
+                    headers=self._headers
+                ),
+                label
+            )
+            for key, endpoint, task_key, label in (
+                ("ffscore", "ff-score", "ffscore_task_id", "FF-Score"),
+                ("eeat_score", "eeat-score", "eeat_task_id", "E-E-A-T")
+            )
+        }
+        
+        while datetime.utcnow() < timeout:
+            polled = list(pending.items())
+            responses = await asyncio.gather(*(
+                self.client.send(request) for _, (request, _) in polled
+            ))
+            
+            for (key, (_, label)), response in zip(polled, responses):
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                
+                if data["status"] == "completed":
+                    self.context[key] = data["score"]
+                    del pending[key]
+                elif data["status"] == "failed":
+                    raise Exception(f"{label} calculation failed")
+            
+            if not pending:
+                self.state = SagaState.SCORES_COMPLETED
+                return
+            
+            await self._wait_for_signal("scores", 3)
+        
+        raise TimeoutError("Scores calculation timeout")
+    
+    async def _trigger_content_generation(self):
+        self.state = SagaState.GENERATING_CONTENT
+        
+        response = await self.client.post(
+            f"{settings.SEMANTIC_SERVICE_URL}/internal/content/generate",
+            json={
+                "project_id": self.project_id,
+                "url": self.url,
+                "crawl_id": self.context["crawl_id"],
+                "ffscore": self.context["ffscore"],
+                "eeat_score": self.context["eeat_score"]
+            },
+            headers=self._headers
+        )
+        response.raise_for_status()
+        
+        result = orjson.loads(response.content)
+        self.context["content_generation_id"] = result["generation_id"]
+    
+    async def _wait_for_content_generation(self):
+        timeout = datetime.utcnow() + timedelta(minutes=settings.SAGA_TIMEOUT_MINUTES)
+        
+        request = self.client.build_request(
+            "GET",
+            f"{settings.SEMANTIC_SERVICE_URL}/internal/content/generation/{self.context['content_generation_id']}",
+            headers=self._headers
+        )
+        etag = None
+        
+        while datetime.utcnow() < timeout:
+            status_data, etag = await self._get_status(request, etag)
+            status = status_data["status"] if status_data is not None else None
+            
+            if status == "completed":
+                self.state = SagaState.CONTENT_GENERATED
+                self.context["generated_content"] = status_data["content"]
+                return
+            elif status == "failed":
+                raise Exception("Content generation failed")
+            
+            await asyncio.sleep(3)
+        
+        raise TimeoutError("Content generation timeout")
+    
+    async def _create_hitl_decision(self, db: Session) -> HITLDecision:
+        self.state = SagaState.AWAITING_HITL
+        
+        crawl_data = self.context["crawl_result"]
+        old_content = {field: crawl_data.get(field) for field in CRAWL_RESULT_FIELDS}
+        
+        new_content = self.context["generated_content"]
+        
+        decision = HITLDecision(
+            project_id=self.project_id,
+            task_id=self.task_id,
+            url=self.url,
+            change_type="content_update",
+            old_content=old_content,
+            new_content=new_content,
+            status=HITLStatus.PENDING,
+            expires_at=datetime.utcnow() + timedelta(hours=settings.HITL_TIMEOUT_HOURS),
+            metadata={
+                "saga_id": self.saga_id,
+                "correlation_id": self.correlation_id,
+                "ffscore": self.context.get("ffscore"),
+                "eeat_score": self.context.get("eeat_score")
+            }
+        )
+        
+        await asyncio.to_thread(_add_and_refresh, db, decision)
+        
+        await publish_event(
+            exchange="seo.management",
+            routing_key="management.hitl.approval_required",
+            event_type="HITLApprovalRequired",
+            payload={
+                "decision_id": str(decision.id),
+                "project_id": self.project_id,
+                "url": self.url,
+                "expires_at": decision.expires_at.isoformat(),
+                "correlation_id": self.correlation_id
+            }
+        )
+        
+        return decision
+    
+    async def _wait_for_hitl_decision(self, db: Session, decision_id: str) -> bool:
+        timeout = datetime.utcnow() + timedelta(hours=settings.HITL_TIMEOUT_HOURS)
+        
+        while datetime.utcnow() < timeout:
+            decision_status = await asyncio.to_thread(
+                lambda: db.query(HITLDecision.status).filter(HITLDecision.id == decision_id).scalar()
+            )
+            
+            if decision_status == HITLStatus.APPROVED:
+                self.state = SagaState.HITL_APPROVED
+                return True
+            elif decision_status == HITLStatus.REJECTED:
+                self.state = SagaState.HITL_REJECTED
+                return False
+            
+            await asyncio.sleep(HITL_POLL_INTERVAL)
+        
+        raise TimeoutError("HITL decision timeout")
+    
+    async def _apply_changes(self):
+        self.state = SagaState.APPLYING_CHANGES
+        
+        response = await self.client.post(
+            f"{settings.CLIENT_GATEWAY_URL}/internal/changes/queue",
+            json={
+                "project_id": self.project_id,
+                "url": self.url,
+                "changes": self.context["generated_content"]
+            },
+            headers=self._headers
+        )
+        response.raise_for_status()
+        
+        result = orjson.loads(response.content)
+        self.context["change_id"] = result["change_id"]
+    
+    async def _wait_for_changes_applied(self):
+        timeout = datetime.utcnow() + timedelta(minutes=settings.SAGA_TIMEOUT_MINUTES)
+        
+        request = self.client.build_request(
+            "GET",
+            f"{settings.CLIENT_GATEWAY_URL}/internal/changes/{self.context['change_id']}/status",
+            headers=self._headers
+        )
+        etag = None
+        
+        while datetime.utcnow() < timeout:
+            status_data, etag = await self._get_status(request, etag)
+            status = status_data["status"] if status_data is not None else None
+            
+            if status == "applied":
+                return
+            elif status == "failed":
+                raise Exception("Changes application failed")
+            
+            await asyncio.sleep(5)
+        
+        raise TimeoutError("Changes application timeout")
+    
+    async def _compensate(self):
+        self.state = SagaState.COMPENSATING
+        logger.info(
+            f"Starting compensation for saga",
+            extra={
+                "correlation_id": self.correlation_id,
+                "saga_id": self.saga_id,
+                "project_id": self.project_id,
+                "url": self.url
+            }
+        )
+        
+        if "change_id" in self.context:
+            try:
+                await self.client.post(
+                    f"{settings.CLIENT_GATEWAY_URL}/internal/changes/{self.context['change_id']}/rollback",
+                    headers=self._headers
+                )
+            except Exception as e:
+                logger.error(f"Compensation rollback failed: {e}", extra={"correlation_id": self.correlation_id})
+    
+    async def _update_task_status(self, db: Session, status: TaskStatus):
+        if self.task_id:
+            await asyncio.to_thread(self._write_task_status, db, status)
+    
+    def _write_task_status(self, db: Session, status: TaskStatus):
+        db.execute(
+            update(Task)
+            .where(Task.id == self.task_id)
+            .values(status=status, updated_at=datetime.utcnow())
+        )
+        db.commit()
+    
+    async def _save_saga_state(self, db: Session):
+        await asyncio.to_thread(self._write_saga_state, db)
+    
+    def _write_saga_state(self, db: Session):
+        if self._last_persisted_context is None:
+            db.execute(
+                insert(SagaExecution)
+                .values(
+                    saga_id=self.saga_id,
+                    project_id=self.project_id,
+                    url=self.url,
+                    task_id=self.task_id,
+                    state=self.state,
+                    context=self.context,
+                    correlation_id=self.correlation_id
+                )
+                .on_conflict_do_nothing(index_elements=[SagaExecution.saga_id])
+            )
+        else:
+            values = {"state": self.state, "updated_at": datetime.utcnow()}
+            
+            # Only keys that changed since the last checkpoint are sent and
+            # merged into the stored context.
+            delta = {
+                key: value for key, value in self.context.items()
+                if self._last_persisted_context.get(key) != value
+            }
+            if delta:
+                values["context"] = func.coalesce(
+                    SagaExecution.context, literal({}, JSONB)
+                ).op("||")(literal(delta, JSONB))
+            
+            db.execute(
+                update(SagaExecution)
+                .where(SagaExecution.saga_id == self.saga_id)
+                .values(**values)
+            )
+        
+        db.commit()
+        self._last_persisted_context = dict(self.context)
+    
+    async def _publish_completion_event(self, success: bool, reason: Optional[str] = None):
+        event_type = "OptimizationCompleted" if success else "OptimizationFailed"
+        
+        await publish_event(
+            exchange="seo.management",
+            routing_key=f"management.optimization.{'completed' if success else 'failed'}",
+            event_type=event_type,
+            payload={
+                "saga_id": self.saga_id,
+                "project_id": self.project_id,
+                "url": self.url,
+                "task_id": self.task_id,
+                "success": success,
+                "reason": reason,
+                "ffscore": self.context.get("ffscore"),
+                "eeat_score": self.context.get("eeat_score"),
+                "correlation_id": self.correlation_id
+            }
+        )
+
+
+async def run_optimization_cycle(project_id: str, url: str, task_id: Optional[str] = None) -> bool:
+    saga = OptimizationSaga(project_id, url, task_id)
+    return await saga.execute()
@@ -1,275 +1,420 @@
-from typing import List, Dict, Any, Optional
-from enum import Enum
-from sqlalchemy.orm import Session
-
-from app.core.config import settings
-from app.core.logging import logger
-from app.db.models import Task, TaskType, TaskStatus
-
-
-class UrgencyLevel(str, Enum):
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
-
-
-class EffortLevel(int, Enum):
-    MINIMAL = 1
-    LOW = 2
-    MEDIUM = 3
-    HIGH = 4
-    VERY_HIGH = 5
-
-
-TASK_TYPE_EFFORT_MAP = {
-    TaskType.UPDATE_META_TAGS: EffortLevel.MINIMAL,
-    TaskType.UPDATE_SCHEMA_ORG: EffortLevel.LOW,
-    TaskType.UPDATE_H1: EffortLevel.MINIMAL,
-    TaskType.OPTIMIZE_IMAGES: EffortLevel.MEDIUM,
-    TaskType.FIX_BROKEN_LINKS: EffortLevel.LOW,
-    TaskType.IMPROVE_PAGE_SPEED: EffortLevel.HIGH,
-    TaskType.REWRITE_CONTENT: EffortLevel.VERY_HIGH,
-    TaskType.ADD_INTERNAL_LINKS: EffortLevel.LOW,
-    TaskType.UPDATE_CANONICAL: EffortLevel.MINIMAL,
-    TaskType.FIX_DUPLICATE_CONTENT: EffortLevel.MEDIUM,
-}
-
-
-def calculate_combined_score(
-    current_ffscore: Optional[float],
-    current_eeat: Optional[float],
-    ffscore_weight: float = 0.7,
-    eeat_weight: float = 0.3
-) -> float:
-    scores = []
-    weights = []
-    
-    if current_ffscore is not None:
-        scores.append(current_ffscore)
-        weights.append(ffscore_weight)
-    
-    if current_eeat is not None:
-        scores.append(current_eeat)
-        weights.append(eeat_weight)
-    
-    if not scores:
-        return 50.0
-    
-    total_weight = sum(weights)
-    weighted_sum = sum(s * w for s, w in zip(scores, weights))
-    
-    return weighted_sum / total_weight
-
-
-def calculate_impact(
-    current_ffscore: Optional[float],
-    expected_ffscore: Optional[float],
-    current_eeat: Optional[float] = None,
-    expected_eeat: Optional[float] = None
-) -> float:
-    current_combined = calculate_combined_score(current_ffscore, current_eeat)
-    expected_combined = calculate_combined_score(expected_ffscore, expected_eeat)
-    
-    improvement = expected_combined - current_combined
-    
-    normalized_impact = min(max(improvement / 100.0, 0.0), 1.0)
-    
-    return normalized_impact
-
-
-def calculate_urgency(
-    current_ffscore: Optional[float],
-    current_eeat: Optional[float] = None
-) -> float:
-    combined_score = calculate_combined_score(current_ffscore, current_eeat)
-    
-    if combined_score < 30:
-        return 1.0
-    elif combined_score < 50:
-        return 0.8
-    elif combined_score < 70:
-        return 0.6
-    elif combined_score < 85:
-        return 0.4
-    else:
-        return 0.2
-
-
-def get_urgency_level(
-    current_ffscore: Optional[float],
-    current_eeat: Optional[float] = None
-) -> UrgencyLevel:
-    combined_score = calculate_combined_score(current_ffscore, current_eeat)
-    
-    if combined_score < 30:
-        return UrgencyLevel.CRITICAL
-    elif combined_score < 50:
-        return UrgencyLevel.HIGH
-    elif combined_score < 70:
-        return UrgencyLevel.MEDIUM
-    else:
-        return UrgencyLevel.LOW
-
-
-def calculate_effort(task_type: TaskType, metadata: Dict[str, Any] = None) -> float:
-    effort_level = TASK_TYPE_EFFORT_MAP.get(task_type, EffortLevel.MEDIUM)
-    
-    if metadata and "custom_effort" in metadata:
-        effort_level = EffortLevel(metadata["custom_effort"])
-    
-    normalized_effort = effort_level.value / 5.0
-    
-    return normalized_effort
-
-
-def calculate_priority(
-    current_ffscore: Optional[float],
-    expected_ffscore: Optional[float],
-    task_type: TaskType,
-    current_eeat: Optional[float] = None,
-    expected_eeat: Optional[float] = None,
-    metadata: Dict[str, Any] = None
-) -> float:
-    impact = calculate_impact(current_ffscore, expected_ffscore, current_eeat, expected_eeat)
-    urgency = calculate_urgency(current_ffscore, current_eeat)
-    effort = calculate_effort(task_type, metadata)
-    
-    effort_inverse = 1.0 / effort if effort > 0 else 1.0
-    effort_normalized = min(effort_inverse / 5.0, 1.0)
-    
-    priority = (
-        impact * settings.TASK_PRIORITY_IMPACT_WEIGHT +
-        urgency * settings.TASK_PRIORITY_URGENCY_WEIGHT +
-        effort_normalized * settings.TASK_PRIORITY_EFFORT_WEIGHT
-    )
-    
-    return round(priority, 4)
-
-
-def calculate_task_priority(task: Task) -> float:
-    metadata = task.metadata or {}
-    
-    current_ffscore = metadata.get("current_ffscore")
-    expected_ffscore = metadata.get("expected_ffscore")
-    current_eeat = metadata.get("current_eeat")
-    expected_eeat = metadata.get("expected_eeat")
-    
-    priority = calculate_priority(
-        current_ffscore=current_ffscore,
-        expected_ffscore=expected_ffscore,
-        current_eeat=current_eeat,
-        expected_eeat=expected_eeat,
-        task_type=task.task_type,
-        metadata=metadata
-    )
-    
-    return priority
-
-
-def prioritize_tasks(tasks: List[Task]) -> List[Task]:
-    tasks_with_priority = []
-    
-    for task in tasks:
-        priority_score = calculate_task_priority(task)
-        
-        task.priority_score = priority_score
-        task.metadata = task.metadata or {}
-        task.metadata["priority_score"] = priority_score
-        task.metadata["impact"] = calculate_impact(
-            task.metadata.get("current_ffscore"),
-            task.metadata.get("expected_ffscore"),
-            task.metadata.get("current_eeat"),
-            task.metadata.get("expected_eeat")
-        )
-        task.metadata["urgency"] = calculate_urgency(
-            task.metadata.get("current_ffscore"),
-            task.metadata.get("current_eeat")
-        )
-        task.metadata["urgency_level"] = get_urgency_level(
-            task.metadata.get("current_ffscore"),
-            task.metadata.get("current_eeat")
-        )
-        task.metadata["effort"] = calculate_effort(task.task_type, task.metadata)
-        
-        tasks_with_priority.append(task)
-    
-    sorted_tasks = sorted(
-        tasks_with_priority,
-        key=lambda t: (t.priority_score, t.created_at),
-        reverse=True
-    )
-    
-    return sorted_tasks
-
-
-def prioritize_project_tasks(db: Session, project_id: str, limit: int = None) -> List[Task]:
-    query = db.query(Task).filter(
-        Task.project_id == project_id,
-        Task.status.in_([TaskStatus.PENDING, TaskStatus.QUEUED])
-    )
-    
-    tasks = query.all()
-    
-    if not tasks:
-        logger.info(f"No tasks to prioritize for project {project_id}")
-        return []
-    
-    prioritized_tasks = prioritize_tasks(tasks)
-    
-    for task in prioritized_tasks:
-        db.add(task)
-    
-    db.commit()
-    
-    logger.info(
-        f"Prioritized {len(prioritized_tasks)} tasks for project {project_id}",
-        extra={
-            "project_id": project_id,
-            "tasks_count": len(prioritized_tasks),
-            "top_priority": prioritized_tasks[0].priority_score if prioritized_tasks else None
-        }
-    )
-    
-    if limit:
-        return prioritized_tasks[:limit]
-    
-    return prioritized_tasks
-
-
-def get_next_task(db: Session, project_id: str) -> Optional[Task]:
-    task = db.query(Task).filter(
-        Task.project_id == project_id,
-        Task.status == TaskStatus.PENDING
-    ).order_by(
-        Task.priority_score.desc(),
-        Task.created_at.asc()
-    ).first()
-    
-    return task
-
-
-def should_auto_approve(task: Task) -> bool:
-    if not settings.HITL_AUTO_APPROVE_LOW_RISK:
-        return False
-    
-    metadata = task.metadata or {}
-    
-    low_risk_types = [
-        TaskType.UPDATE_META_TAGS,
-        TaskType.UPDATE_CANONICAL,
-        TaskType.ADD_INTERNAL_LINKS
-    ]
-    
-    if task.task_type not in low_risk_types:
-        return False
-    
-    impact = metadata.get("impact", 0)
-    if impact > 0.3:
-        return False
-    
-    effort = metadata.get("effort", 1)
-    if effort > 0.4:
-        return False
-    
-    return True
+from typing import List, Dict, Any, Optional
+from bisect import bisect_right
+from enum import Enum
+
+import numpy as np
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.db.models import Task, TaskType, TaskStatus
+from services.management_service._priority_numba import (
+    EEAT_WEIGHT,
+    FFSCORE_WEIGHT,
+    kernel as _priority_kernel
+)
+
+
+class UrgencyLevel(str, Enum):
+    CRITICAL = "critical"
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+
+class EffortLevel(int, Enum):
+    MINIMAL = 1
+    LOW = 2
+    MEDIUM = 3
+    HIGH = 4
+    VERY_HIGH = 5
+
+
+TASK_TYPE_EFFORT_MAP = {
+    TaskType.UPDATE_META_TAGS: EffortLevel.MINIMAL,
+    TaskType.UPDATE_SCHEMA_ORG: EffortLevel.LOW,
+    TaskType.UPDATE_H1: EffortLevel.MINIMAL,
+    TaskType.OPTIMIZE_IMAGES: EffortLevel.MEDIUM,
+    TaskType.FIX_BROKEN_LINKS: EffortLevel.LOW,
+    TaskType.IMPROVE_PAGE_SPEED: EffortLevel.HIGH,
+    TaskType.REWRITE_CONTENT: EffortLevel.VERY_HIGH,
+    TaskType.ADD_INTERNAL_LINKS: EffortLevel.LOW,
+    TaskType.UPDATE_CANONICAL: EffortLevel.MINIMAL,
+    TaskType.FIX_DUPLICATE_CONTENT: EffortLevel.MEDIUM,
+}
+
+_LOW_RISK_TYPES = frozenset({
+    TaskType.UPDATE_META_TAGS,
+    TaskType.UPDATE_CANONICAL,
+    TaskType.ADD_INTERNAL_LINKS,
+})
+
+_NORMALIZED_EFFORT = {
+    task_type: effort_level.value / 5.0 for task_type, effort_level in TASK_TYPE_EFFORT_MAP.items()
+}
+_DEFAULT_EFFORT_NORM = EffortLevel.MEDIUM.value / 5.0
+
+_TASK_TYPE_INDEX = {task_type: index for index, task_type in enumerate(TaskType)}
+
+# The last slot is the default level for types missing from the map
+_EFFORT_LUT = np.array(
+    [TASK_TYPE_EFFORT_MAP.get(task_type, EffortLevel.MEDIUM).value for task_type in TaskType]
+    + [EffortLevel.MEDIUM.value],
+    dtype=np.float64
+)
+
+_URGENCY_LEVELS = list(UrgencyLevel)
+
+# A threshold belongs to the next bucket (score < 30 -> 0, score == 30 -> 1),
+# hence bisect_right / searchsorted(side="right")
+_URGENCY_THRESHOLDS = (30.0, 50.0, 70.0, 85.0)
+_URGENCY_THRESHOLDS_ARRAY = np.array(_URGENCY_THRESHOLDS)
+_URGENCY_VALUES = (1.0, 0.8, 0.6, 0.4, 0.2)
+_URGENCY_VALUES_ARRAY = np.array(_URGENCY_VALUES)
+_URGENCY_BUCKET_LEVELS = (
+    UrgencyLevel.CRITICAL,
+    UrgencyLevel.HIGH,
+    UrgencyLevel.MEDIUM,
+    UrgencyLevel.LOW,
+    UrgencyLevel.LOW,
+)
+_URGENCY_BUCKET_LEVEL_INDEX = np.array([_URGENCY_LEVELS.index(level) for level in _URGENCY_BUCKET_LEVELS])
+
+_W_IMPACT = float(settings.TASK_PRIORITY_IMPACT_WEIGHT)
+_W_URGENCY = float(settings.TASK_PRIORITY_URGENCY_WEIGHT)
+_W_EFFORT = float(settings.TASK_PRIORITY_EFFORT_WEIGHT)
+
+_NAN = float("nan")
+
+# Integer scores 0..100 without E-E-A-T are the common case: impact comes
+# from a table built with the same formula as calculate_impact
+_IMPACT_LUT = tuple(
+    tuple(min(max((expected - current) / 100.0, 0.0), 1.0) for expected in range(101))
+    for current in range(101)
+)
+
+
+def refresh_weights():
+    global _W_IMPACT, _W_URGENCY, _W_EFFORT
+    
+    _W_IMPACT = float(settings.TASK_PRIORITY_IMPACT_WEIGHT)
+    _W_URGENCY = float(settings.TASK_PRIORITY_URGENCY_WEIGHT)
+    _W_EFFORT = float(settings.TASK_PRIORITY_EFFORT_WEIGHT)
+
+
+def calculate_combined_score(
+    current_ffscore: Optional[float],
+    current_eeat: Optional[float],
+    ffscore_weight: float = FFSCORE_WEIGHT,
+    eeat_weight: float = EEAT_WEIGHT
+) -> float:
+    if current_ffscore is None:
+        return 50.0 if current_eeat is None else float(current_eeat)
+    
+    if current_eeat is None:
+        return float(current_ffscore)
+    
+    return (
+        (current_ffscore * ffscore_weight + current_eeat * eeat_weight) /
+        (ffscore_weight + eeat_weight)
+    )
+
+
+def calculate_impact(
+    current_ffscore: Optional[float],
+    expected_ffscore: Optional[float],
+    current_eeat: Optional[float] = None,
+    expected_eeat: Optional[float] = None
+) -> float:
+    if (
+        current_eeat is None and expected_eeat is None
+        and type(current_ffscore) is int and type(expected_ffscore) is int
+        and 0 <= current_ffscore <= 100 and 0 <= expected_ffscore <= 100
+    ):
+        return _IMPACT_LUT[current_ffscore][expected_ffscore]
+    
+    current_combined = calculate_combined_score(current_ffscore, current_eeat)
+    expected_combined = calculate_combined_score(expected_ffscore, expected_eeat)
+    
+    improvement = expected_combined - current_combined
+    
+    normalized_impact = min(max(improvement / 100.0, 0.0), 1.0)
+    
+    return normalized_impact
+
+
+def calculate_urgency(
+    current_ffscore: Optional[float],
+    current_eeat: Optional[float] = None
+) -> float:
+    combined_score = calculate_combined_score(current_ffscore, current_eeat)
+    
+    return _URGENCY_VALUES[bisect_right(_URGENCY_THRESHOLDS, combined_score)]
+
+
+def get_urgency_level(
+    current_ffscore: Optional[float],
+    current_eeat: Optional[float] = None
+) -> UrgencyLevel:
+    combined_score = calculate_combined_score(current_ffscore, current_eeat)
+    
+    return _URGENCY_BUCKET_LEVELS[bisect_right(_URGENCY_THRESHOLDS, combined_score)]
+
+
+def calculate_effort(task_type: TaskType, metadata: Dict[str, Any] = None) -> float:
+    if metadata and "custom_effort" in metadata:
+        return EffortLevel(metadata["custom_effort"]).value / 5.0
+    
+    return _NORMALIZED_EFFORT.get(task_type, _DEFAULT_EFFORT_NORM)
+
+
+def _compute_all(
+    current_ffscore: Optional[float],
+    expected_ffscore: Optional[float],
+    current_eeat: Optional[float],
+    expected_eeat: Optional[float],
+    task_type: TaskType,
+    metadata: Dict[str, Any] = None
+):
+    effort = calculate_effort(task_type, metadata)
+    
+    priority, impact, urgency, urgency_index, effort = _priority_kernel(
+        _NAN if current_ffscore is None else float(current_ffscore),
+        _NAN if expected_ffscore is None else float(expected_ffscore),
+        _NAN if current_eeat is None else float(current_eeat),
+        _NAN if expected_eeat is None else float(expected_eeat),
+        effort,
+        _W_IMPACT,
+        _W_URGENCY,
+        _W_EFFORT
+    )
+    urgency_level = _URGENCY_LEVELS[urgency_index]
+    
+    return round(priority, 4), impact, urgency, urgency_level, effort
+
+
+def calculate_priority(
+    current_ffscore: Optional[float],
+    expected_ffscore: Optional[float],
+    task_type: TaskType,
+    current_eeat: Optional[float] = None,
+    expected_eeat: Optional[float] = None,
+    metadata: Dict[str, Any] = None
+) -> float:
+    return _compute_all(
+        current_ffscore, expected_ffscore, current_eeat, expected_eeat, task_type, metadata
+    )[0]
+
+
+def calculate_task_priority(task: Task) -> float:
+    metadata = task.metadata or {}
+    
+    return _compute_all(
+        metadata.get("current_ffscore"),
+        metadata.get("expected_ffscore"),
+        metadata.get("current_eeat"),
+        metadata.get("expected_eeat"),
+        task.task_type,
+        metadata
+    )[0]
+
+
+def _combined_scores(
+    ffscore: np.ndarray,
+    eeat: np.ndarray,
+    ffscore_weight: float = FFSCORE_WEIGHT,
+    eeat_weight: float = EEAT_WEIGHT
+) -> np.ndarray:
+    ffscore_missing = np.isnan(ffscore)
+    eeat_missing = np.isnan(eeat)
+    
+    both = (ffscore * ffscore_weight + eeat * eeat_weight) / (ffscore_weight + eeat_weight)
+    
+    return np.where(
+        ffscore_missing,
+        np.where(eeat_missing, 50.0, eeat),
+        np.where(eeat_missing, ffscore, both)
+    )
+
+
+def _score_arrays(
+    ff_c: np.ndarray,
+    ff_e: np.ndarray,
+    ee_c: np.ndarray,
+    ee_e: np.ndarray,
+    effort: np.ndarray,
+    impact_weight: float,
+    urgency_weight: float,
+    effort_weight: float
+):
+    combined_c = _combined_scores(ff_c, ee_c)
+    combined_e = _combined_scores(ff_e, ee_e)
+    
+    impact = np.clip((combined_e - combined_c) / 100.0, 0.0, 1.0)
+    
+    urgency_buckets = np.searchsorted(_URGENCY_THRESHOLDS_ARRAY, combined_c, side="right")
+    urgency = _URGENCY_VALUES_ARRAY[urgency_buckets]
+    urgency_levels = _URGENCY_BUCKET_LEVEL_INDEX[urgency_buckets]
+    
+    effort_normalized = np.minimum((1.0 / effort) / 5.0, 1.0)
+    
+    priority = (
+        impact * impact_weight +
+        urgency * urgency_weight +
+        effort_normalized * effort_weight
+    )
+    
+    return priority, impact, urgency, urgency_levels
+
+
+def prioritize_tasks(tasks: List[Task]) -> List[Task]:
+    n = len(tasks)
+    if n == 0:
+        return []
+    
+    # Single pass over the tasks: metadata and its get are read once per task
+    metadatas = []
+    scores = []
+    type_ids = np.empty(n, dtype=np.int8)
+    custom_efforts = []
+    type_index = _TASK_TYPE_INDEX
+    for index, task in enumerate(tasks):
+        metadata = task.metadata or {}
+        task.metadata = metadata
+        metadatas.append(metadata)
+        
+        get = metadata.get
+        scores.append((
+            get("current_ffscore"),
+            get("expected_ffscore"),
+            get("current_eeat"),
+            get("expected_eeat")
+        ))
+        type_ids[index] = type_index.get(task.task_type, -1)
+        
+        if "custom_effort" in metadata:
+            custom_efforts.append((index, metadata["custom_effort"]))
+    
+    # None becomes NaN when cast to float64
+    ff_c, ff_e, ee_c, ee_e = np.array(scores, dtype=np.float64).T
+    
+    effort_levels = _EFFORT_LUT[type_ids]
+    for index, custom_effort in custom_efforts:
+        effort_levels[index] = EffortLevel(custom_effort).value
+    effort = effort_levels / 5.0
+    
+    priority, impact, urgency, urgency_levels = _score_arrays(
+        ff_c, ff_e, ee_c, ee_e, effort, _W_IMPACT, _W_URGENCY, _W_EFFORT
+    )
+    priority = np.round(priority, 4)
+    
+    for task, metadata, p, i, u, level, e in zip(
+        tasks, metadatas, priority.tolist(), impact.tolist(), urgency.tolist(),
+        urgency_levels.tolist(), effort.tolist()
+    ):
+        task.priority_score = p
+        metadata["priority_score"] = p
+        metadata["impact"] = i
+        metadata["urgency"] = u
+        metadata["urgency_level"] = _URGENCY_LEVELS[level]
+        metadata["effort"] = e
+    
+    # The sort is stable, so equal priorities keep their input order;
+    # prioritize_project_tasks already reads tasks ordered by created_at
+    order = np.argsort(-priority, kind="stable")
+    
+    return [tasks[index] for index in order.tolist()]
+
+
+class ScoredTask:
+    
+    __slots__ = (
+        "id",
+        "task_type",
+        "created_at",
+        "metadata",
+        "priority_score"
+    )
+    
+    def __init__(self, id, task_type: TaskType, created_at, metadata: Optional[Dict[str, Any]]):
+        self.id = id
+        self.task_type = task_type
+        self.created_at = created_at
+        self.metadata = metadata
+        self.priority_score = None
+
+
+def prioritize_project_tasks(db: Session, project_id: str, limit: int = None) -> List[ScoredTask]:
+    # Only the columns the score needs, streamed in batches of 1000 through
+    # a server-side cursor: no ORM entities or identity map per task
+    query = db.query(Task.id, Task.task_type, Task.created_at, Task.metadata).filter(
+        Task.project_id == project_id,
+        Task.status.in_([TaskStatus.PENDING, TaskStatus.QUEUED])
+    ).order_by(Task.created_at.asc()).execution_options(stream_results=True).yield_per(1000)
+    
+    tasks = [ScoredTask(*row) for row in query]
+    
+    if not tasks:
+        logger.info(f"No tasks to prioritize for project {project_id}")
+        return []
+    
+    prioritized_tasks = prioritize_tasks(tasks)
+    
+    table = Task.__table__
+    stmt = update(table).where(table.c.id == bindparam("b_id")).values(
+        priority_score=bindparam("b_p"),
+        metadata=bindparam("b_m")
+    )
+    db.execute(stmt, [
+        {"b_id": task.id, "b_p": task.priority_score, "b_m": task.metadata}
+        for task in prioritized_tasks
+    ])
+    
+    db.commit()
+    
+    logger.info(
+        f"Prioritized {len(prioritized_tasks)} tasks for project {project_id}",
+        extra={
+            "project_id": project_id,
+            "tasks_count": len(prioritized_tasks),
+            "top_priority": prioritized_tasks[0].priority_score if prioritized_tasks else None
+        }
+    )
+    
+    if limit:
+        return prioritized_tasks[:limit]
+    
+    return prioritized_tasks
+
+
+def get_next_task(db: Session, project_id: str) -> Optional[Task]:
+    task = db.query(Task).filter(
+        Task.project_id == project_id,
+        Task.status == TaskStatus.PENDING
+    ).order_by(
+        Task.priority_score.desc(),
+        Task.created_at.asc()
+    ).first()
+    
+    return task
+
+
+def should_auto_approve(task: Task) -> bool:
+    if not settings.HITL_AUTO_APPROVE_LOW_RISK:
+        return False
+    
+    if task.task_type not in _LOW_RISK_TYPES:
+        return False
+    
+    metadata = task.metadata or {}
+    
+    impact = metadata.get("impact", 0)
+    if impact > 0.3:
+        return False
+    
+    effort = metadata.get("effort", 1)
+    if effort > 0.4:
+        return False
+    
+    return True
\ No newline at end of file
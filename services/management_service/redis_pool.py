@@ -0,0 +1,44 @@
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from services.management_service.config import settings
+
+POOL = aioredis.ConnectionPool.from_url(
+    str(settings.REDIS_URL),
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    decode_responses=False,
+    socket_keepalive=True,
+    socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS
+)
+
+_client: Optional[aioredis.Redis] = None
+_sync_client: Optional[redis.Redis] = None
+
+
+def get_redis_client() -> aioredis.Redis:
+    global _client
+    
+    if _client is None:
+        _client = aioredis.Redis(connection_pool=POOL)
+    return _client
+
+
+def get_sync_redis_client() -> redis.Redis:
+    global _sync_client
+    
+    if _sync_client is None:
+        _sync_client = redis.Redis.from_url(
+            str(settings.REDIS_URL),
+            socket_keepalive=True,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS
+        )
+    return _sync_client
+
+
+async def close_redis_pool():
+    global _client
+    
+    _client = None
+    await POOL.disconnect()
@@ -0,0 +1,78 @@
+import asyncio
+from typing import Optional
+
+import orjson
+import redis.asyncio as redis
+from redis import RedisError
+
+from services.management_service.redis_pool import get_redis_client, get_sync_redis_client
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CHANNEL_PREFIX = "saga:signal:"
+
+
+def _channel(correlation_id: str) -> str:
+    return f"{CHANNEL_PREFIX}{correlation_id}"
+
+
+def publish_saga_signal(correlation_id: Optional[str], step: str) -> bool:
+    # Event consumers run in the API leader process while sagas run in Celery
+    # workers, so the signal goes through Redis pub/sub rather than memory.
+    if not correlation_id:
+        return False
+    
+    try:
+        receivers = get_sync_redis_client().publish(
+            _channel(correlation_id),
+            orjson.dumps({"step": step})
+        )
+    except RedisError as e:
+        logger.warning(f"Failed to publish saga signal {step} for {correlation_id}: {e}")
+        return False
+    return receivers > 0
+
+
+class SagaSignals:
+    
+    def __init__(self, correlation_id: str, client: Optional[redis.Redis] = None):
+        self._channel = _channel(correlation_id)
+        self._client = client
+        self._pubsub = None
+        self._disabled = False
+    
+    async def _subscribe(self):
+        self._pubsub = (self._client or get_redis_client()).pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self._channel)
+    
+    async def wait(self, step: str, timeout: float) -> bool:
+        # The subscription stays open for the whole saga, so a signal sent
+        # while a status request is in flight is still seen by the next wait.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        
+        if not self._disabled:
+            try:
+                if self._pubsub is None:
+                    await self._subscribe()
+                
+                while (remaining := deadline - loop.time()) > 0:
+                    message = await self._pubsub.get_message(timeout=remaining)
+                    if message is not None and orjson.loads(message["data"]).get("step") == step:
+                        return True
+                return False
+            except RedisError as e:
+                logger.warning(f"Saga signals unavailable, polling only: {e}")
+                self._disabled = True
+        
+        await asyncio.sleep(max(deadline - loop.time(), 0))
+        return False
+    
+    async def aclose(self):
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except RedisError:
+                pass
+            self._pubsub = None
@@ -7,7 +7,7 @@ from services.management_service.schemas.task import (
     TaskStatusUpdate,
     TaskMetadata
 )
-
+
 from services.management_service.schemas.hitl import (
     HITLApprovalBase,
     HITLApprovalCreate,
@@ -19,16 +19,16 @@ from services.management_service.schemas.hitl import (
     HITLDiffData,
     HITLBatchApproveItemResult
 )
-
-__all__ = [
-    "TaskBase",
-    "TaskCreate",
-    "TaskUpdate",
-    "TaskResponse",
+
+__all__ = [
+    "TaskBase",
+    "TaskCreate",
+    "TaskUpdate",
+    "TaskResponse",
     "TaskListResponse",
     "TaskStatusUpdate",
     "TaskMetadata",
-    "HITLApprovalBase",
+    "HITLApprovalBase",
     "HITLApprovalCreate",
     "HITLApprovalResponse",
     "HITLDecision",
@@ -1,7 +1,8 @@
 from typing import Optional, Dict, Any, List, TypedDict
 from datetime import datetime
+from uuid import UUID
 
-from pydantic import BaseModel, Field, UUID4
+from pydantic import BaseModel, ConfigDict, Field
 
 from services.management_service.db.models import HITLStatus
 
@@ -12,15 +13,14 @@ class HITLDiffData(TypedDict, total=False):
 
 
 class HITLApprovalBase(BaseModel):
-    task_id: UUID4
-    project_id: Optional[UUID4] = None
+    task_id: UUID
+    project_id: Optional[UUID] = None
     diff_data: HITLDiffData
     impact_score: Optional[float] = Field(None, ge=0.0, le=1.0)
     recommendation: Optional[str] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class HITLApprovalCreate(HITLApprovalBase):
@@ -28,9 +28,9 @@ class HITLApprovalCreate(HITLApprovalBase):
 
 
 class HITLApprovalResponse(BaseModel):
-    id: UUID4
-    task_id: UUID4
-    project_id: UUID4
+    id: UUID
+    task_id: UUID
+    project_id: UUID
     status: HITLStatus
     diff_data: HITLDiffData
     impact_score: Optional[float]
@@ -44,9 +44,7 @@ class HITLApprovalResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 class HITLDecision(BaseModel):
@@ -58,22 +56,21 @@ class HITLDecision(BaseModel):
 class HITLApprovalListResponse(BaseModel):
     approvals: List[HITLApprovalResponse]
     total: int
-    page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class HITLBatchApproveRequest(BaseModel):
-    task_ids: List[UUID4]
+    task_ids: List[UUID]
     approved_by: str
     auto_deploy: bool = True
     correlation_id: Optional[str] = None
 
 
 class HITLBatchApproveItemResult(BaseModel):
-    task_id: UUID4
+    task_id: UUID
     success: bool
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
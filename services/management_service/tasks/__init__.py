@@ -4,6 +4,7 @@ from services.management_service.tasks.orchestration_tasks import (
     run_optimization_cycle_task,
     reprioritize_project_tasks,
     reprioritize_all_projects,
+    summarize_reprioritization,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "run_optimization_cycle_task",
     "reprioritize_project_tasks",
     "reprioritize_all_projects",
-]
+    "summarize_reprioritization",
+]
@@ -1,11 +1,23 @@
-﻿from celery import Celery
+﻿from functools import lru_cache
+
+import orjson
+from celery import Celery
 from celery.schedules import crontab
+from kombu.serialization import register
 
 from services.management_service.config import settings
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+register(
+    "orjson",
+    orjson.dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 celery_app = Celery(
     "management_service",
     broker=settings.CELERY_BROKER_URL,
@@ -13,7 +25,8 @@ celery_app = Celery(
 )
 
 
-def _cron_from_expr(expr: str):
+@lru_cache(maxsize=32)
+def _cron_from_expr(expr: str) -> crontab:
     try:
         minute, hour, day_of_month, month_of_year, day_of_week = expr.split()
     except ValueError:
@@ -33,9 +46,10 @@ def _cron_from_expr(expr: str):
 
 
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    # json stays in accept_content for messages already sitting in the queue
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
@@ -50,4 +64,4 @@ celery_app.conf.beat_schedule = {
     }
 }
 
-celery_app.autodiscover_tasks(["services.management_service.tasks"])
+celery_app.autodiscover_tasks(["services.management_service.tasks"])
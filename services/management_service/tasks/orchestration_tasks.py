@@ -1,11 +1,16 @@
 ﻿import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import uvloop
+from celery import chord
+from celery.signals import worker_process_shutdown
+from sqlalchemy import select
 
 from services.management_service.config import settings
 from services.management_service.db.session import SessionLocal
 from services.management_service.db.models import Project
-from services.management_service.orchestrator import run_optimization_cycle
+from services.management_service.orchestrator import close_http_client, run_optimization_cycle
 from services.management_service.prioritizer import prioritize_project_tasks
 from config.logging_config import get_logger
 
@@ -14,8 +19,31 @@ from services.management_service.tasks.celery_app import celery_app
 logger = get_logger(__name__)
 
 
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
 def _run_async(coro):
-    return asyncio.run(coro)
+    # One loop per worker process, so the loop-bound HTTP client, Redis
+    # pool and DNS cache outlive individual tasks
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = uvloop.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP.run_until_complete(coro)
+
+
+@worker_process_shutdown.connect
+def _close_loop(**kwargs):
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        return
+
+    try:
+        _LOOP.run_until_complete(close_http_client())
+        _LOOP.run_until_complete(_LOOP.shutdown_asyncgens())
+    finally:
+        _LOOP.close()
+        _LOOP = None
 
 
 @celery_app.task(
@@ -89,10 +117,54 @@ def reprioritize_project_tasks(
             "correlation_id": correlation_id,
             "completed_at": datetime.now(timezone.utc).isoformat(),
         }
+    except Exception as exc:
+        logger.error(
+            "Failed to reprioritize project",
+            extra={"project_id": project_id, "error": str(exc)},
+        )
+        return {
+            "status": "error",
+            "project_id": project_id,
+            "error": str(exc),
+            "correlation_id": correlation_id,
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+        }
     finally:
         db.close()
 
 
+@celery_app.task(
+    name="services.management_service.tasks.orchestration_tasks.summarize_reprioritization"
+)
+def summarize_reprioritization(
+    results: List[Dict[str, Any]],
+    correlation_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    projects = []
+    for result in results:
+        if result.get("status") == "error":
+            projects.append(
+                {
+                    "project_id": result["project_id"],
+                    "error": result["error"],
+                }
+            )
+        else:
+            projects.append(
+                {
+                    "project_id": result["project_id"],
+                    "tasks_prioritized": result["tasks_prioritized"],
+                }
+            )
+
+    return {
+        "status": "completed",
+        "projects": projects,
+        "correlation_id": correlation_id,
+        "completed_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
 @celery_app.task(
     name="services.management_service.tasks.orchestration_tasks.reprioritize_all_projects"
 )
@@ -101,34 +173,25 @@ def reprioritize_all_projects(
 ) -> Dict[str, Any]:
     db = SessionLocal()
     try:
-        projects = db.query(Project).filter(Project.is_active.is_(True)).all()
-        results = []
-        for project in projects:
-            try:
-                tasks = prioritize_project_tasks(db, str(project.id))
-                results.append(
-                    {
-                        "project_id": str(project.id),
-                        "tasks_prioritized": len(tasks),
-                    }
-                )
-            except Exception as exc:
-                logger.error(
-                    "Failed to reprioritize project",
-                    extra={"project_id": str(project.id), "error": str(exc)},
-                )
-                results.append(
-                    {
-                        "project_id": str(project.id),
-                        "error": str(exc),
-                    }
-                )
-
-        return {
-            "status": "completed",
-            "projects": results,
-            "correlation_id": correlation_id,
-            "completed_at": datetime.now(timezone.utc).isoformat(),
-        }
+        project_ids = db.execute(
+            select(Project.id).where(Project.is_active.is_(True))
+        ).scalars().all()
     finally:
-        db.close()
+        db.close()
+
+    if not project_ids:
+        return summarize_reprioritization([], correlation_id=correlation_id)
+
+    # One subtask per project, each with its own session, so a slow project
+    # does not hold up the rest; the chord callback collects the totals
+    result = chord(
+        reprioritize_project_tasks.s(str(project_id), correlation_id=correlation_id)
+        for project_id in project_ids
+    )(summarize_reprioritization.s(correlation_id=correlation_id))
+
+    return {
+        "status": "dispatched",
+        "projects_count": len(project_ids),
+        "result_id": result.id,
+        "correlation_id": correlation_id,
+    }
@@ -2,6 +2,7 @@
 from typing import Any, Dict
 
 import httpx
+from sqlalchemy import select
 
 from services.management_service.config import settings
 from services.management_service.db.session import SessionLocal
@@ -27,8 +28,16 @@ def daily_ff_score_recalculation() -> Dict[str, Any]:
         return {"status": "skipped", "reason": "internal_api_key_missing"}
 
     db = SessionLocal()
+    client = httpx.Client(
+        timeout=settings.SERVICE_REQUEST_TIMEOUT,
+        headers={"X-Internal-API-Key": settings.INTERNAL_API_KEY},
+    )
     try:
-        projects = db.query(Project).filter(Project.is_active.is_(True)).all()
+        projects = db.execute(
+            select(Project.id, Project.metadata, Project.domain).where(
+                Project.is_active.is_(True)
+            )
+        ).all()
         total = len(projects)
         succeeded = 0
         failed = 0
@@ -50,16 +59,12 @@ def daily_ff_score_recalculation() -> Dict[str, Any]:
 
             correlation_id = f"ffscore-recalc-{project.id}"
             try:
-                with httpx.Client(timeout=settings.SERVICE_REQUEST_TIMEOUT) as client:
-                    response = client.post(
-                        f"{settings.SEMANTIC_SERVICE_URL}{ffscore_endpoint}",
-                        json=payload,
-                        headers={
-                            "X-Internal-API-Key": settings.INTERNAL_API_KEY,
-                            "X-Correlation-ID": correlation_id,
-                        },
-                    )
-                    response.raise_for_status()
+                response = client.post(
+                    f"{settings.SEMANTIC_SERVICE_URL}{ffscore_endpoint}",
+                    json=payload,
+                    headers={"X-Correlation-ID": correlation_id},
+                )
+                response.raise_for_status()
                 succeeded += 1
             except Exception as exc:
                 failed += 1
@@ -78,4 +83,5 @@ def daily_ff_score_recalculation() -> Dict[str, Any]:
             "completed_at": datetime.now(timezone.utc).isoformat(),
         }
     finally:
-        db.close()
+        client.close()
+        db.close()
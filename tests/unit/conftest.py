@@ -0,0 +1,106 @@
+import importlib
+import os
+import sys
+import types
+import enum
+
+import pytest
+
+
+def _stub_module(name):
+    # setdefault: if an app.* module is already in sys.modules, the stubs
+    # extend it instead of replacing it
+    return sys.modules.setdefault(name, types.ModuleType(name))
+
+
+def _str_enum(name, members):
+    return enum.Enum(name, [(member, member) for member in members.split()], type=str)
+
+
+_TASK_STATUS = _str_enum("TaskStatus", "PENDING QUEUED COMPLETED CANCELLED FAILED")
+_HITL_STATUS = _str_enum("HITLStatus", "PENDING APPROVED REJECTED")
+
+_TASK_TYPE = _str_enum(
+    "TaskType",
+    "UPDATE_META_TAGS UPDATE_SCHEMA_ORG UPDATE_H1 OPTIMIZE_IMAGES FIX_BROKEN_LINKS "
+    "IMPROVE_PAGE_SPEED REWRITE_CONTENT ADD_INTERNAL_LINKS UPDATE_CANONICAL FIX_DUPLICATE_CONTENT"
+)
+
+
+def _install_app_stubs():
+    # One app.* tree for both modules: settings and models carry everything
+    # orchestrator and prioritizer need, whatever the import order
+    _stub_module("app")
+    _stub_module("app.core")
+    config = _stub_module("app.core.config")
+    logging_mod = _stub_module("app.core.logging")
+    _stub_module("app.events")
+    publishers = _stub_module("app.events.publishers")
+    _stub_module("app.db")
+    models = _stub_module("app.db.models")
+
+    class Settings:
+        SERVICE_REQUEST_TIMEOUT = 5
+        INTERNAL_API_KEY = "test-key"
+        AUDIT_SERVICE_URL = "http://audit"
+        SEMANTIC_SERVICE_URL = "http://semantic"
+        CLIENT_GATEWAY_URL = "http://client"
+        HITL_TIMEOUT_HOURS = 1
+        SAGA_TIMEOUT_MINUTES = 1
+        SAGA_RETRY_MAX_ATTEMPTS = 1
+        TASK_PRIORITY_IMPACT_WEIGHT = 0.6
+        TASK_PRIORITY_URGENCY_WEIGHT = 0.3
+        TASK_PRIORITY_EFFORT_WEIGHT = 0.1
+        HITL_AUTO_APPROVE_LOW_RISK = True
+
+    class DummyLogger:
+        def info(self, *args, **kwargs):
+            pass
+        def error(self, *args, **kwargs):
+            pass
+
+    class HITLDecision:
+        def __init__(self, **kwargs):
+            self.id = os.urandom(16).hex()
+            vars(self).update(kwargs)
+
+    class SagaExecution:
+        def __init__(self, **kwargs):
+            vars(self).update(kwargs)
+
+    class Task:
+        pass
+
+    class Project:
+        pass
+
+    async def publish_event(*args, **kwargs):
+        return None
+
+    config.settings = Settings()
+    logging_mod.logger = DummyLogger()
+
+    models.Project = Project
+    models.Task = Task
+    models.TaskType = _TASK_TYPE
+    models.TaskStatus = _TASK_STATUS
+    models.HITLDecision = HITLDecision
+    models.HITLStatus = _HITL_STATUS
+    models.SagaExecution = SagaExecution
+
+    publishers.publish_event = publish_event
+
+
+@pytest.fixture(scope="session")
+def app_stubs():
+    _install_app_stubs()
+
+
+@pytest.fixture(scope="session")
+def orchestrator(app_stubs):
+    return importlib.import_module("services.management_service.orchestrator")
+
+
+@pytest.fixture(scope="session")
+def prioritizer(app_stubs):
+    return importlib.import_module("services.management_service.prioritizer")
@@ -1,144 +1,292 @@
 ﻿import uuid
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
 
-from services.management_service.db.models import Task, TaskType, TaskStatus, HITLApproval, HITLStatus
+from services.management_service.db.models import Project, Task, TaskType, TaskStatus, HITLApproval, HITLStatus
 from services.management_service.schemas.hitl import HITLApprovalCreate, HITLDecision
 from services.management_service import hitl_handler as hitl_module
 
 
-class QueryStub:
-    def __init__(self, result=None):
-        self._result = result
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(element, compiler, **kwargs):
+    return "JSON"
 
-    def filter(self, *args, **kwargs):
-        return self
 
-    def order_by(self, *args, **kwargs):
-        return self
-
-    def offset(self, *args, **kwargs):
-        return self
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'hitl.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    # Tables only: the partial and NULLS LAST indexes are PostgreSQL-only.
+    with engine.begin() as connection:
+        for table in (Project.__table__, Task.__table__, HITLApproval.__table__):
+            connection.execute(CreateTable(table))
+    yield sessionmaker(engine)
+    engine.dispose()
+
+
+def _seed_task(session_factory, approval_status=None):
+    with session_factory() as session:
+        project = Project(name="p", domain="example.com", settings={}, metadata={})
+        session.add(project)
+        session.flush()
+        task = Task(
+            project_id=project.id,
+            task_type=TaskType.UPDATE_META,
+            status=TaskStatus.PENDING,
+            url="https://example.com",
+            metadata={},
+        )
+        session.add(task)
+        session.flush()
+        if approval_status is not None:
+            session.add(HITLApproval(
+                task_id=task.id,
+                project_id=project.id,
+                status=approval_status,
+                diff_data={"before": {}, "after": {}},
+                metadata={},
+            ))
+        session.commit()
+        return task.id
+
+
+def _statuses(session_factory, task_id):
+    with session_factory() as session:
+        task_status = session.query(Task.status).filter(Task.id == task_id).scalar()
+        approval_status = session.query(HITLApproval.status).filter(HITLApproval.task_id == task_id).scalar()
+    return task_status, approval_status
+
+
+def test_create_hitl_approval_creates_record(session_factory):
+    task_id = _seed_task(session_factory)
+
+    with session_factory() as session:
+        handler = hitl_module.HITLHandler(session)
+        approval = handler.create_hitl_approval(
+            task_id=task_id,
+            approval_data=HITLApprovalCreate(
+                task_id=task_id,
+                diff_data={"before": {}, "after": {}},
+                impact_score=0.7,
+            ),
+            correlation_id="corr-1",
+        )
+        assert approval.status == HITLStatus.PENDING
+        assert approval.task_id == task_id
+        assert approval.impact_score == 0.7
+
+    assert _statuses(session_factory, task_id) == (TaskStatus.PENDING, HITLStatus.PENDING)
+
+
+def test_create_hitl_approval_conflict_keeps_existing_record(session_factory):
+    task_id = _seed_task(session_factory, HITLStatus.APPROVED)
+
+    with session_factory() as session:
+        handler = hitl_module.HITLHandler(session)
+        with pytest.raises(ValueError, match="already exists"):
+            handler.create_hitl_approval(
+                task_id=task_id,
+                approval_data=HITLApprovalCreate(
+                    task_id=task_id,
+                    diff_data={"before": {}, "after": {}},
+                    impact_score=0.7,
+                ),
+            )
+
+    with session_factory() as session:
+        assert session.query(HITLApproval.status, HITLApproval.impact_score).all() == [
+            (HITLStatus.APPROVED, None)
+        ]
 
-    def limit(self, *args, **kwargs):
-        return self
 
-    def first(self):
-        return self._result
+@pytest.mark.asyncio
+async def test_approve_task_without_autodeploy(session_factory, monkeypatch):
+    task_id = _seed_task(session_factory, HITLStatus.PENDING)
 
+    async def fake_deploy(*args, **kwargs):
+        raise AssertionError("deploy_task_changes should not be called")
 
-class DbStub:
-    def __init__(self, task=None, approval=None):
-        self._task = task
-        self._approval = approval
-        self.added = []
-        self.committed = False
-        self.refreshed = []
+    async def fake_publish(*args, **kwargs):
+        return None
 
-    def query(self, model):
-        if model is Task:
-            return QueryStub(self._task)
-        if model is HITLApproval:
-            return QueryStub(self._approval)
-        return QueryStub(None)
+    monkeypatch.setattr(hitl_module, "deploy_task_changes", fake_deploy)
+    monkeypatch.setattr(hitl_module, "publish_hitl_approved_event", fake_publish)
 
-    def add(self, obj):
-        self.added.append(obj)
+    with session_factory() as session:
+        handler = hitl_module.HITLHandler(session)
+        result = await handler.approve_task(
+            task_id=task_id,
+            approved_by="user-1",
+            decision=HITLDecision(auto_deploy=False),
+            correlation_id="corr-2",
+        )
 
-    def commit(self):
-        self.committed = True
+    assert result["status"] == "approved"
+    assert result["task_id"] == str(task_id)
+    assert _statuses(session_factory, task_id) == (TaskStatus.APPROVED, HITLStatus.APPROVED)
 
-    def refresh(self, obj):
-        self.refreshed.append(obj)
 
+def test_reject_task_sets_status(session_factory):
+    task_id = _seed_task(session_factory, HITLStatus.PENDING)
 
-def _make_task():
-    return Task(
-        id=uuid.uuid4(),
-        project_id=uuid.uuid4(),
-        task_type=TaskType.UPDATE_META,
-        status=TaskStatus.PENDING,
-        url="https://example.com",
-        metadata={},
-    )
+    with session_factory() as session:
+        handler = hitl_module.HITLHandler(session)
+        result = handler.reject_task(
+            task_id=task_id,
+            rejected_by="user-2",
+            decision=HITLDecision(rejection_reason="not ok"),
+            correlation_id="corr-3",
+        )
 
+    assert result["status"] == "rejected"
+    assert result["rejection_reason"] == "not ok"
+    assert _statuses(session_factory, task_id) == (TaskStatus.REJECTED, HITLStatus.REJECTED)
+    with session_factory() as session:
+        stored = session.query(HITLApproval.rejected_by, HITLApproval.rejection_reason).one()
+    assert tuple(stored) == ("user-2", "not ok")
 
-def test_create_hitl_approval_creates_record():
-    task = _make_task()
-    db = DbStub(task=task, approval=None)
-    handler = hitl_module.HITLHandler(db)
 
-    approval_data = HITLApprovalCreate(
-        task_id=task.id,
-        diff_data={"before": {}, "after": {}},
-        impact_score=0.7,
-    )
+def test_approve_task_sync_updates_without_deploy_or_publish(session_factory, monkeypatch):
+    task_id = _seed_task(session_factory, HITLStatus.PENDING)
 
-    approval = handler.create_hitl_approval(
-        task_id=str(task.id),
-        approval_data=approval_data,
-        correlation_id="corr-1",
-    )
+    async def fail(*args, **kwargs):
+        raise AssertionError("sync approval must not deploy or publish")
 
-    assert approval.status == HITLStatus.PENDING
-    assert db.committed is True
-    assert task.status == TaskStatus.PENDING
+    monkeypatch.setattr(hitl_module, "deploy_task_changes", fail)
+    monkeypatch.setattr(hitl_module, "publish_hitl_approved_event", fail)
 
+    with session_factory() as session:
+        handler = hitl_module.HITLHandler(session)
+        result = handler.approve_task_sync(
+            task_id=task_id,
+            approved_by="user-3",
+            decision=HITLDecision(auto_deploy=False),
+        )
 
-@pytest.mark.asyncio
-async def test_approve_task_without_autodeploy(monkeypatch):
-    task = _make_task()
-    approval = HITLApproval(
-        task_id=task.id,
-        project_id=task.project_id,
-        status=HITLStatus.PENDING,
-        diff_data={"before": {}, "after": {}},
-    )
-    db = DbStub(task=task, approval=approval)
-    handler = hitl_module.HITLHandler(db)
+    assert result["status"] == "approved"
+    assert result["deployment_result"] is None
+    assert _statuses(session_factory, task_id) == (TaskStatus.APPROVED, HITLStatus.APPROVED)
 
-    async def fake_deploy(*args, **kwargs):
-        raise AssertionError("deploy_task_changes should not be called")
 
-    async def fake_publish(*args, **kwargs):
-        return None
+def test_approve_task_sync_leaves_processed_approval_alone(session_factory):
+    task_id = _seed_task(session_factory, HITLStatus.REJECTED)
 
-    monkeypatch.setattr(hitl_module, "deploy_task_changes", fake_deploy)
-    monkeypatch.setattr(hitl_module, "publish_hitl_approved_event", fake_publish)
+    with session_factory() as session:
+        handler = hitl_module.HITLHandler(session)
+        with pytest.raises(ValueError, match="already processed"):
+            handler.approve_task_sync(
+                task_id=task_id,
+                approved_by="user-3",
+                decision=HITLDecision(auto_deploy=False),
+            )
 
-    decision = HITLDecision(auto_deploy=False)
-    result = await handler.approve_task(
-        task_id=str(task.id),
-        approved_by="user-1",
-        decision=decision,
-        correlation_id="corr-2",
-    )
-
-    assert result["status"] == "approved"
-    assert task.status == TaskStatus.APPROVED
-    assert approval.status == HITLStatus.APPROVED
+    assert _statuses(session_factory, task_id) == (TaskStatus.PENDING, HITLStatus.REJECTED)
 
 
-def test_reject_task_sets_status(monkeypatch):
-    task = _make_task()
-    approval = HITLApproval(
-        task_id=task.id,
-        project_id=task.project_id,
-        status=HITLStatus.PENDING,
-        diff_data={"before": {}, "after": {}},
-    )
-    db = DbStub(task=task, approval=approval)
-    handler = hitl_module.HITLHandler(db)
-
-    decision = HITLDecision(rejection_reason="not ok")
-    result = handler.reject_task(
-        task_id=str(task.id),
-        rejected_by="user-2",
-        decision=decision,
-        correlation_id="corr-3",
-    )
+@pytest.mark.asyncio
+async def test_batch_approve_uses_a_session_per_task(session_factory, monkeypatch):
+    with session_factory() as session:
+        project = Project(name="p", domain="example.com", settings={}, metadata={})
+        session.add(project)
+        session.flush()
+        task_ids = []
+        for i in range(3):
+            task = Task(
+                project_id=project.id,
+                task_type=TaskType.UPDATE_META,
+                status=TaskStatus.PENDING,
+                url=f"https://example.com/{i}",
+                metadata={},
+            )
+            session.add(task)
+            session.flush()
+            session.add(HITLApproval(
+                task_id=task.id,
+                project_id=project.id,
+                status=HITLStatus.PENDING,
+                diff_data={},
+                metadata={},
+            ))
+            task_ids.append(task.id)
+        session.commit()
+
+    opened = []
+
+    def factory():
+        session = session_factory()
+        opened.append(session)
+        return session
+
+    async def fake_publish_batch(*args, **kwargs):
+        return None
 
-    assert result["status"] == "rejected"
-    assert task.status == TaskStatus.REJECTED
-    assert approval.status == HITLStatus.REJECTED
+    monkeypatch.setattr(hitl_module, "publish_hitl_approved_events_batch", fake_publish_batch)
+
+    with session_factory() as session:
+        handler = hitl_module.HITLHandler(session, session_factory=factory)
+        response = await handler.batch_approve_tasks(task_ids, approved_by="user-4", auto_deploy=False)
+
+    assert response.approved == 3
+    assert response.failed == 0
+    assert len(opened) == 3
+
+    with session_factory() as session:
+        assert session.query(HITLApproval.status).distinct().all() == [(HITLStatus.APPROVED,)]
+        assert session.query(Task.status).distinct().all() == [(TaskStatus.APPROVED,)]
+
+
+def test_pending_approvals_cursor_walks_ties_and_null_scores(session_factory):
+    project_id = uuid.uuid4()
+    base = datetime(2024, 1, 1)
+    # (impact_score, created_at offset): equal scores, equal timestamps and
+    # NULL scores, so every branch of the keyset filter is crossed.
+    rows = [(0.9, 0), (0.5, 1), (0.5, 1), (0.5, 2), (None, 0), (None, 3), (0.2, 5)]
+
+    with session_factory() as session:
+        for score, offset in rows:
+            session.add(HITLApproval(
+                task_id=uuid.uuid4(),
+                project_id=project_id,
+                status=HITLStatus.PENDING,
+                diff_data={},
+                impact_score=score,
+                metadata={},
+                created_at=base + timedelta(minutes=offset),
+            ))
+        session.commit()
+
+        expected = [
+            approval.id for approval in sorted(
+                session.query(HITLApproval).all(),
+                key=lambda a: (a.impact_score is None, -(a.impact_score or 0), a.created_at, a.id.hex)
+            )
+        ]
+
+        handler = hitl_module.HITLHandler(session)
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = handler.get_pending_approvals(project_id=project_id, limit=2, after=cursor)
+            seen.extend(approval.id for approval in page)
+            if cursor is None:
+                break
+            assert isinstance(cursor, str)
+
+    assert seen == expected
+
+
+def test_pending_approvals_rejects_malformed_cursor(session_factory):
+    with session_factory() as session:
+        handler = hitl_module.HITLHandler(session)
+
+        with pytest.raises(ValueError):
+            handler.get_pending_approvals(after="not-a-cursor")
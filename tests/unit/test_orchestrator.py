@@ -1,127 +1,32 @@
-﻿import importlib
-import sys
-import types
-import enum
-import uuid
+﻿import asyncio
 
 import pytest
 
 
-def _install_orchestrator_stubs():
-    if "app" in sys.modules:
-        return
-
-    app = types.ModuleType("app")
-    core = types.ModuleType("app.core")
-    config = types.ModuleType("app.core.config")
-    logging_mod = types.ModuleType("app.core.logging")
-    events = types.ModuleType("app.events")
-    publishers = types.ModuleType("app.events.publishers")
-    db = types.ModuleType("app.db")
-    models = types.ModuleType("app.db.models")
-
-    class Settings:
-        SERVICE_REQUEST_TIMEOUT = 5
-        INTERNAL_API_KEY = "test-key"
-        AUDIT_SERVICE_URL = "http://audit"
-        SEMANTIC_SERVICE_URL = "http://semantic"
-        CLIENT_GATEWAY_URL = "http://client"
-        HITL_TIMEOUT_HOURS = 1
-        SAGA_TIMEOUT_MINUTES = 1
-        SAGA_RETRY_MAX_ATTEMPTS = 1
-
-    class DummyLogger:
-        def info(self, *args, **kwargs):
-            pass
-        def error(self, *args, **kwargs):
-            pass
-
-    class TaskStatus(enum.Enum):
-        PENDING = "PENDING"
-        COMPLETED = "COMPLETED"
-        CANCELLED = "CANCELLED"
-        FAILED = "FAILED"
-
-    class HITLStatus(enum.Enum):
-        PENDING = "PENDING"
-        APPROVED = "APPROVED"
-        REJECTED = "REJECTED"
-
-    class HITLDecision:
-        def __init__(self, **kwargs):
-            self.id = str(uuid.uuid4())
-            for key, value in kwargs.items():
-                setattr(self, key, value)
-
-    class SagaExecution:
-        def __init__(self, **kwargs):
-            for key, value in kwargs.items():
-                setattr(self, key, value)
-
-    class Task:
-        pass
-
-    class Project:
-        pass
-
-    async def publish_event(*args, **kwargs):
-        return None
-
-    config.settings = Settings()
-    logging_mod.logger = DummyLogger()
-
-    models.Project = Project
-    models.Task = Task
-    models.TaskStatus = TaskStatus
-    models.HITLDecision = HITLDecision
-    models.HITLStatus = HITLStatus
-    models.SagaExecution = SagaExecution
-
-    publishers.publish_event = publish_event
-
-    sys.modules["app"] = app
-    sys.modules["app.core"] = core
-    sys.modules["app.core.config"] = config
-    sys.modules["app.core.logging"] = logging_mod
-    sys.modules["app.events"] = events
-    sys.modules["app.events.publishers"] = publishers
-    sys.modules["app.db"] = db
-    sys.modules["app.db.models"] = models
-
-
-def _import_orchestrator():
-    _install_orchestrator_stubs()
-    if "services.management_service.orchestrator" in sys.modules:
-        return importlib.reload(sys.modules["services.management_service.orchestrator"])
-    return importlib.import_module("services.management_service.orchestrator")
+# publish_event is patched on the orchestrator module
+pytestmark = pytest.mark.thread_unsafe
 
 
 class DbStub:
+    __slots__ = ("committed", "last_added")
+
     def __init__(self):
-        self.added = []
         self.committed = False
-        self.refreshed = []
+        self.last_added = None
 
     def add(self, obj):
-        self.added.append(obj)
+        self.last_added = obj
 
     def commit(self):
         self.committed = True
 
     def refresh(self, obj):
-        self.refreshed.append(obj)
+        pass
 
 
 @pytest.mark.asyncio
-async def test_create_hitl_decision_builds_event(monkeypatch):
-    orchestrator = _import_orchestrator()
-
-    events = []
-
-    async def fake_publish_event(**kwargs):
-        events.append(kwargs)
-
-    monkeypatch.setattr(orchestrator, "publish_event", fake_publish_event)
+async def test_create_hitl_decision_builds_event(orchestrator, mocker):
+    publish_event = mocker.patch.object(orchestrator, "publish_event")
 
     saga = orchestrator.OptimizationSaga(
         project_id="proj-1",
@@ -152,6 +57,68 @@ async def test_create_hitl_decision_builds_event(monkeypatch):
     assert decision.old_content["title"] == "Old Title"
     assert decision.new_content["title"] == "New Title"
     assert db.committed is True
-    assert events
-    assert events[0]["event_type"] == "HITLApprovalRequired"
-    assert events[0]["routing_key"] == "management.hitl.approval_required"
+    publish_event.assert_awaited_once()
+    event = publish_event.await_args.kwargs
+    assert event["event_type"] == "HITLApprovalRequired"
+    assert event["routing_key"] == "management.hitl.approval_required"
+
+
+class FakeRedis:
+    # One pub/sub bus behind both clients: the publisher in the API process
+    # and the saga's subscriber in a worker.
+    def __init__(self):
+        self.queues = {}
+
+    def publish(self, channel, data):
+        for queue in self.queues.get(channel, []):
+            queue.put_nowait({"type": "message", "channel": channel, "data": data})
+        return len(self.queues.get(channel, []))
+
+    def pubsub(self, **kwargs):
+        return FakePubSub(self)
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self._redis = redis
+        self._queue = asyncio.Queue()
+        self._channels = []
+
+    async def subscribe(self, channel):
+        self._redis.queues.setdefault(channel, []).append(self._queue)
+        self._channels.append(channel)
+
+    async def get_message(self, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        for channel in self._channels:
+            self._redis.queues[channel].remove(self._queue)
+        self._channels = []
+
+
+@pytest.mark.asyncio
+async def test_wait_for_signal_wakes_on_published_signal(orchestrator, mocker):
+    from services.management_service import saga_signals
+
+    redis = FakeRedis()
+    mocker.patch.object(saga_signals, "get_redis_client", return_value=redis)
+    mocker.patch.object(saga_signals, "get_sync_redis_client", return_value=redis)
+
+    saga = orchestrator.OptimizationSaga(project_id="proj-1", url="https://example.com")
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.05, saga_signals.publish_saga_signal, saga.correlation_id, "scores")
+    loop.call_later(0.1, saga_signals.publish_saga_signal, saga.correlation_id, "crawl")
+
+    started = loop.time()
+    await saga._wait_for_signal("crawl", 5)
+
+    assert 0.08 < loop.time() - started < 1
+
+    await saga._close_signals()
+    assert saga._signals is None
+    assert not any(redis.queues.values())
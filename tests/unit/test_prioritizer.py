@@ -1,74 +1,17 @@
-﻿import importlib
-import sys
-import types
-import enum
+﻿import random
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
+from sqlalchemy import (
+    JSON, Column, DateTime, Enum, Float, Integer, MetaData, String, Table, create_engine, event, select
+)
+from sqlalchemy.orm import Session
 
 
-def _install_prioritizer_stubs():
-    if "app" in sys.modules:
-        return
-
-    app = types.ModuleType("app")
-    core = types.ModuleType("app.core")
-    config = types.ModuleType("app.core.config")
-    logging_mod = types.ModuleType("app.core.logging")
-    db = types.ModuleType("app.db")
-    models = types.ModuleType("app.db.models")
-
-    class Settings:
-        TASK_PRIORITY_IMPACT_WEIGHT = 0.6
-        TASK_PRIORITY_URGENCY_WEIGHT = 0.3
-        TASK_PRIORITY_EFFORT_WEIGHT = 0.1
-        HITL_AUTO_APPROVE_LOW_RISK = True
-
-    class DummyLogger:
-        def info(self, *args, **kwargs):
-            pass
-        def error(self, *args, **kwargs):
-            pass
-
-    class TaskType(enum.Enum):
-        UPDATE_META_TAGS = "UPDATE_META_TAGS"
-        UPDATE_SCHEMA_ORG = "UPDATE_SCHEMA_ORG"
-        UPDATE_H1 = "UPDATE_H1"
-        OPTIMIZE_IMAGES = "OPTIMIZE_IMAGES"
-        FIX_BROKEN_LINKS = "FIX_BROKEN_LINKS"
-        IMPROVE_PAGE_SPEED = "IMPROVE_PAGE_SPEED"
-        REWRITE_CONTENT = "REWRITE_CONTENT"
-        ADD_INTERNAL_LINKS = "ADD_INTERNAL_LINKS"
-        UPDATE_CANONICAL = "UPDATE_CANONICAL"
-        FIX_DUPLICATE_CONTENT = "FIX_DUPLICATE_CONTENT"
-
-    class TaskStatus(enum.Enum):
-        PENDING = "PENDING"
-        QUEUED = "QUEUED"
-
-    class Task:
-        pass
-
-    config.settings = Settings()
-    logging_mod.logger = DummyLogger()
-
-    models.TaskType = TaskType
-    models.TaskStatus = TaskStatus
-    models.Task = Task
-
-    sys.modules["app"] = app
-    sys.modules["app.core"] = core
-    sys.modules["app.core.config"] = config
-    sys.modules["app.core.logging"] = logging_mod
-    sys.modules["app.db"] = db
-    sys.modules["app.db.models"] = models
-
-
-def _import_prioritizer():
-    _install_prioritizer_stubs()
-    if "services.management_service.prioritizer" in sys.modules:
-        return importlib.reload(sys.modules["services.management_service.prioritizer"])
-    return importlib.import_module("services.management_service.prioritizer")
+pytestmark = pytest.mark.thread_safe
+
+NOW = datetime(2024, 1, 1)
 
 
 class DummyTask:
@@ -79,14 +22,12 @@ class DummyTask:
         self.priority_score = 0.0
 
 
-def test_calculate_impact():
-    prioritizer = _import_prioritizer()
+def test_calculate_impact(prioritizer):
     impact = prioritizer.calculate_impact(40, 70)
-    assert impact == pytest.approx(0.3, rel=1e-3)
+    assert round(impact * 1000) == 300
 
 
-def test_calculate_priority_bounds():
-    prioritizer = _import_prioritizer()
+def test_calculate_priority_bounds(prioritizer):
     pr = prioritizer.calculate_priority(
         current_ffscore=40,
         expected_ffscore=70,
@@ -95,30 +36,131 @@ def test_calculate_priority_bounds():
     assert 0.0 <= pr <= 1.0
 
 
-def test_should_auto_approve_true_for_low_risk():
-    prioritizer = _import_prioritizer()
+def test_should_auto_approve_true_for_low_risk(prioritizer):
     task = DummyTask(
         prioritizer.TaskType.UPDATE_META_TAGS,
         {"impact": 0.2, "effort": 0.3},
-        datetime.utcnow(),
+        NOW,
     )
     assert prioritizer.should_auto_approve(task) is True
 
 
-def test_prioritize_tasks_sorts_by_priority():
-    prioritizer = _import_prioritizer()
-    now = datetime.utcnow()
-
+def test_prioritize_tasks_sorts_by_priority(prioritizer):
     task_high = DummyTask(
         prioritizer.TaskType.UPDATE_META_TAGS,
         {"current_ffscore": 30, "expected_ffscore": 80},
-        now - timedelta(minutes=5),
+        NOW - timedelta(minutes=5),
     )
     task_low = DummyTask(
         prioritizer.TaskType.UPDATE_META_TAGS,
         {"current_ffscore": 70, "expected_ffscore": 75},
-        now,
+        NOW,
     )
 
     ordered = prioritizer.prioritize_tasks([task_low, task_high])
-    assert ordered[0] is task_high
+    assert ordered[0] is task_high
+
+
+def test_prioritize_tasks_matches_calculate_priority(prioritizer):
+    rng = random.Random(42)
+    task_types = list(prioritizer.TaskType)
+
+    def score():
+        return rng.choice([None, rng.randint(0, 100), rng.uniform(0, 100)])
+
+    tasks = []
+    for _ in range(500):
+        metadata = {
+            "current_ffscore": score(),
+            "expected_ffscore": score(),
+        }
+        if rng.random() < 0.3:
+            metadata["current_eeat"] = score()
+            metadata["expected_eeat"] = score()
+        if rng.random() < 0.2:
+            metadata["custom_effort"] = rng.randint(1, 5)
+        tasks.append(DummyTask(rng.choice(task_types), metadata, NOW))
+
+    expected = {
+        id(task): prioritizer.calculate_priority(
+            current_ffscore=task.metadata["current_ffscore"],
+            expected_ffscore=task.metadata["expected_ffscore"],
+            task_type=task.task_type,
+            current_eeat=task.metadata.get("current_eeat"),
+            expected_eeat=task.metadata.get("expected_eeat"),
+            metadata=dict(task.metadata),
+        )
+        for task in tasks
+    }
+
+    ordered = prioritizer.prioritize_tasks(tasks)
+
+    assert len(ordered) == len(tasks)
+    for task in ordered:
+        assert task.priority_score == pytest.approx(expected[id(task)], abs=1e-9)
+        assert task.metadata["priority_score"] == task.priority_score
+    scores = [task.priority_score for task in ordered]
+    assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.thread_unsafe
+def test_prioritize_project_tasks_updates_rows_in_one_executemany(prioritizer, monkeypatch):
+    metadata = MetaData()
+    table = Table(
+        "tasks",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("project_id", String),
+        Column("task_type", Enum(prioritizer.TaskType)),
+        Column("status", Enum(prioritizer.TaskStatus)),
+        Column("created_at", DateTime),
+        Column("priority_score", Float),
+        Column("metadata", JSON),
+    )
+    monkeypatch.setattr(prioritizer, "Task", SimpleNamespace(__table__=table, **table.c))
+
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    rows = [
+        {
+            "id": index,
+            "project_id": "p1",
+            "task_type": prioritizer.TaskType.UPDATE_META_TAGS,
+            "status": prioritizer.TaskStatus.PENDING,
+            "created_at": NOW + timedelta(minutes=index),
+            "priority_score": 0.0,
+            "metadata": {"current_ffscore": 20 + index * 10, "expected_ffscore": 90},
+        }
+        for index in range(5)
+    ]
+    rows.append(dict(rows[0], id=5, status=prioritizer.TaskStatus.COMPLETED))
+    rows.append(dict(rows[0], id=6, project_id="p2"))
+    with engine.begin() as conn:
+        conn.execute(table.insert(), rows)
+
+    updates = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record_updates(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            updates.append((executemany, len(parameters) if executemany else 1))
+
+    with Session(engine) as db:
+        result = prioritizer.prioritize_project_tasks(db, "p1")
+
+    assert updates == [(True, 5)]
+    assert all(isinstance(task, prioritizer.ScoredTask) for task in result)
+    assert [task.id for task in result] == [0, 1, 2, 3, 4]
+
+    with engine.connect() as conn:
+        stored = {
+            row.id: row
+            for row in conn.execute(select(table.c.id, table.c.priority_score, table.c.metadata))
+        }
+    for task in result:
+        assert stored[task.id].priority_score == task.priority_score
+        assert stored[task.id].metadata["priority_score"] == task.priority_score
+        assert stored[task.id].metadata["urgency_level"] == task.metadata["urgency_level"]
+    assert stored[5].priority_score == 0.0
+    assert stored[6].priority_score == 0.0
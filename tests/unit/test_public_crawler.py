@@ -1,19 +1,56 @@
 import httpx
 import pytest
-import respx
+import pytest_asyncio
 
+from services.audit_service.crawler import public_crawler
 from services.audit_service.crawler.public_crawler import crawl_public
 
 
-@pytest.mark.asyncio
-async def test_public_crawler_limits_pages():
-    with respx.mock:
-        respx.get("https://example.com/").respond(200, text='<html><head><title>Home</title><meta name="description" content="d"></head><body><h1>H</h1><a href="/a">A</a><a href="/b">B</a></body></html>')
-        respx.head("https://example.com/a").respond(200)
-        respx.head("https://example.com/b").respond(200)
-        respx.get("https://example.com/a").respond(200, text='<html><head><title>A</title></head><body><h1>A</h1></body></html>')
-        respx.get("https://example.com/b").respond(200, text='<html><head><title>B</title></head><body><h1>B</h1></body></html>')
+# Session-wide event loop and AsyncClient
+pytestmark = pytest.mark.thread_unsafe
 
-        r = await crawl_public("https://example.com/", max_pages=2, js_render=False, timeout_s=5.0)
-        assert r["summary"]["coverage"]["processed"] == 2
-        assert len(r["pages"]) == 2
\ No newline at end of file
+HOME_BYTES = b'<html><head><title>Home</title><meta name="description" content="d"></head><body><h1>H</h1><a href="/a">A</a><a href="/b">B</a></body></html>'
+A_BYTES = b'<html><head><title>A</title></head><body><h1>A</h1></body></html>'
+B_BYTES = b'<html><head><title>B</title></head><body><h1>B</h1></body></html>'
+HTML_HEADERS = {"content-type": "text/html; charset=utf-8"}
+
+ROUTES = {
+    ("GET", "https://example.com/"): (200, HOME_BYTES),
+    ("GET", "https://example.com/a"): (200, A_BYTES),
+    ("GET", "https://example.com/b"): (200, B_BYTES),
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    status, body = ROUTES[(request.method, str(request.url))]
+    return httpx.Response(status, content=body, headers=HTML_HEADERS)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as c:
+        yield c
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_public_crawler_limits_pages(client):
+    r = await crawl_public("https://example.com/", max_pages=2, js_render=False, timeout_s=5.0, client=client)
+    assert r["summary"]["coverage"]["processed"] == 2
+    assert len(r["pages"]) == 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_public_crawler_opens_its_own_client(monkeypatch):
+    opened = []
+    async_client = httpx.AsyncClient
+
+    def mock_async_client(**kwargs):
+        opened.append(kwargs)
+        return async_client(transport=httpx.MockTransport(_handler), **kwargs)
+
+    monkeypatch.setattr(public_crawler.httpx, "AsyncClient", mock_async_client)
+
+    r = await crawl_public("https://example.com/", max_pages=3, js_render=False, timeout_s=5.0)
+    assert opened == [{"follow_redirects": True, "timeout": 5.0}]
+    assert r["summary"]["coverage"]["processed"] == 3
+    assert len(r["pages"]) == 3